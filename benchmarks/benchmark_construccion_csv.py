@@ -0,0 +1,184 @@
+"""
+Benchmark de la construcción de clientes a partir de un CSV.
+Compara la lectura con csv.DictReader (un diccionario por fila) contra la
+lectura posicional de LectorCSV.filas() con ConstructorClientes, que es la
+que usa GestorClientes al importar.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/benchmark_construccion_csv.py [--filas N] [--repeticiones N]
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.cliente import Cliente  # noqa: E402
+from modulos.cliente_corporativo import ClienteCorporativo  # noqa: E402
+from modulos.cliente_premium import ClientePremium  # noqa: E402
+from modulos.cliente_regular import ClienteRegular  # noqa: E402
+from modulos.formato_csv import (  # noqa: E402
+    ENCABEZADOS_CSV,
+    ConstructorClientes,
+    LectorCSV,
+)
+from modulos.validaciones import (  # noqa: E402
+    VALIDO,
+    calcular_digito_verificador,
+    normalizar_ruts,
+    validar_rut,
+)
+
+# Filas que se construyen juntas, como en la importación por bloques
+TAMANO_BLOQUE = 1000
+
+
+def generar_csv(ruta, cantidad, semilla=5):
+    """Escribe un CSV con la misma cantidad de clientes de cada tipo."""
+    aleatorio = random.Random(semilla)
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(ENCABEZADOS_CSV)
+        for i in range(cantidad):
+            base = [f"Cliente {i}", f"c{i}@ejemplo.cl", "+56912345678", "Calle 1"]
+            if i % 3 == 0:
+                escritor.writerow(["Regular", *base, i % 5000, "", ""])
+            elif i % 3 == 1:
+                escritor.writerow(["Premium", *base, 15, "2024-01-15", ""])
+            else:
+                numero = aleatorio.randint(1000000, 99999999)
+                rut = f"{numero}-{calcular_digito_verificador(numero)}"
+                escritor.writerow(["Corporativo", *base, "Empresa", rut, "Juan"])
+
+
+def _cliente_desde_diccionario(fila, validar, rut_verificado):
+    """Construye un cliente desde una fila de csv.DictReader."""
+    tipo = fila.get("tipo", "").strip()
+    datos = [
+        fila.get("nombre", "").strip(),
+        fila.get("email", "").strip(),
+        fila.get("telefono", "").strip(),
+        sys.intern(fila.get("direccion", "").strip()),
+    ]
+    if tipo == ClienteRegular.TIPO:
+        clase = ClienteRegular
+        datos.append(int(fila.get("campo_extra1", 0) or 0))
+    elif tipo == ClientePremium.TIPO:
+        clase = ClientePremium
+        fecha = fila.get("campo_extra2", None)
+        if fecha:
+            fecha = sys.intern(fecha)
+        datos += [float(fila.get("campo_extra1", 10) or 10), fecha]
+    elif tipo == ClienteCorporativo.TIPO:
+        clase = ClienteCorporativo
+        datos += [
+            sys.intern(fila.get("campo_extra1", "").strip()),
+            fila.get("campo_extra2", "").strip(),
+            sys.intern(fila.get("campo_extra3", "").strip()),
+        ]
+    else:
+        clase = Cliente
+
+    if not validar:
+        return clase.desde_datos_confiables(*datos)
+    if rut_verificado is not None:
+        if rut_verificado[1] != VALIDO:
+            validar_rut(datos[5])
+        return clase(*datos, verificar_rut=False)
+    return clase(*datos)
+
+
+def construir_con_diccionarios(filas, validar):
+    """Construye un bloque de filas de csv.DictReader, igual que el gestor."""
+    corporativas = [
+        indice
+        for indice, fila in enumerate(filas)
+        if fila["tipo"] == ClienteCorporativo.TIPO
+    ]
+    ruts = [filas[indice]["campo_extra2"].strip() for indice in corporativas]
+    if validar:
+        verificados = dict(zip(corporativas, zip(*normalizar_ruts(ruts))))
+    else:
+        verificados = {indice: (rut, VALIDO) for indice, rut in zip(corporativas, ruts)}
+
+    resultados = []
+    for indice, fila in enumerate(filas):
+        rut = verificados.get(indice)
+        try:
+            cliente = _cliente_desde_diccionario(fila, validar, rut)
+        except Exception as e:
+            resultados.append((None, None, str(e)))
+        else:
+            resultados.append((cliente, rut[0] if rut else None, None))
+    return resultados
+
+
+def leer_con_diccionarios(ruta, validar):
+    """Lee y construye el archivo completo con csv.DictReader."""
+    resultados = []
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        filas = csv.DictReader(archivo)
+        for bloque in iter(lambda: list(islice(filas, TAMANO_BLOQUE)), []):
+            resultados += construir_con_diccionarios(bloque, validar)
+    return resultados
+
+
+def leer_posicional(ruta, validar):
+    """Lee y construye el archivo completo con LectorCSV y ConstructorClientes."""
+    resultados = []
+    with open(ruta, "rb") as archivo:
+        lector = LectorCSV(archivo)
+        constructor = ConstructorClientes(lector.encabezados)
+        filas = lector.filas()
+        for bloque in iter(lambda: list(islice(filas, TAMANO_BLOQUE)), []):
+            resultados += constructor.construir_bloque(bloque, validar)
+    return resultados
+
+
+def medir(funcion, ruta, validar, repeticiones):
+    """Devuelve el mejor tiempo (en segundos) de varias ejecuciones."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(ruta, validar)
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clientes.csv")
+        generar_csv(ruta, argumentos.filas)
+
+        for validar in (True, False):
+            # Ambos caminos deben producir exactamente los mismos clientes
+            esperados = leer_con_diccionarios(ruta, validar)
+            obtenidos = leer_posicional(ruta, validar)
+            assert [(c and c.to_dict(), rut, error) for c, rut, error in esperados] == [
+                (c and c.to_dict(), rut, error) for c, rut, error, _ in obtenidos
+            ]
+
+            modo = "con validación" if validar else "confiable"
+            for nombre, funcion in (
+                ("csv.DictReader", leer_con_diccionarios),
+                ("posicional", leer_posicional),
+            ):
+                segundos = medir(funcion, ruta, validar, argumentos.repeticiones)
+                print(
+                    f"{argumentos.filas} filas, {modo:<15} {nombre:<15} {segundos:.2f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark de la importación de una exportación propia, validando cada fila
+o por el camino confiable (firma válida, sin repetir validaciones).
+
+Cada medición corre en un proceso nuevo, para que un gestor anterior no
+cambie el costo de memoria ni del recolector de basura de la siguiente.
+Además de la importación se mide la primera búsqueda por nombre, que es
+cuando se construye el índice de trigramas de los clientes importados.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/benchmark_importacion_confiable.py [--filas N]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.formato_csv import ENCABEZADOS_CSV  # noqa: E402
+from modulos.gestor_clientes import GestorClientes  # noqa: E402
+
+
+def generar_exportacion(cantidad):
+    """Importa clientes generados y los exporta firmados a datos/clientes.csv."""
+    with open("entrada.csv", "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(ENCABEZADOS_CSV)
+        for i in range(cantidad):
+            base = [
+                f"Cliente Numero {i}",
+                f"c{i}@ejemplo.com",
+                f"+569{10000000 + i}",
+                f"Calle {i} #123, Santiago",
+            ]
+            if i % 3 == 0:
+                escritor.writerow(["Regular", *base, i % 5000, "", ""])
+            elif i % 3 == 1:
+                escritor.writerow(["Premium", *base, 15, "2024-01-15", ""])
+            else:
+                escritor.writerow(
+                    ["Corporativo", *base, f"Empresa {i}", "76.086.428-5", "Juan"]
+                )
+
+    gestor = GestorClientes(ruta_csv="datos/clientes.csv")
+    gestor.importar_desde_csv("entrada.csv")
+    gestor.exportar_a_csv()
+
+
+def medir(confiable):
+    """Importa la exportación en un gestor nuevo y mide cada etapa."""
+    gestor = GestorClientes(ruta_csv="datos/copia.csv")
+    inicio = time.perf_counter()
+    estadisticas = gestor.importar_desde_csv("datos/clientes.csv", confiable=confiable)
+    importado = time.perf_counter()
+    gestor.buscar_clientes("Numero 12")
+    buscado = time.perf_counter()
+    return estadisticas["exitosos"], importado - inicio, buscado - importado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--repeticiones", type=int, default=2)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        os.chdir(directorio)
+        generar_exportacion(argumentos.filas)
+
+        for _ in range(argumentos.repeticiones):
+            for confiable in (False, True):
+                with ProcessPoolExecutor(max_workers=1) as proceso:
+                    clientes, importacion, busqueda = proceso.submit(
+                        medir, confiable
+                    ).result()
+                modo = "confiable" if confiable else "con validación"
+                print(
+                    f"{clientes} clientes, {modo:<15} importación "
+                    f"{importacion:.2f}s, primera búsqueda {busqueda:.2f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
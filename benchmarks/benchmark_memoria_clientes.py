@@ -0,0 +1,168 @@
+"""
+Benchmark de la memoria que ocupan los clientes cargados desde un CSV.
+Mide con tracemalloc los bytes por cliente de los objetos construidos por
+ConstructorClientes (con sus textos), y los de un GestorClientes completo
+tras importar el archivo.
+
+Compara la construcción actual, que solo comparte (sys.intern) los textos
+que se repiten entre filas (fecha de membresía, empresa y RUT), con una que
+además comparte nombre, dirección y contacto, que en el archivo generado son
+distintos en cada fila, como en los datos reales.
+
+Cada medición corre en un proceso nuevo, para que los textos compartidos
+por una medición anterior no se descuenten de la siguiente.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/benchmark_memoria_clientes.py [--filas N]
+"""
+
+import argparse
+import csv
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.formato_csv import (  # noqa: E402
+    ENCABEZADOS_CSV,
+    ConstructorClientes,
+    LectorCSV,
+)
+from modulos.gestor_clientes import GestorClientes  # noqa: E402
+from modulos.validaciones import calcular_digito_verificador  # noqa: E402
+
+# Filas que se construyen juntas, como en la importación por bloques
+TAMANO_BLOQUE = 1000
+
+# Empresas y fechas distintas del archivo generado
+EMPRESAS = 200
+FECHAS = 30
+
+
+class ConstructorInternandoTodo(ConstructorClientes):
+    """Constructor que comparte también nombre, dirección y contacto."""
+
+    def _datos_comunes(self, fila):
+        return [sys.intern(valor) for valor in super()._datos_comunes(fila)]
+
+    def _datos_corporativo(self, fila):
+        clase, datos = super()._datos_corporativo(fila)
+        datos[-1] = sys.intern(datos[-1])
+        return clase, datos
+
+
+CONSTRUCTORES = {
+    "solo repetidos": ConstructorClientes,
+    "todos los textos": ConstructorInternandoTodo,
+}
+
+
+def generar_csv(ruta, cantidad, semilla=7):
+    """Escribe un CSV con la misma cantidad de clientes de cada tipo."""
+    aleatorio = random.Random(semilla)
+    empresas = []
+    for i in range(EMPRESAS):
+        numero = aleatorio.randint(1000000, 99999999)
+        rut = f"{numero}-{calcular_digito_verificador(numero)}"
+        empresas.append((f"Empresa {i} SpA", rut))
+    fechas = [f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}" for i in range(FECHAS)]
+
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(ENCABEZADOS_CSV)
+        for i in range(cantidad):
+            base = [
+                f"Cliente Numero {i}",
+                f"c{i}@ejemplo.cl",
+                f"+569{10000000 + i}",
+                f"Calle {i} #123, Santiago",
+            ]
+            if i % 3 == 0:
+                escritor.writerow(["Regular", *base, i % 5000, "", ""])
+            elif i % 3 == 1:
+                escritor.writerow(["Premium", *base, 15, aleatorio.choice(fechas), ""])
+            else:
+                empresa, rut = aleatorio.choice(empresas)
+                escritor.writerow(["Corporativo", *base, empresa, rut, f"Contacto {i}"])
+
+
+def construir(ruta, constructor):
+    """Construye todos los clientes del archivo con el constructor dado."""
+    clientes = []
+    with open(ruta, "rb") as archivo:
+        lector = LectorCSV(archivo)
+        instancia = constructor(lector.encabezados)
+        filas = lector.filas()
+        for bloque in iter(lambda: list(islice(filas, TAMANO_BLOQUE)), []):
+            resultados = instancia.construir_bloque(bloque, False)
+            clientes += [cliente for cliente, _, _, _ in resultados]
+    return clientes
+
+
+def medir_construccion(ruta, nombre):
+    """Bytes por cliente retenidos tras construir el archivo, y el tiempo."""
+    constructor = CONSTRUCTORES[nombre]
+    inicio = time.perf_counter()
+    construir(ruta, constructor)
+    duracion = time.perf_counter() - inicio
+
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    clientes = construir(ruta, constructor)
+    gc.collect()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (despues - antes) / len(clientes), duracion
+
+
+def medir_gestor(ruta, directorio):
+    """Bytes por cliente retenidos por un gestor tras importar el archivo."""
+    os.chdir(directorio)
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    gestor = GestorClientes(ruta_csv=os.path.join(directorio, "salida.csv"))
+    estadisticas = gestor.importar_desde_csv(ruta)
+    gc.collect()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (despues - antes) / estadisticas["exitosos"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filas", type=int, default=100_000)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clientes.csv")
+        generar_csv(ruta, argumentos.filas)
+
+        for nombre in CONSTRUCTORES:
+            with ProcessPoolExecutor(max_workers=1) as proceso:
+                por_cliente, duracion = proceso.submit(
+                    medir_construccion, ruta, nombre
+                ).result()
+            print(
+                f"{argumentos.filas} clientes, internando {nombre:<16} "
+                f"{por_cliente:.1f} bytes por cliente, construcción {duracion:.2f}s"
+            )
+
+        with ProcessPoolExecutor(max_workers=1) as proceso:
+            por_cliente = proceso.submit(medir_gestor, ruta, directorio).result()
+        print(
+            f"{argumentos.filas} clientes en GestorClientes: "
+            f"{por_cliente:.1f} bytes por cliente"
+        )
+
+
+if __name__ == "__main__":
+    main()
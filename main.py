@@ -33,11 +33,28 @@ class InterfazGIC:
         self._cargar_datos_iniciales()
 
     def _cargar_datos_iniciales(self):
-        """Carga automáticamente el archivo CSV de entrada si existe."""
+        """
+        Carga automáticamente el archivo CSV de entrada si existe.
+        Si hay un snapshot vigente de ese archivo se carga el snapshot, que es
+        mucho más rápido que releer y validar el CSV; si no, se importa el CSV
+        y se guarda un snapshot para el próximo inicio.
+        """
         ruta_entrada = "datos/clientes_entrada.csv"
         if os.path.exists(ruta_entrada):
             try:
-                self.gestor.importar_desde_csv(ruta_entrada)
+                if self.gestor.snapshot_vigente(ruta_entrada):
+                    try:
+                        self.gestor.cargar_snapshot()
+                    except DatosInvalidosError:
+                        # Snapshot dañado: se vuelve a leer el CSV completo
+                        self.gestor = GestorClientes()
+
+                # Sólo se importan las filas que el snapshot no tenga
+                estadisticas = self.gestor.importar_desde_csv(
+                    ruta_entrada, incremental=True
+                )
+                if estadisticas["total"] > 0:
+                    self.gestor.guardar_snapshot()
             except Exception:
                 # Si hay error, simplemente continúa con lista vacía
                 pass
@@ -185,7 +202,7 @@ class InterfazGIC:
     # ======================== OPERACIÓN 2: BUSCAR ========================
 
     def buscar_cliente(self):
-        """Busca un cliente por email o nombre."""
+        """Busca clientes por email o nombre, mostrando los resultados paginados."""
         self.limpiar_pantalla()
         print("=" * 60)
         print("BUSCAR CLIENTE")
@@ -199,36 +216,80 @@ class InterfazGIC:
                 self.pausa()
                 return
 
-            cliente = self.gestor.buscar_cliente(busqueda)
+            items_por_pagina = 10
+            pagina_actual = 1
 
-            if cliente:
-                print("\n✅ Cliente encontrado:\n")
-                print(cliente.mostrar_info())
+            while True:
+                inicio = (pagina_actual - 1) * items_por_pagina
+                # Se pide un resultado extra para saber si hay página siguiente
+                resultados = list(
+                    self.gestor.buscar_clientes(
+                        busqueda, limite=items_por_pagina + 1, desplazamiento=inicio
+                    )
+                )
+                hay_siguiente = len(resultados) > items_por_pagina
+                resultados = resultados[:items_por_pagina]
 
-                # Si es Premium, mostrar beneficios
-                if isinstance(cliente, ClientePremium):
-                    print("\n" + "-" * 60)
-                    print("BENEFICIOS PREMIUM:")
-                    print("-" * 60)
-                    print(cliente.beneficio_exclusivo())
+                if not resultados:
+                    print("\n❌ No se encontró cliente con ese criterio.")
+                    self.pausa()
+                    return
 
-                # Si es Corporativo, ofrecer generar factura
-                if isinstance(cliente, ClienteCorporativo):
-                    print("\n" + "-" * 60)
-                    opcion = input(
-                        "\n¿Desea generar una factura corporativa? (S/N): "
-                    ).upper()
-                    if opcion == "S":
-                        self._generar_factura_corporativa(cliente)
-            else:
-                print("\n❌ No se encontró cliente con ese criterio.")
+                # Una única coincidencia: mostrar el detalle directamente
+                if pagina_actual == 1 and len(resultados) == 1:
+                    print("\n✅ Cliente encontrado:\n")
+                    self._mostrar_detalle_cliente(resultados[0])
+                    self.pausa()
+                    return
 
-            self.pausa()
+                self.limpiar_pantalla()
+                print("=" * 60)
+                print(f"RESULTADOS DE BÚSQUEDA (Página {pagina_actual})")
+                print("=" * 60 + "\n")
+
+                for i, cliente in enumerate(resultados, 1):
+                    print(f"\n--- Resultado {inicio + i} ---")
+                    print(cliente.mostrar_info())
+
+                opcion = input(
+                    "\n(N°) Ver detalle, (S) Siguiente página, "
+                    "(V) Volver atrás, (Q) Salir: "
+                ).upper()
+
+                if opcion.isdigit() and 1 <= int(opcion) - inicio <= len(resultados):
+                    self.limpiar_pantalla()
+                    self._mostrar_detalle_cliente(resultados[int(opcion) - inicio - 1])
+                    self.pausa()
+                    return
+                elif opcion == "S" and hay_siguiente:
+                    pagina_actual += 1
+                elif opcion == "V" and pagina_actual > 1:
+                    pagina_actual -= 1
+                else:
+                    break
 
         except Exception as e:
             print(f"\n❌ Error en búsqueda: {e}")
             self.pausa()
 
+    def _mostrar_detalle_cliente(self, cliente):
+        """Muestra el detalle de un cliente y las acciones según su tipo."""
+        print(cliente.mostrar_info())
+
+        # Si es Premium, mostrar beneficios
+        if isinstance(cliente, ClientePremium):
+            print("\n" + "-" * 60)
+            print("BENEFICIOS PREMIUM:")
+            print("-" * 60)
+            print(cliente.beneficio_exclusivo())
+
+        # Si es Corporativo, ofrecer generar factura
+        if isinstance(cliente, ClienteCorporativo):
+            print("\n" + "-" * 60)
+            opcion = input("\n¿Desea generar una factura corporativa? (S/N): ").upper()
+            if opcion == "S":
+                self._generar_factura_corporativa(cliente)
+
     # ======================== OPERACIÓN 3: LISTAR ========================
 
     def listar_clientes(self):
@@ -239,28 +300,30 @@ class InterfazGIC:
         print("=" * 60 + "\n")
 
         try:
-            clientes = self.gestor.listar_clientes()
+            total_clientes = self.gestor.contar_clientes()
 
-            if not clientes:
+            if not total_clientes:
                 print("❌ No hay clientes registrados.")
                 self.pausa()
                 return
 
             # Paginación: mostrar de 10 en 10
             items_por_pagina = 10
-            total_paginas = (len(clientes) + items_por_pagina - 1) // items_por_pagina
+            total_paginas = (total_clientes + items_por_pagina - 1) // items_por_pagina
             pagina_actual = 1
 
             while pagina_actual <= total_paginas:
                 inicio = (pagina_actual - 1) * items_por_pagina
-                fin = min(inicio + items_por_pagina, len(clientes))
 
                 self.limpiar_pantalla()
                 print("=" * 60)
                 print(f"LISTADO DE CLIENTES (Página {pagina_actual}/{total_paginas})")
                 print("=" * 60 + "\n")
 
-                for i, cliente in enumerate(clientes[inicio:fin], 1):
+                pagina = self.gestor.iterar_clientes(
+                    limite=items_por_pagina, desplazamiento=inicio
+                )
+                for i, cliente in enumerate(pagina, 1):
                     num_global = inicio + i
                     print(f"\n--- Cliente {num_global} ---")
                     print(cliente.mostrar_info())
@@ -462,9 +525,17 @@ class InterfazGIC:
                 ruta = "datos/clientes_entrada.csv"
 
             print(f"\nImportando desde: {ruta}")
-            stats = self.gestor.importar_desde_csv(ruta)
+            # Las exportaciones propias firmadas se cargan sin revalidar, y
+            # una importación interrumpida (incluso al cerrar el programa)
+            # continúa desde el último bloque confirmado
+            stats = self.gestor.importar_desde_csv(
+                ruta,
+                confiable=True,
+                progreso=self._mostrar_avance_importacion,
+                reanudar=True,
+            )
 
-            print("\n✅ Importación completada!")
+            print("\n\n✅ Importación completada!")
             print(f"Total procesados: {stats['total']}")
             print(f"Importados exitosamente: {stats['exitosos']}")
             print(f"Duplicados (no importados): {stats['duplicados']}")
@@ -480,6 +551,16 @@ class InterfazGIC:
             print(f"❌ Error al importar: {e}")
             self.pausa()
 
+    def _mostrar_avance_importacion(self, avance):
+        """Muestra en una sola línea el avance de la importación en curso."""
+        porcentaje = 100 * avance["leido"] / max(avance["tamano_archivo"], 1)
+        print(
+            f"\r  Avance: {porcentaje:5.1f}% "
+            f"({avance['estadisticas']['total']} filas procesadas)",
+            end="",
+            flush=True,
+        )
+
     # ======================== OPERACIÓN 8: GENERAR REPORTE ========================
 
     def generar_reporte(self):
@@ -8,6 +8,7 @@ from .cliente_regular import ClienteRegular
 from .cliente_premium import ClientePremium
 from .cliente_corporativo import ClienteCorporativo
 from .gestor_clientes import GestorClientes
+from .almacenes import AlmacenObjetos, AlmacenColumnar
 from .excepciones import (
     EmailInvalidoError,
     TelefonoInvalidoError,
@@ -23,6 +24,19 @@ from .validaciones import (
     validar_texto_no_vacio,
     validar_numero_positivo,
     validar_rango_numero,
+    validar_emails,
+    validar_telefonos,
+    validar_ruts,
+    calcular_digito_verificador,
+    calcular_digitos_verificadores,
+    normalizar_ruts,
+    activar_cache_validaciones,
+    desactivar_cache_validaciones,
+    limpiar_cache_validaciones,
+    estadisticas_cache_validaciones,
+    VALIDO,
+    ERROR_FORMATO,
+    ERROR_DIGITO_VERIFICADOR,
 )
 
 __all__ = [
@@ -31,6 +45,8 @@ __all__ = [
     "ClientePremium",
     "ClienteCorporativo",
     "GestorClientes",
+    "AlmacenObjetos",
+    "AlmacenColumnar",
     "EmailInvalidoError",
     "TelefonoInvalidoError",
     "ClienteExistenteError",
@@ -43,4 +59,17 @@ __all__ = [
     "validar_texto_no_vacio",
     "validar_numero_positivo",
     "validar_rango_numero",
+    "validar_emails",
+    "validar_telefonos",
+    "validar_ruts",
+    "calcular_digito_verificador",
+    "calcular_digitos_verificadores",
+    "normalizar_ruts",
+    "activar_cache_validaciones",
+    "desactivar_cache_validaciones",
+    "limpiar_cache_validaciones",
+    "estadisticas_cache_validaciones",
+    "VALIDO",
+    "ERROR_FORMATO",
+    "ERROR_DIGITO_VERIFICADOR",
 ]
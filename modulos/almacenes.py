@@ -0,0 +1,480 @@
+"""
+Módulo de almacenamiento de clientes.
+Define los backends donde GestorClientes guarda sus clientes: como objetos
+(por defecto) o en columnas paralelas para cargas analíticas.
+"""
+
+import weakref
+from array import array
+from bisect import bisect_left
+from functools import partial
+
+from .cliente import Cliente
+from .cliente_regular import ClienteRegular
+from .cliente_premium import ClientePremium
+from .cliente_corporativo import ClienteCorporativo
+from .formato_csv import cliente_a_tupla
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan bucles de Python
+    np = None
+
+
+class AlmacenObjetos:
+    """
+    Almacena los clientes como objetos en un diccionario ordenado por alta.
+
+    Atributos privados:
+        __clientes (dict): Identificador -> Cliente
+        __observador (callable): Observador que se suscribe a cada cliente
+    """
+
+    def __init__(self):
+        """Inicializa un almacén vacío."""
+        self.__clientes = {}
+        self.__observador = None
+
+    def vincular(self, observador):
+        """
+        Define el observador que se suscribirá a cada cliente almacenado.
+
+        Args:
+            observador (callable): Función observador(cliente, campo, anterior, nuevo)
+        """
+        self.__observador = observador
+
+    def __len__(self):
+        """Cantidad de clientes almacenados."""
+        return len(self.__clientes)
+
+    def __contains__(self, id_cliente):
+        """Indica si hay un cliente con ese identificador."""
+        return id_cliente in self.__clientes
+
+    def insertar(self, id_cliente, cliente):
+        """
+        Guarda un cliente bajo un identificador.
+
+        Args:
+            id_cliente (int): Identificador interno (creciente)
+            cliente (Cliente): Cliente a guardar
+        """
+        self.__clientes[id_cliente] = cliente
+        if self.__observador is not None:
+            cliente._suscribir(self.__observador)
+
+    def eliminar(self, id_cliente):
+        """
+        Elimina el cliente con ese identificador.
+
+        Args:
+            id_cliente (int): Identificador interno
+        """
+        cliente = self.__clientes.pop(id_cliente)
+        if self.__observador is not None:
+            cliente._desuscribir(self.__observador)
+
+    def obtener(self, id_cliente):
+        """
+        Obtiene el cliente con ese identificador.
+
+        Returns:
+            Cliente: Cliente almacenado o None
+        """
+        return self.__clientes.get(id_cliente)
+
+    def ids(self):
+        """Itera los identificadores en orden de alta."""
+        return iter(self.__clientes)
+
+    def clientes(self):
+        """Itera los clientes en orden de alta."""
+        return iter(self.__clientes.values())
+
+    def filas_csv(self):
+        """Itera las filas CSV (tuplas) de los clientes en orden de alta."""
+        return map(cliente_a_tupla, self.__clientes.values())
+
+    def filtrar_rango(self, campo, tipo, minimo=None, maximo=None):
+        """
+        Obtiene los clientes de un tipo cuyo campo numérico está en un rango.
+
+        Args:
+            campo (str): Campo numérico (puntos_acumulados, descuento_exclusivo)
+            tipo (str): Tipo de cliente que posee el campo
+            minimo (int/float): Valor mínimo incluido (None: sin mínimo)
+            maximo (int/float): Valor máximo incluido (None: sin máximo)
+
+        Returns:
+            list: Identificadores en orden de alta
+        """
+        resultado = []
+        for id_cliente, cliente in self.__clientes.items():
+            if cliente.TIPO != tipo:
+                continue
+            valor = getattr(cliente, campo)
+            if (minimo is None or valor >= minimo) and (
+                maximo is None or valor <= maximo
+            ):
+                resultado.append(id_cliente)
+        return resultado
+
+
+class _ColumnaTexto:
+    """Columna de textos sin codificar (para valores casi siempre únicos)."""
+
+    def __init__(self, valores=None):
+        self.valores = valores if valores is not None else []
+
+    def agregar(self, texto):
+        self.valores.append(texto)
+
+    def asignar(self, fila, texto):
+        self.valores[fila] = texto
+
+    def __getitem__(self, fila):
+        return self.valores[fila]
+
+    def seleccionar(self, filas):
+        """Crea una columna nueva solo con las filas indicadas."""
+        return _ColumnaTexto([self.valores[fila] for fila in filas])
+
+
+class _ColumnaDiccionario:
+    """
+    Columna de textos codificada por diccionario: cada fila guarda un código
+    entero de 4 bytes y cada texto distinto se guarda una sola vez.
+    """
+
+    def __init__(self):
+        self.textos = []
+        self.codigos = {}
+        self.datos = array("I")
+
+    def _codificar(self, texto):
+        codigo = self.codigos.get(texto)
+        if codigo is None:
+            codigo = len(self.textos)
+            self.textos.append(texto)
+            self.codigos[texto] = codigo
+        return codigo
+
+    def agregar(self, texto):
+        self.datos.append(self._codificar(texto))
+
+    def asignar(self, fila, texto):
+        self.datos[fila] = self._codificar(texto)
+
+    def __getitem__(self, fila):
+        return self.textos[self.datos[fila]]
+
+    def seleccionar(self, filas):
+        """Crea una columna nueva solo con las filas indicadas (recodificada)."""
+        columna = _ColumnaDiccionario()
+        for fila in filas:
+            columna.agregar(self[fila])
+        return columna
+
+
+class AlmacenColumnar:
+    """
+    Almacena los clientes en columnas paralelas en lugar de objetos.
+
+    Los campos numéricos viven en arreglos compactos (array) y los textos
+    repetitivos se codifican por diccionario. Los objetos Cliente se
+    materializan solo al accederlos y los cambios hechos a través de sus
+    setters se escriben de vuelta en las columnas. Los filtros numéricos se
+    resuelven como operaciones vectorizadas con NumPy cuando está disponible.
+
+    Atributos privados:
+        __ids (array): Identificador de cada fila (creciente)
+        __tipos (array): Código de tipo de cada fila (-1: fila eliminada)
+        __textos (dict): Campo -> columna de textos
+        __numeros (dict): Campo -> arreglo numérico
+        __eliminadas (int): Filas eliminadas pendientes de compactar
+        __vivos (WeakValueDictionary): Identificador -> objeto materializado
+        __observador (callable): Observador que se suscribe a cada objeto
+    """
+
+    # Código de tipo de cada fila = posición de la clase en esta tupla
+    CLASES = (Cliente, ClienteRegular, ClientePremium, ClienteCorporativo)
+    CODIGOS_TIPO = {clase.TIPO: codigo for codigo, clase in enumerate(CLASES)}
+    ELIMINADA = -1
+
+    TEXTOS_UNICOS = ("nombre", "email", "telefono")
+    TEXTOS_REPETIDOS = (
+        "direccion",
+        "fecha_membresia",
+        "empresa",
+        "rut_empresa",
+        "contacto_principal",
+    )
+    NUMEROS = {"puntos_acumulados": "q", "descuento_exclusivo": "d"}
+    TIPOS_NUMPY = {"q": "int64", "d": "float64", "b": "int8"}
+
+    # Compactar cuando las filas eliminadas superan este mínimo y la mitad
+    MINIMO_COMPACTACION = 1024
+
+    def __init__(self):
+        """Inicializa un almacén vacío."""
+        self.__ids = array("q")
+        self.__tipos = array("b")
+        self.__textos = {campo: _ColumnaTexto() for campo in self.TEXTOS_UNICOS}
+        self.__textos.update(
+            {campo: _ColumnaDiccionario() for campo in self.TEXTOS_REPETIDOS}
+        )
+        self.__numeros = {
+            campo: array(codigo) for campo, codigo in self.NUMEROS.items()
+        }
+        self.__eliminadas = 0
+        self.__vivos = weakref.WeakValueDictionary()
+        self.__observador = None
+
+    def vincular(self, observador):
+        """
+        Define el observador que se suscribirá a cada objeto materializado.
+
+        Args:
+            observador (callable): Función observador(cliente, campo, anterior, nuevo)
+        """
+        self.__observador = observador
+
+    def __len__(self):
+        """Cantidad de clientes almacenados."""
+        return len(self.__ids) - self.__eliminadas
+
+    def __contains__(self, id_cliente):
+        """Indica si hay un cliente con ese identificador."""
+        return self._fila(id_cliente) is not None
+
+    def _fila(self, id_cliente):
+        """
+        Ubica la fila de un identificador por búsqueda binaria.
+
+        Returns:
+            int: Fila del cliente o None si no existe
+        """
+        fila = bisect_left(self.__ids, id_cliente)
+        if (
+            fila < len(self.__ids)
+            and self.__ids[fila] == id_cliente
+            and self.__tipos[fila] != self.ELIMINADA
+        ):
+            return fila
+        return None
+
+    def insertar(self, id_cliente, cliente):
+        """
+        Copia los datos de un cliente en una fila nueva.
+
+        Args:
+            id_cliente (int): Identificador interno (mayor que los anteriores)
+            cliente (Cliente): Cliente a guardar
+        """
+        self.__ids.append(id_cliente)
+        self.__tipos.append(self.CODIGOS_TIPO[cliente.TIPO])
+        for campo, columna in self.__textos.items():
+            columna.agregar(getattr(cliente, campo, ""))
+        for campo, columna in self.__numeros.items():
+            columna.append(getattr(cliente, campo, 0))
+
+        self._vincular_objeto(id_cliente, cliente)
+
+    def _vincular_objeto(self, id_cliente, cliente):
+        """Suscribe los observadores a un objeto vivo y lo registra."""
+        if self.__observador is not None:
+            cliente._suscribir(self.__observador)
+        cliente._suscribir(partial(self._escribir, id_cliente))
+        self.__vivos[id_cliente] = cliente
+
+    def _escribir(self, id_cliente, cliente, campo, anterior, nuevo):
+        """Observador que escribe en las columnas los cambios de un objeto."""
+        fila = self._fila(id_cliente)
+        if fila is None:
+            return
+        if campo in self.__textos:
+            self.__textos[campo].asignar(fila, nuevo)
+        elif campo in self.__numeros:
+            self.__numeros[campo][fila] = nuevo
+
+    def eliminar(self, id_cliente):
+        """
+        Marca como eliminada la fila de un identificador.
+
+        Args:
+            id_cliente (int): Identificador interno
+        """
+        fila = self._fila(id_cliente)
+        if fila is None:
+            raise KeyError(id_cliente)
+
+        self.__tipos[fila] = self.ELIMINADA
+        self.__eliminadas += 1
+
+        cliente = self.__vivos.pop(id_cliente, None)
+        if cliente is not None and self.__observador is not None:
+            cliente._desuscribir(self.__observador)
+
+        if (
+            self.__eliminadas >= self.MINIMO_COMPACTACION
+            and self.__eliminadas * 2 > len(self.__ids)
+        ):
+            self.compactar()
+
+    def compactar(self):
+        """Reconstruye las columnas descartando las filas eliminadas."""
+        filas = [
+            fila for fila, codigo in enumerate(self.__tipos) if codigo != self.ELIMINADA
+        ]
+        self.__ids = array("q", (self.__ids[fila] for fila in filas))
+        self.__tipos = array("b", (self.__tipos[fila] for fila in filas))
+        self.__textos = {
+            campo: columna.seleccionar(filas)
+            for campo, columna in self.__textos.items()
+        }
+        self.__numeros = {
+            campo: array(columna.typecode, (columna[fila] for fila in filas))
+            for campo, columna in self.__numeros.items()
+        }
+        self.__eliminadas = 0
+
+    def obtener(self, id_cliente):
+        """
+        Obtiene el cliente con ese identificador, materializándolo si no hay
+        un objeto vivo para él.
+
+        Returns:
+            Cliente: Cliente almacenado o None
+        """
+        cliente = self.__vivos.get(id_cliente)
+        if cliente is not None:
+            return cliente
+
+        fila = self._fila(id_cliente)
+        if fila is None:
+            return None
+
+        cliente = self._construir(fila)
+        self._vincular_objeto(id_cliente, cliente)
+        return cliente
+
+    def _construir(self, fila):
+        """
+        Crea el objeto Cliente de una fila. Los datos se validaron al
+        insertarse, por lo que se usa la construcción confiable.
+        """
+        textos = self.__textos
+        clase = self.CLASES[self.__tipos[fila]]
+        datos_base = (
+            textos["nombre"][fila],
+            textos["email"][fila],
+            textos["telefono"][fila],
+            textos["direccion"][fila],
+        )
+
+        if clase is ClienteRegular:
+            return ClienteRegular.desde_datos_confiables(
+                *datos_base, self.__numeros["puntos_acumulados"][fila]
+            )
+        elif clase is ClientePremium:
+            return ClientePremium.desde_datos_confiables(
+                *datos_base,
+                self.__numeros["descuento_exclusivo"][fila],
+                textos["fecha_membresia"][fila],
+            )
+        elif clase is ClienteCorporativo:
+            return ClienteCorporativo.desde_datos_confiables(
+                *datos_base,
+                textos["empresa"][fila],
+                textos["rut_empresa"][fila],
+                textos["contacto_principal"][fila],
+            )
+        return Cliente.desde_datos_confiables(*datos_base)
+
+    def _filas_vivas(self):
+        """Itera las filas no eliminadas en orden de alta."""
+        tipos = self.__tipos
+        return (fila for fila in range(len(tipos)) if tipos[fila] != self.ELIMINADA)
+
+    def ids(self):
+        """Itera los identificadores en orden de alta."""
+        ids = self.__ids
+        return (ids[fila] for fila in self._filas_vivas())
+
+    def clientes(self):
+        """Itera los clientes en orden de alta (materializándolos)."""
+        return map(self.obtener, self.ids())
+
+    def filas_csv(self):
+        """
+        Itera las filas CSV (tuplas) leyendo directamente las columnas,
+        sin materializar objetos Cliente.
+        """
+        textos = self.__textos
+        nombres, emails = textos["nombre"], textos["email"]
+        telefonos, direcciones = textos["telefono"], textos["direccion"]
+        puntos = self.__numeros["puntos_acumulados"]
+        descuentos = self.__numeros["descuento_exclusivo"]
+        regular, premium, corporativo = (
+            self.CODIGOS_TIPO[clase.TIPO]
+            for clase in (ClienteRegular, ClientePremium, ClienteCorporativo)
+        )
+
+        for fila in self._filas_vivas():
+            codigo = self.__tipos[fila]
+            base = (nombres[fila], emails[fila], telefonos[fila], direcciones[fila])
+            if codigo == regular:
+                yield ("Regular", *base, puntos[fila], "", "")
+            elif codigo == premium:
+                fecha = textos["fecha_membresia"][fila]
+                yield ("Premium", *base, descuentos[fila], fecha, "")
+            elif codigo == corporativo:
+                yield (
+                    "Corporativo",
+                    *base,
+                    textos["empresa"][fila],
+                    textos["rut_empresa"][fila],
+                    textos["contacto_principal"][fila],
+                )
+            else:
+                yield ("", *base, "", "", "")
+
+    def filtrar_rango(self, campo, tipo, minimo=None, maximo=None):
+        """
+        Obtiene los clientes de un tipo cuyo campo numérico está en un rango,
+        como una operación vectorizada sobre la columna.
+
+        Args:
+            campo (str): Campo numérico (puntos_acumulados, descuento_exclusivo)
+            tipo (str): Tipo de cliente que posee el campo
+            minimo (int/float): Valor mínimo incluido (None: sin mínimo)
+            maximo (int/float): Valor máximo incluido (None: sin máximo)
+
+        Returns:
+            list: Identificadores en orden de alta
+        """
+        columna = self.__numeros[campo]
+        codigo = self.CODIGOS_TIPO[tipo]
+
+        if not columna:
+            return []
+
+        if np is None:
+            return [
+                self.__ids[fila]
+                for fila in range(len(columna))
+                if self.__tipos[fila] == codigo
+                and (minimo is None or columna[fila] >= minimo)
+                and (maximo is None or columna[fila] <= maximo)
+            ]
+
+        # Vistas sin copia sobre los arreglos; se liberan al salir
+        valores = np.frombuffer(columna, dtype=self.TIPOS_NUMPY[columna.typecode])
+        mascara = np.frombuffer(self.__tipos, dtype="int8") == codigo
+        if minimo is not None:
+            mascara &= valores >= minimo
+        if maximo is not None:
+            mascara &= valores <= maximo
+        ids = np.frombuffer(self.__ids, dtype="int64")
+        return ids[mascara].tolist()
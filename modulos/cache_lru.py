@@ -0,0 +1,108 @@
+"""
+Módulo de la caché LRU de tamaño acotado.
+Guarda los resultados más recientes y descarta el menos usado al llenarse.
+"""
+
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """
+    Caché que conserva a lo más `tamano_maximo` entradas, descartando la
+    usada hace más tiempo (Least Recently Used) cuando se llena.
+
+    Atributos privados:
+        __entradas (OrderedDict): Clave -> valor, de la menos a la más usada
+        __tamano_maximo (int): Cantidad máxima de entradas
+        __aciertos (int): Consultas que encontraron la clave
+        __fallos (int): Consultas que no encontraron la clave
+    """
+
+    def __init__(self, tamano_maximo):
+        """
+        Inicializa una caché vacía.
+
+        Args:
+            tamano_maximo (int): Cantidad máxima de entradas (mayor a 0)
+
+        Raises:
+            ValueError: Si el tamaño máximo no es positivo
+        """
+        if tamano_maximo <= 0:
+            raise ValueError("El tamaño máximo de la caché debe ser mayor a 0.")
+        self.__entradas = OrderedDict()
+        self.__tamano_maximo = tamano_maximo
+        self.__aciertos = 0
+        self.__fallos = 0
+
+    def __len__(self):
+        """Cantidad de entradas guardadas."""
+        return len(self.__entradas)
+
+    @property
+    def tamano_maximo(self):
+        """Cantidad máxima de entradas."""
+        return self.__tamano_maximo
+
+    @property
+    def aciertos(self):
+        """Consultas que encontraron la clave en la caché."""
+        return self.__aciertos
+
+    @property
+    def fallos(self):
+        """Consultas que no encontraron la clave en la caché."""
+        return self.__fallos
+
+    def obtener(self, clave, por_defecto=None):
+        """
+        Obtiene el valor de una clave y la marca como la más reciente.
+
+        Args:
+            clave: Clave a consultar
+            por_defecto: Valor a retornar si la clave no está
+
+        Returns:
+            El valor guardado, o por_defecto si la clave no está
+        """
+        try:
+            self.__entradas.move_to_end(clave)
+        except KeyError:
+            self.__fallos += 1
+            return por_defecto
+        self.__aciertos += 1
+        return self.__entradas[clave]
+
+    def guardar(self, clave, valor):
+        """
+        Guarda un valor, descartando la entrada menos usada si se excede el
+        tamaño máximo.
+
+        Args:
+            clave: Clave a guardar
+            valor: Valor asociado
+        """
+        self.__entradas[clave] = valor
+        self.__entradas.move_to_end(clave)
+        if len(self.__entradas) > self.__tamano_maximo:
+            self.__entradas.popitem(last=False)
+
+    def limpiar(self):
+        """Elimina todas las entradas y reinicia los contadores."""
+        self.__entradas.clear()
+        self.__aciertos = 0
+        self.__fallos = 0
+
+    def estadisticas(self):
+        """
+        Obtiene el estado de la caché.
+
+        Returns:
+            dict: tamano, tamano_maximo, aciertos y fallos
+        """
+        return {
+            "tamano": len(self.__entradas),
+            "tamano_maximo": self.__tamano_maximo,
+            "aciertos": self.__aciertos,
+            "fallos": self.__fallos,
+        }
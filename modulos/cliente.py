@@ -10,6 +10,9 @@ class Cliente:
     """
     Clase base que representa un cliente del sistema.
 
+    Atributos de clase:
+        TIPO (str): Nombre del tipo de cliente (usado en CSV e índices)
+
     Atributos privados:
         __nombre (str): Nombre del cliente
         __email (str): Email único del cliente
@@ -17,6 +20,19 @@ class Cliente:
         __direccion (str): Dirección del cliente
     """
 
+    TIPO = "Cliente"
+
+    # Sin __dict__ por instancia: reduce la memoria por cliente.
+    # __weakref__ permite que los almacenes lleven registro de objetos vivos.
+    __slots__ = (
+        "__nombre",
+        "__email",
+        "__telefono",
+        "__direccion",
+        "__observadores",
+        "__weakref__",
+    )
+
     def __init__(self, nombre, email, telefono, direccion):
         """
         Inicializa un cliente con validaciones.
@@ -41,6 +57,35 @@ class Cliente:
         self.__email = email.lower()
         self.__telefono = telefono
         self.__direccion = direccion
+        self.__observadores = ()
+
+    @classmethod
+    def desde_datos_confiables(cls, nombre, email, telefono, direccion):
+        """
+        Crea un cliente sin repetir las validaciones.
+        Solo debe usarse con datos ya validados por el propio sistema
+        (por ejemplo, un CSV exportado y firmado por GestorClientes).
+
+        Args:
+            nombre (str): Nombre del cliente
+            email (str): Email del cliente (ya normalizado en minúsculas)
+            telefono (str): Teléfono del cliente
+            direccion (str): Dirección del cliente
+
+        Returns:
+            Cliente: Cliente creado
+        """
+        cliente = object.__new__(cls)
+        cliente._inicializar_confiable(nombre, email, telefono, direccion)
+        return cliente
+
+    def _inicializar_confiable(self, nombre, email, telefono, direccion):
+        """Asigna los atributos base sin validar."""
+        self.__nombre = nombre
+        self.__email = email
+        self.__telefono = telefono
+        self.__direccion = direccion
+        self.__observadores = ()
 
     # ======================== GETTERS ========================
 
@@ -70,26 +115,61 @@ class Cliente:
     def nombre(self, valor):
         """Establece el nombre con validación."""
         validar_texto_no_vacio(valor, "nombre")
+        self._notificar_cambio("nombre", self.__nombre, valor)
         self.__nombre = valor
 
     @email.setter
     def email(self, valor):
         """Establece el email con validación."""
         validar_email(valor)
-        self.__email = valor.lower()
+        nuevo = valor.lower()
+        self._notificar_cambio("email", self.__email, nuevo)
+        self.__email = nuevo
 
     @telefono.setter
     def telefono(self, valor):
         """Establece el teléfono con validación."""
         validar_telefono(valor)
+        self._notificar_cambio("telefono", self.__telefono, valor)
         self.__telefono = valor
 
     @direccion.setter
     def direccion(self, valor):
         """Establece la dirección con validación."""
         validar_texto_no_vacio(valor, "dirección")
+        self._notificar_cambio("direccion", self.__direccion, valor)
         self.__direccion = valor
 
+    # ======================== OBSERVADORES ========================
+
+    def _suscribir(self, observador):
+        """
+        Registra un observador que será notificado antes de cada cambio.
+
+        Args:
+            observador (callable): Función observador(cliente, campo, anterior, nuevo)
+        """
+        self.__observadores += (observador,)
+
+    def _desuscribir(self, observador):
+        """Elimina un observador previamente registrado."""
+        self.__observadores = tuple(
+            obs for obs in self.__observadores if obs != observador
+        )
+
+    def _notificar_cambio(self, campo, anterior, nuevo):
+        """
+        Notifica a los observadores que un campo va a cambiar.
+        Un observador puede rechazar el cambio lanzando una excepción.
+
+        Args:
+            campo (str): Nombre del campo modificado
+            anterior: Valor actual del campo
+            nuevo: Valor que tomará el campo
+        """
+        for observador in self.__observadores:
+            observador(self, campo, anterior, nuevo)
+
     # ======================== MÉTODOS ========================
 
     def mostrar_info(self):
@@ -3,6 +3,7 @@ Módulo de la subclase ClienteCorporativo.
 Representa clientes corporativos/empresariales del sistema.
 """
 
+import sys
 from .cliente import Cliente
 from .validaciones import validar_texto_no_vacio, validar_rut
 
@@ -20,6 +21,10 @@ class ClienteCorporativo(Cliente):
         __contacto_principal (str): Nombre del contacto principal
     """
 
+    TIPO = "Corporativo"
+
+    __slots__ = ("__empresa", "__rut_empresa", "__contacto_principal")
+
     def __init__(
         self,
         nombre,
@@ -29,6 +34,8 @@ class ClienteCorporativo(Cliente):
         empresa,
         rut_empresa,
         contacto_principal,
+        *,
+        verificar_rut=True,
     ):
         """
         Inicializa un cliente corporativo.
@@ -41,6 +48,8 @@ class ClienteCorporativo(Cliente):
             empresa (str): Nombre de la empresa
             rut_empresa (str): RUT de la empresa (con validación)
             contacto_principal (str): Nombre del contacto principal
+            verificar_rut (bool): Si False, se asume que el RUT ya fue validado
+                (por ejemplo, en lote con normalizar_ruts durante una importación)
 
         Raises:
             RutInvalidoError: Si el RUT es inválido
@@ -48,13 +57,37 @@ class ClienteCorporativo(Cliente):
         """
         super().__init__(nombre, email, telefono, direccion)
         validar_texto_no_vacio(empresa, "empresa")
-        validar_rut(rut_empresa)
+        if verificar_rut:
+            validar_rut(rut_empresa)
         validar_texto_no_vacio(contacto_principal, "contacto_principal")
 
         self.__empresa = empresa
-        self.__rut_empresa = rut_empresa.replace(".", "").upper()
+        # El RUT se repite en cada contacto de una misma empresa
+        self.__rut_empresa = sys.intern(rut_empresa.replace(".", "").upper())
         self.__contacto_principal = contacto_principal
 
+    @classmethod
+    def desde_datos_confiables(
+        cls,
+        nombre,
+        email,
+        telefono,
+        direccion,
+        empresa,
+        rut_empresa,
+        contacto_principal,
+    ):
+        """
+        Crea un cliente corporativo sin repetir las validaciones.
+        Ver Cliente.desde_datos_confiables.
+        """
+        cliente = object.__new__(cls)
+        cliente._inicializar_confiable(nombre, email, telefono, direccion)
+        cliente.__empresa = empresa
+        cliente.__rut_empresa = sys.intern(rut_empresa.replace(".", "").upper())
+        cliente.__contacto_principal = contacto_principal
+        return cliente
+
     @property
     def empresa(self):
         """Obtiene el nombre de la empresa."""
@@ -64,6 +97,7 @@ class ClienteCorporativo(Cliente):
     def empresa(self, valor):
         """Establece el nombre de la empresa."""
         validar_texto_no_vacio(valor, "empresa")
+        self._notificar_cambio("empresa", self.__empresa, valor)
         self.__empresa = valor
 
     @property
@@ -75,7 +109,9 @@ class ClienteCorporativo(Cliente):
     def rut_empresa(self, valor):
         """Establece el RUT con validación."""
         validar_rut(valor)
-        self.__rut_empresa = valor.replace(".", "").upper()
+        nuevo = sys.intern(valor.replace(".", "").upper())
+        self._notificar_cambio("rut_empresa", self.__rut_empresa, nuevo)
+        self.__rut_empresa = nuevo
 
     @property
     def contacto_principal(self):
@@ -86,6 +122,7 @@ class ClienteCorporativo(Cliente):
     def contacto_principal(self, valor):
         """Establece el contacto principal."""
         validar_texto_no_vacio(valor, "contacto_principal")
+        self._notificar_cambio("contacto_principal", self.__contacto_principal, valor)
         self.__contacto_principal = valor
 
     def generar_factura_corporativa(self, numero_factura, monto, descripcion=""):
@@ -20,6 +20,10 @@ class ClientePremium(Cliente):
         __fecha_membresia (str): Fecha de inicio de membresía
     """
 
+    TIPO = "Premium"
+
+    __slots__ = ("__descuento_exclusivo", "__fecha_membresia")
+
     def __init__(
         self,
         nombre,
@@ -55,6 +59,28 @@ class ClientePremium(Cliente):
             except ValueError:
                 raise ValueError("La fecha debe estar en formato YYYY-MM-DD")
 
+    @classmethod
+    def desde_datos_confiables(
+        cls,
+        nombre,
+        email,
+        telefono,
+        direccion,
+        descuento_exclusivo=10.0,
+        fecha_membresia=None,
+    ):
+        """
+        Crea un cliente premium sin repetir las validaciones.
+        Ver Cliente.desde_datos_confiables.
+        """
+        cliente = object.__new__(cls)
+        cliente._inicializar_confiable(nombre, email, telefono, direccion)
+        cliente.__descuento_exclusivo = float(descuento_exclusivo)
+        if fecha_membresia is None:
+            fecha_membresia = datetime.now().strftime("%Y-%m-%d")
+        cliente.__fecha_membresia = fecha_membresia
+        return cliente
+
     @property
     def descuento_exclusivo(self):
         """Obtiene el descuento exclusivo."""
@@ -64,7 +90,9 @@ class ClientePremium(Cliente):
     def descuento_exclusivo(self, valor):
         """Establece el descuento con validación."""
         validar_rango_numero(valor, "descuento_exclusivo", 0, 100)
-        self.__descuento_exclusivo = float(valor)
+        nuevo = float(valor)
+        self._notificar_cambio("descuento_exclusivo", self.__descuento_exclusivo, nuevo)
+        self.__descuento_exclusivo = nuevo
 
     @property
     def fecha_membresia(self):
@@ -76,9 +104,10 @@ class ClientePremium(Cliente):
         """Establece la fecha de membresía con validación."""
         try:
             datetime.strptime(valor, "%Y-%m-%d")
-            self.__fecha_membresia = valor
         except ValueError:
             raise ValueError("La fecha debe estar en formato YYYY-MM-DD")
+        self._notificar_cambio("fecha_membresia", self.__fecha_membresia, valor)
+        self.__fecha_membresia = valor
 
     def beneficio_exclusivo(self):
         """
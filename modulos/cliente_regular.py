@@ -18,6 +18,10 @@ class ClienteRegular(Cliente):
         __puntos_acumulados (int): Puntos acumulados por compras
     """
 
+    TIPO = "Regular"
+
+    __slots__ = ("__puntos_acumulados",)
+
     def __init__(self, nombre, email, telefono, direccion, puntos_acumulados=0):
         """
         Inicializa un cliente regular.
@@ -35,6 +39,19 @@ class ClienteRegular(Cliente):
         )
         self.__puntos_acumulados = int(puntos_acumulados)
 
+    @classmethod
+    def desde_datos_confiables(
+        cls, nombre, email, telefono, direccion, puntos_acumulados=0
+    ):
+        """
+        Crea un cliente regular sin repetir las validaciones.
+        Ver Cliente.desde_datos_confiables.
+        """
+        cliente = object.__new__(cls)
+        cliente._inicializar_confiable(nombre, email, telefono, direccion)
+        cliente.__puntos_acumulados = int(puntos_acumulados)
+        return cliente
+
     @property
     def puntos_acumulados(self):
         """Obtiene los puntos acumulados."""
@@ -44,7 +61,9 @@ class ClienteRegular(Cliente):
     def puntos_acumulados(self, valor):
         """Establece los puntos acumulados con validación."""
         validar_numero_positivo(valor, "puntos_acumulados", permitir_cero=True)
-        self.__puntos_acumulados = int(valor)
+        nuevo = int(valor)
+        self._notificar_cambio("puntos_acumulados", self.__puntos_acumulados, nuevo)
+        self.__puntos_acumulados = nuevo
 
     def acumular_puntos(self, cantidad):
         """
@@ -57,7 +76,9 @@ class ClienteRegular(Cliente):
             DatosInvalidosError: Si la cantidad es inválida
         """
         validar_numero_positivo(cantidad, "cantidad de puntos", permitir_cero=False)
-        self.__puntos_acumulados += int(cantidad)
+        nuevo = self.__puntos_acumulados + int(cantidad)
+        self._notificar_cambio("puntos_acumulados", self.__puntos_acumulados, nuevo)
+        self.__puntos_acumulados = nuevo
 
     def canjear_puntos(self, cantidad):
         """
@@ -82,7 +103,9 @@ class ClienteRegular(Cliente):
                 f"Solicitados: {cantidad}"
             )
 
-        self.__puntos_acumulados -= cantidad
+        nuevo = self.__puntos_acumulados - cantidad
+        self._notificar_cambio("puntos_acumulados", self.__puntos_acumulados, nuevo)
+        self.__puntos_acumulados = nuevo
         return True
 
     def mostrar_info(self):
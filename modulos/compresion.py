@@ -0,0 +1,216 @@
+"""
+Módulo de compresión de archivos.
+Elige el códec de la biblioteca estándar (gzip, xz o bzip2) según la
+extensión del archivo, para leer y escribir CSV comprimidos en streaming,
+y permite escribir archivos de forma atómica.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+
+# Extensión del archivo -> módulo de la biblioteca estándar que la maneja
+CODECS = {
+    ".gz": gzip,
+    ".xz": lzma,
+    ".bz2": bz2,
+}
+
+# Nivel de compresión por defecto (0 = más rápido, 9 = más compacto)
+NIVEL_COMPRESION_POR_DEFECTO = 6
+
+# Buffer de escritura de los archivos atómicos (menos llamadas al sistema)
+TAMANO_BUFFER_ESCRITURA = 1 << 20
+
+
+def codec_de(ruta):
+    """
+    Obtiene el códec que corresponde a la extensión de un archivo.
+
+    Args:
+        ruta (str): Ruta del archivo
+
+    Returns:
+        module: gzip, lzma o bz2, o None si el archivo no está comprimido
+    """
+    return CODECS.get(os.path.splitext(ruta)[1].lower())
+
+
+def esta_comprimido(ruta):
+    """Indica si la extensión del archivo corresponde a un formato comprimido."""
+    return codec_de(ruta) is not None
+
+
+def envolver_lectura(crudo, ruta):
+    """
+    Envuelve un archivo binario abierto para leer su contenido descomprimido.
+
+    El archivo crudo sigue siendo del llamador (debe cerrarlo), y su
+    posición indica cuántos bytes del disco se han leído.
+
+    Args:
+        crudo (file): Archivo abierto en modo binario ("rb")
+        ruta (str): Ruta del archivo (su extensión elige el códec)
+
+    Returns:
+        file: Archivo binario con el contenido descomprimido, o el mismo
+            archivo crudo si no está comprimido
+    """
+    codec = codec_de(ruta)
+    if codec is None:
+        return crudo
+    if codec is gzip:
+        return gzip.GzipFile(fileobj=crudo, mode="rb")
+    if codec is lzma:
+        return lzma.LZMAFile(crudo, "rb")
+    return bz2.BZ2File(crudo, "rb")
+
+
+def abrir_lectura(ruta):
+    """
+    Abre un archivo en modo binario, descomprimiéndolo si corresponde.
+
+    Args:
+        ruta (str): Ruta del archivo
+
+    Returns:
+        file: Archivo binario con el contenido descomprimido
+    """
+    codec = codec_de(ruta)
+    if codec is None:
+        return open(ruta, "rb")
+    return codec.open(ruta, "rb")
+
+
+def abrir_escritura(ruta, nivel=NIVEL_COMPRESION_POR_DEFECTO, texto=True):
+    """
+    Abre un archivo para escribir, comprimiéndolo si la extensión lo indica.
+
+    Args:
+        ruta (str): Ruta del archivo
+        nivel (int): Nivel de compresión de 0 a 9 (bzip2 usa como mínimo 1)
+        texto (bool): Si True, modo texto UTF-8 sin traducir saltos de línea
+            (el que espera el módulo csv); si False, modo binario
+
+    Returns:
+        file: Archivo abierto para escritura
+    """
+    codec = codec_de(ruta)
+    opciones = {"encoding": "utf-8", "newline": ""} if texto else {}
+    modo = "wt" if texto else "wb"
+
+    if codec is None:
+        return open(ruta, modo.replace("t", ""), **opciones)
+    if codec is gzip:
+        return gzip.open(ruta, modo, compresslevel=nivel, **opciones)
+    if codec is lzma:
+        return lzma.open(ruta, modo, preset=nivel, **opciones)
+    return bz2.open(ruta, modo, compresslevel=max(nivel, 1), **opciones)
+
+
+def envolver_escritura(crudo, ruta, nivel=NIVEL_COMPRESION_POR_DEFECTO):
+    """
+    Envuelve un archivo binario abierto para escribir comprimido.
+
+    Al cerrar el archivo envuelto, el crudo queda abierto (debe cerrarlo
+    el llamador).
+
+    Args:
+        crudo (file): Archivo abierto en modo binario ("wb")
+        ruta (str): Ruta de destino (su extensión elige el códec)
+        nivel (int): Nivel de compresión de 0 a 9 (bzip2 usa como mínimo 1)
+
+    Returns:
+        file: Archivo binario que comprime lo escrito, o el mismo archivo
+            crudo si la ruta no indica compresión
+    """
+    codec = codec_de(ruta)
+    if codec is None:
+        return crudo
+    if codec is gzip:
+        return gzip.GzipFile(fileobj=crudo, mode="wb", compresslevel=nivel)
+    if codec is lzma:
+        return lzma.LZMAFile(crudo, "wb", preset=nivel)
+    return bz2.BZ2File(crudo, "wb", compresslevel=max(nivel, 1))
+
+
+def _permisos_destino(ruta):
+    """
+    Permisos que debe tener un archivo escrito en la ruta: los del archivo
+    que reemplaza o, si no existe, los de un archivo nuevo según la umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(ruta).st_mode)
+    except FileNotFoundError:
+        # La umask solo se puede leer cambiándola; se restaura de inmediato
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextmanager
+def escritura_atomica(
+    ruta,
+    nivel=NIVEL_COMPRESION_POR_DEFECTO,
+    texto=True,
+    tamano_buffer=TAMANO_BUFFER_ESCRITURA,
+):
+    """
+    Escribe un archivo de forma atómica: el contenido va a un archivo
+    temporal en el mismo directorio que, al terminar sin errores, se
+    sincroniza con el disco (fsync) y reemplaza al destino con os.replace.
+    Si algo falla, el archivo anterior queda intacto y el temporal se borra.
+    El archivo final conserva los permisos del que reemplaza (o los de un
+    archivo nuevo, según la umask), no los restringidos del temporal.
+
+    Args:
+        ruta (str): Ruta de destino (su extensión decide la compresión)
+        nivel (int): Nivel de compresión de 0 a 9
+        texto (bool): Si True, modo texto UTF-8 sin traducir saltos de línea;
+            si False, modo binario
+        tamano_buffer (int): Tamaño en bytes del buffer de escritura
+
+    Yields:
+        file: Archivo abierto para escribir el contenido
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(
+        dir=directorio, prefix="." + os.path.basename(ruta) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb", buffering=tamano_buffer) as crudo:
+            comprimido = envolver_escritura(crudo, ruta, nivel)
+            archivo = comprimido
+            if texto:
+                archivo = io.TextIOWrapper(comprimido, encoding="utf-8", newline="")
+            try:
+                yield archivo
+            finally:
+                # Cerrar el envoltorio no debe cerrar el crudo: falta el fsync
+                if archivo is not crudo:
+                    archivo.flush()
+                    if texto:
+                        archivo.detach()
+                if comprimido is not crudo:
+                    comprimido.close()
+            crudo.flush()
+            os.fsync(crudo.fileno())
+        os.chmod(temporal, _permisos_destino(ruta))
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+    # Sincroniza el directorio para que el reemplazo sobreviva a un corte
+    if os.name == "posix":
+        descriptor = os.open(directorio, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
@@ -0,0 +1,350 @@
+"""
+Módulo del formato CSV de clientes.
+Define las columnas del archivo y la conversión de clientes a filas.
+"""
+
+import csv
+import sys
+from .cliente import Cliente
+from .cliente_regular import ClienteRegular
+from .cliente_premium import ClientePremium
+from .cliente_corporativo import ClienteCorporativo
+from .validaciones import VALIDO, normalizar_ruts, validar_rut
+
+# Columnas del archivo CSV, en orden
+ENCABEZADOS_CSV = [
+    "tipo",
+    "nombre",
+    "email",
+    "telefono",
+    "direccion",
+    "campo_extra1",
+    "campo_extra2",
+    "campo_extra3",
+]
+
+# Campos específicos de cada tipo, en el orden de las columnas campo_extra del CSV
+CAMPOS_EXTRA_CSV = {
+    ClienteRegular.TIPO: ("puntos_acumulados",),
+    ClientePremium.TIPO: ("descuento_exclusivo", "fecha_membresia"),
+    ClienteCorporativo.TIPO: ("empresa", "rut_empresa", "contacto_principal"),
+}
+
+
+def _fila_regular(cliente):
+    """Fila CSV de un cliente regular."""
+    return (
+        ClienteRegular.TIPO,
+        cliente.nombre,
+        cliente.email,
+        cliente.telefono,
+        cliente.direccion,
+        cliente.puntos_acumulados,
+        "",
+        "",
+    )
+
+
+def _fila_premium(cliente):
+    """Fila CSV de un cliente premium."""
+    return (
+        ClientePremium.TIPO,
+        cliente.nombre,
+        cliente.email,
+        cliente.telefono,
+        cliente.direccion,
+        cliente.descuento_exclusivo,
+        cliente.fecha_membresia,
+        "",
+    )
+
+
+def _fila_corporativo(cliente):
+    """Fila CSV de un cliente corporativo."""
+    return (
+        ClienteCorporativo.TIPO,
+        cliente.nombre,
+        cliente.email,
+        cliente.telefono,
+        cliente.direccion,
+        cliente.empresa,
+        cliente.rut_empresa,
+        cliente.contacto_principal,
+    )
+
+
+def _fila_base(cliente):
+    """Fila CSV de un cliente sin tipo específico (columnas extra vacías)."""
+    return (
+        "",
+        cliente.nombre,
+        cliente.email,
+        cliente.telefono,
+        cliente.direccion,
+        "",
+        "",
+        "",
+    )
+
+
+# Campos que una fila no informa: la fecha de un Premium sin columna de fecha
+# (o, al actualizar, con la fecha vacía) toma el valor por defecto, y al
+# actualizar no se cambia
+SIN_OMITIDOS = ()
+FECHA_OMITIDA = ("fecha_membresia",)
+
+# Tipo de cliente -> función que arma su fila CSV sin pasos genéricos
+FILAS_POR_TIPO = {
+    ClienteRegular.TIPO: _fila_regular,
+    ClientePremium.TIPO: _fila_premium,
+    ClienteCorporativo.TIPO: _fila_corporativo,
+}
+
+
+def cliente_a_tupla(cliente):
+    """
+    Convierte un cliente en una fila con las columnas de ENCABEZADOS_CSV.
+
+    Args:
+        cliente (Cliente): Cliente a convertir
+
+    Returns:
+        tuple: Valores de la fila en el orden de ENCABEZADOS_CSV
+    """
+    return FILAS_POR_TIPO.get(cliente.TIPO, _fila_base)(cliente)
+
+
+class ConstructorClientes:
+    """
+    Convierte filas posicionales del CSV (listas de valores, como las de
+    csv.reader) en clientes.
+
+    Las posiciones de las columnas se resuelven una sola vez a partir del
+    encabezado, y el tipo de cada fila elige su función de construcción en
+    una tabla precalculada, evitando crear un diccionario por fila.
+
+    Para reproducir csv.DictReader, a las filas más cortas que el
+    encabezado se les agrega None, y las columnas ausentes del encabezado
+    toman un valor por defecto (None para la fecha de un Premium, "" en los
+    demás casos). Al actualizar, una fecha vacía se trata igual que una
+    ausente: el Premium recibe la fecha por defecto y la fila la informa
+    como omitida. En una importación normal una fecha vacía sigue siendo
+    un error de validación.
+
+    Atributos privados:
+        __ancho (int): Cantidad de columnas del encabezado
+        __relleno (list): Valores agregados a cada fila para las columnas
+            ausentes del encabezado (vacío si están todas)
+        __posiciones (tuple): Posición de cada columna de ENCABEZADOS_CSV
+        __fecha_premium (int): Posición de campo_extra2 para un Premium
+        __constructores (dict): Tipo -> función que arma (clase, datos)
+    """
+
+    def __init__(self, encabezados):
+        """
+        Resuelve las posiciones de las columnas.
+
+        Args:
+            encabezados (list): Nombres de las columnas del archivo
+        """
+        ancho = len(encabezados)
+        # Con nombres repetidos gana el último, igual que en csv.DictReader
+        posiciones = {nombre: i for i, nombre in enumerate(encabezados)}
+        faltan = any(columna not in posiciones for columna in ENCABEZADOS_CSV)
+
+        self.__ancho = ancho
+        # Tras el relleno, la posición ancho vale None y ancho + 1 vale ""
+        self.__relleno = [None, ""] if faltan else []
+        self.__posiciones = tuple(
+            posiciones.get(columna, ancho + 1) for columna in ENCABEZADOS_CSV
+        )
+        self.__fecha_premium = posiciones.get("campo_extra2", ancho)
+        self.__constructores = {
+            ClienteRegular.TIPO: self._datos_regular,
+            ClientePremium.TIPO: self._datos_premium,
+            ClienteCorporativo.TIPO: self._datos_corporativo,
+        }
+
+    def _completar(self, fila):
+        """
+        Ajusta la fila al ancho del encabezado (los valores sobrantes se
+        ignoran y los faltantes son None) y agrega los valores de las
+        columnas ausentes del encabezado.
+        """
+        ancho = self.__ancho
+        if len(fila) != ancho:
+            fila = list(fila[:ancho]) + [None] * (ancho - len(fila))
+        if self.__relleno:
+            fila = fila + self.__relleno
+        return fila
+
+    def _datos_comunes(self, fila):
+        """Obtiene nombre, email, teléfono y dirección de una fila completa."""
+        _, nombre, email, telefono, direccion = self.__posiciones[:5]
+        return [
+            fila[nombre].strip(),
+            fila[email].strip(),
+            fila[telefono].strip(),
+            fila[direccion].strip(),
+        ]
+
+    def _datos_base(self, fila):
+        """Arma la clase y los datos de un cliente sin tipo específico."""
+        return Cliente, self._datos_comunes(fila)
+
+    def _datos_regular(self, fila):
+        """Arma la clase y los datos de un cliente regular."""
+        datos = self._datos_comunes(fila)
+        datos.append(int(fila[self.__posiciones[5]] or 0))
+        return ClienteRegular, datos
+
+    def _datos_premium(self, fila):
+        """Arma la clase y los datos de un cliente premium."""
+        datos = self._datos_comunes(fila)
+        fecha = fila[self.__fecha_premium]
+        # Pocas fechas distintas se repiten en muchas filas: se comparten
+        if fecha:
+            fecha = sys.intern(fecha)
+        datos += [float(fila[self.__posiciones[5]] or 10), fecha]
+        return ClientePremium, datos
+
+    def _datos_corporativo(self, fila):
+        """Arma la clase y los datos de un cliente corporativo."""
+        datos = self._datos_comunes(fila)
+        extra1, extra2, extra3 = self.__posiciones[5:]
+        # La empresa se repite en cada uno de sus contactos (el RUT se
+        # comparte en ClienteCorporativo); el contacto no suele repetirse
+        datos += [
+            sys.intern(fila[extra1].strip()),
+            fila[extra2].strip(),
+            fila[extra3].strip(),
+        ]
+        return ClienteCorporativo, datos
+
+    def construir_bloque(self, filas, validar=True, actualizar=False):
+        """
+        Convierte un bloque de filas posicionales en clientes, sin detenerse
+        en las filas inválidas.
+
+        Args:
+            filas (list): Filas del CSV como listas de valores
+            validar (bool): Si se validan los datos de las filas
+            actualizar (bool): Si las filas actualizan clientes existentes
+                (una fecha vacía se informa como omitida en lugar de fallar)
+
+        Returns:
+            list: Por cada fila, una tupla (cliente, rut_normalizado, error,
+                omitidos): cliente es None si la fila es inválida,
+                rut_normalizado es None si no es corporativa, error es el
+                mensaje del error o None, y omitidos son los campos que la
+                fila no informa (ver FECHA_OMITIDA)
+        """
+        posicion_tipo = self.__posiciones[0]
+        posicion_rut = self.__posiciones[6]
+        constructores = self.__constructores
+        datos_base = self._datos_base
+
+        filas = [self._completar(fila) for fila in filas]
+        tipos = [fila[posicion_tipo] for fila in filas]
+
+        # Los RUT corporativos del bloque se validan en una sola pasada; las
+        # filas incompletas quedan para la validación individual
+        corporativas = [
+            indice
+            for indice, tipo in enumerate(tipos)
+            if tipo is not None
+            and tipo.strip() == ClienteCorporativo.TIPO
+            and filas[indice][posicion_rut] is not None
+        ]
+        ruts = [filas[indice][posicion_rut].strip() for indice in corporativas]
+        if validar:
+            normalizados, codigos = normalizar_ruts(ruts)
+        else:
+            normalizados = [
+                rut.replace(".", "").replace(" ", "").upper() for rut in ruts
+            ]
+            codigos = [VALIDO] * len(ruts)
+        verificados = dict(zip(corporativas, zip(normalizados, codigos)))
+
+        resultados = []
+        for indice, (fila, tipo) in enumerate(zip(filas, tipos)):
+            rut = verificados.get(indice)
+            try:
+                clase, datos = constructores.get(tipo.strip(), datos_base)(fila)
+                if actualizar and clase is ClientePremium and not datos[5]:
+                    datos[5] = None
+                if not validar:
+                    cliente = clase.desde_datos_confiables(*datos)
+                elif rut is not None:
+                    if rut[1] != VALIDO:
+                        # Reproduce la excepción exacta de la validación individual
+                        validar_rut(datos[5])
+                    cliente = clase(*datos, verificar_rut=False)
+                else:
+                    cliente = clase(*datos)
+            except Exception as e:
+                resultados.append((None, None, str(e), SIN_OMITIDOS))
+                continue
+            omitidos = SIN_OMITIDOS
+            if clase is ClientePremium and datos[5] is None:
+                omitidos = FECHA_OMITIDA
+            resultados.append((cliente, rut[0] if rut else None, None, omitidos))
+        return resultados
+
+
+class LectorCSV:
+    """
+    Lector de filas de un CSV de clientes abierto en modo binario, que sabe
+    en qué byte del archivo termina cada fila leída.
+
+    Conocer esa posición permite informar el avance de una importación y
+    retomarla más tarde desde la última fila confirmada.
+
+    Atributos privados:
+        __archivo (file): Archivo CSV abierto en modo binario
+        __encabezados (list): Nombres de las columnas del archivo
+        __posicion (int): Byte donde termina la última fila leída
+    """
+
+    def __init__(self, archivo, desde=None):
+        """
+        Lee el encabezado y deja el lector listo para recorrer las filas.
+
+        Args:
+            archivo (file): Archivo CSV abierto en modo binario ("rb")
+            desde (int): Byte desde el que continuar la lectura (debe ser el
+                inicio de una fila); None para leer desde la primera fila
+        """
+        encabezado = archivo.readline().decode("utf-8")
+        self.__encabezados = next(csv.reader([encabezado]), [])
+        self.__archivo = archivo
+        self.__posicion = archivo.tell()
+        if desde is not None and desde > self.__posicion:
+            archivo.seek(desde)
+            self.__posicion = desde
+
+    @property
+    def encabezados(self):
+        """Nombres de las columnas del archivo."""
+        return self.__encabezados
+
+    @property
+    def posicion(self):
+        """Byte donde termina la última fila leída."""
+        return self.__posicion
+
+    def _lineas(self):
+        """Entrega las líneas del archivo decodificadas, avanzando la posición."""
+        for linea in self.__archivo:
+            self.__posicion += len(linea)
+            yield linea.decode("utf-8")
+
+    def filas(self):
+        """
+        Recorre las filas restantes como listas de valores, sin armar un
+        diccionario por fila (las líneas en blanco se omiten).
+        Al entregar cada fila, `posicion` apunta al byte donde termina.
+        """
+        for fila in csv.reader(self._lineas()):
+            if fila:
+                yield fila
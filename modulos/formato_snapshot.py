@@ -0,0 +1,221 @@
+"""
+Módulo del formato binario de snapshots.
+Guarda todos los clientes en un archivo compacto que se carga mucho más
+rápido que el CSV: no hay que parsear texto ni volver a validar.
+
+Estructura del archivo (enteros little-endian):
+    encabezado  ENCABEZADO_SNAPSHOT: magia, versión, cantidad de clientes,
+                tamaño de cada sección y firma HMAC-SHA256 del resto
+    cadenas     Tabla de textos distintos en UTF-8, separados por "\\0"
+                (el índice 0 es el texto vacío)
+    registros   Un REGISTRO_SNAPSHOT por cliente, con índices a la tabla
+    metadatos   JSON con datos del gestor (huellas de importación)
+"""
+
+import hashlib
+import hmac
+import json
+import struct
+from .cliente import Cliente
+from .cliente_regular import ClienteRegular
+from .cliente_premium import ClientePremium
+from .cliente_corporativo import ClienteCorporativo
+from .excepciones import DatosInvalidosError
+
+# Identificador del formato y versión actual (cambia si cambia la estructura)
+MAGIA_SNAPSHOT = b"GICS"
+VERSION_SNAPSHOT = 1
+
+# magia, versión, reservado, clientes, bytes de cadenas, bytes de registros,
+# bytes de metadatos, firma
+ENCABEZADO_SNAPSHOT = struct.Struct("<4sHHQQQQ32s")
+
+# tipo, nombre, email, teléfono, dirección, extra1, extra2, extra3 (índices a
+# la tabla de cadenas) y el valor numérico del tipo (puntos o descuento)
+REGISTRO_SNAPSHOT = struct.Struct("<B7Id")
+
+# Código del tipo en cada registro -> clase de cliente
+TIPOS_SNAPSHOT = (Cliente, ClienteRegular, ClientePremium, ClienteCorporativo)
+CODIGOS_SNAPSHOT = {clase.TIPO: codigo for codigo, clase in enumerate(TIPOS_SNAPSHOT)}
+# Las filas CSV de clientes sin tipo específico llevan el tipo vacío
+CODIGOS_SNAPSHOT[""] = 0
+
+
+def _firmar(clave, encabezado, *secciones):
+    """Firma HMAC-SHA256 del encabezado (sin su firma) y de las secciones."""
+    firma = hmac.new(clave, encabezado[:-32], digestmod=hashlib.sha256)
+    for seccion in secciones:
+        firma.update(seccion)
+    return firma.digest()
+
+
+def escribir_snapshot(archivo, filas, metadatos, clave):
+    """
+    Escribe un snapshot a partir de las filas CSV de los clientes.
+
+    Args:
+        archivo (file): Archivo abierto en modo binario ("wb")
+        filas (iterable): Tuplas en el orden de ENCABEZADOS_CSV
+        metadatos (dict): Datos adicionales serializables como JSON
+        clave (bytes): Clave con que se firma el snapshot
+
+    Returns:
+        int: Cantidad de clientes escritos
+
+    Raises:
+        DatosInvalidosError: Si algún texto contiene el carácter nulo
+    """
+    cadenas = {"": 0}
+    registros = bytearray()
+    empaquetar = REGISTRO_SNAPSHOT.pack
+    cantidad = 0
+    regular, premium, corporativo = range(1, len(TIPOS_SNAPSHOT))
+
+    def indice(texto):
+        posicion = cadenas.get(texto)
+        if posicion is None:
+            posicion = cadenas[texto] = len(cadenas)
+        return posicion
+
+    for tipo, nombre, email, telefono, direccion, extra1, extra2, extra3 in filas:
+        codigo = CODIGOS_SNAPSHOT[tipo]
+        if codigo == corporativo:
+            extras = (indice(extra1), indice(extra2), indice(extra3))
+            numero = 0.0
+        elif codigo == premium:
+            extras = (indice(extra2), 0, 0)
+            numero = extra1
+        else:
+            extras = (0, 0, 0)
+            numero = extra1 if codigo == regular else 0.0
+        registros += empaquetar(
+            codigo,
+            indice(nombre),
+            indice(email),
+            indice(telefono),
+            indice(direccion),
+            *extras,
+            numero,
+        )
+        cantidad += 1
+
+    tabla = "\0".join(cadenas)
+    if tabla.count("\0") != len(cadenas) - 1:
+        raise DatosInvalidosError("Los textos no pueden contener el carácter nulo")
+    tabla = tabla.encode("utf-8")
+    datos = json.dumps(metadatos).encode("utf-8")
+
+    encabezado = ENCABEZADO_SNAPSHOT.pack(
+        MAGIA_SNAPSHOT,
+        VERSION_SNAPSHOT,
+        0,
+        cantidad,
+        len(tabla),
+        len(registros),
+        len(datos),
+        bytes(32),
+    )
+    firma = _firmar(clave, encabezado, tabla, registros, datos)
+    archivo.write(encabezado[:-32] + firma)
+    archivo.write(tabla)
+    archivo.write(registros)
+    archivo.write(datos)
+    return cantidad
+
+
+def _leer_encabezado(archivo):
+    """
+    Lee y comprueba el encabezado de un snapshot.
+
+    Returns:
+        tuple: (encabezado en bytes, clientes, bytes de cadenas,
+            bytes de registros, bytes de metadatos, firma)
+
+    Raises:
+        DatosInvalidosError: Si no es un snapshot o su versión no se soporta
+    """
+    encabezado = archivo.read(ENCABEZADO_SNAPSHOT.size)
+    if len(encabezado) < ENCABEZADO_SNAPSHOT.size:
+        raise DatosInvalidosError("El snapshot está incompleto")
+    magia, version, _, *tamanos, firma = ENCABEZADO_SNAPSHOT.unpack(encabezado)
+    if magia != MAGIA_SNAPSHOT:
+        raise DatosInvalidosError("El archivo no es un snapshot de clientes")
+    if version != VERSION_SNAPSHOT:
+        raise DatosInvalidosError(f"Versión de snapshot no soportada: {version}")
+    return (encabezado, *tamanos, firma)
+
+
+def leer_metadatos_snapshot(archivo):
+    """
+    Lee sólo los metadatos de un snapshot, sin cargar ni verificar clientes.
+
+    Args:
+        archivo (file): Archivo abierto en modo binario ("rb")
+
+    Returns:
+        dict: Metadatos guardados con el snapshot
+
+    Raises:
+        DatosInvalidosError: Si el snapshot no es válido
+    """
+    _, _, bytes_cadenas, bytes_registros, bytes_datos, _ = _leer_encabezado(archivo)
+    archivo.seek(ENCABEZADO_SNAPSHOT.size + bytes_cadenas + bytes_registros)
+    try:
+        return json.loads(archivo.read(bytes_datos).decode("utf-8"))
+    except ValueError:
+        raise DatosInvalidosError("Los metadatos del snapshot están dañados")
+
+
+def leer_snapshot(archivo, clave):
+    """
+    Lee un snapshot completo verificando antes su firma.
+
+    Args:
+        archivo (file): Archivo abierto en modo binario ("rb")
+        clave (bytes): Clave con que se firmó el snapshot
+
+    Returns:
+        tuple: (clientes, metadatos): clientes es un iterador que construye
+            cada Cliente sin repetir validaciones
+
+    Raises:
+        DatosInvalidosError: Si el snapshot no es válido, está incompleto o
+            su firma no coincide
+    """
+    encabezado, cantidad, bytes_cadenas, bytes_registros, bytes_datos, firma = (
+        _leer_encabezado(archivo)
+    )
+    cuerpo = archivo.read()
+    if (
+        len(cuerpo) != bytes_cadenas + bytes_registros + bytes_datos
+        or bytes_registros != cantidad * REGISTRO_SNAPSHOT.size
+    ):
+        raise DatosInvalidosError("El snapshot está incompleto")
+    if not hmac.compare_digest(firma, _firmar(clave, encabezado, cuerpo)):
+        raise DatosInvalidosError("La firma del snapshot no coincide")
+
+    cadenas = cuerpo[:bytes_cadenas].decode("utf-8").split("\0")
+    registros = memoryview(cuerpo)[bytes_cadenas : bytes_cadenas + bytes_registros]
+    metadatos = json.loads(cuerpo[bytes_cadenas + bytes_registros :].decode("utf-8"))
+    return _construir_clientes(registros, cadenas), metadatos
+
+
+def _construir_clientes(registros, cadenas):
+    """Itera los clientes de los registros de un snapshot ya verificado."""
+    # Código -> constructor sin validaciones de la clase
+    constructores = [clase.desde_datos_confiables for clase in TIPOS_SNAPSHOT]
+    regular, premium, corporativo = range(1, len(TIPOS_SNAPSHOT))
+
+    for codigo, *textos, numero in REGISTRO_SNAPSHOT.iter_unpack(registros):
+        nombre, email, telefono, direccion, extra1, extra2, extra3 = (
+            cadenas[posicion] for posicion in textos
+        )
+        construir = constructores[codigo]
+        if codigo == regular:
+            yield construir(nombre, email, telefono, direccion, numero)
+        elif codigo == premium:
+            yield construir(nombre, email, telefono, direccion, numero, extra1)
+        elif codigo == corporativo:
+            yield construir(nombre, email, telefono, direccion, extra1, extra2, extra3)
+        else:
+            yield construir(nombre, email, telefono, direccion)
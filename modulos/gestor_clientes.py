@@ -3,21 +3,202 @@ Módulo del Gestor de Clientes.
 Implementa todas las operaciones CRUD y manejo de archivos del sistema.
 """
 
+import asyncio
 import csv
+import hashlib
+import heapq
+import hmac
+import io
+import json
 import logging
+import math
 import os
+import secrets
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice, repeat
 from .cliente import Cliente
 from .cliente_regular import ClienteRegular
 from .cliente_premium import ClientePremium
 from .cliente_corporativo import ClienteCorporativo
+from .almacenes import AlmacenColumnar, AlmacenObjetos
+from .formato_csv import (
+    CAMPOS_EXTRA_CSV,
+    ENCABEZADOS_CSV,
+    ConstructorClientes,
+    LectorCSV,
+    cliente_a_tupla,
+)
+from .compresion import (
+    NIVEL_COMPRESION_POR_DEFECTO,
+    abrir_lectura,
+    codec_de,
+    envolver_lectura,
+    escritura_atomica,
+    esta_comprimido,
+)
+from .formato_snapshot import (
+    escribir_snapshot,
+    leer_metadatos_snapshot,
+    leer_snapshot,
+)
+from .indice_busqueda import IndiceTrigramas
+from .indice_ordenado import IndiceOrdenado
 from .excepciones import (
     ClienteExistenteError,
     ClienteNoEncontradoError,
     DatosInvalidosError,
 )
 
+# Backends de almacenamiento disponibles por nombre
+ALMACENES = {
+    "objetos": AlmacenObjetos,
+    "columnar": AlmacenColumnar,
+}
+
+# Sufijo del archivo con la firma HMAC de cada CSV exportado
+EXTENSION_FIRMA = ".firma"
+
+# Sufijo del archivo con el punto de control de una importación reanudable
+EXTENSION_PUNTO_CONTROL = ".progreso"
+
+# Sufijo del archivo donde se acumulan los cambios exportados desde la última
+# exportación completa
+EXTENSION_CAMBIOS = ".cambios"
+
+# Primera columna del archivo de cambios: alta o modificación, baja, y la marca
+# que confirma un lote completo (las filas de un lote sin marca se descartan)
+OPERACION_ALTA = "A"
+OPERACION_BAJA = "B"
+OPERACION_CONFIRMAR = "C"
+
+# Extensión del snapshot binario, guardado junto al CSV (clientes.snapshot)
+EXTENSION_SNAPSHOT = ".snapshot"
+
+# Sufijo del snapshot con los clientes confirmados de una importación
+# reanudable, para continuarla en otro proceso (clientes.csv.progreso.snapshot)
+EXTENSION_ESTADO_REANUDACION = EXTENSION_PUNTO_CONTROL + EXTENSION_SNAPSHOT
+
+# Segundos mínimos entre dos guardados de ese snapshot, y múltiplo del tiempo
+# que tomó el último guardado que debe pasar antes del siguiente (cada uno
+# escribe todos los clientes, así que se espacian a medida que crecen)
+INTERVALO_REANUDACION = 5
+FACTOR_INTERVALO_REANUDACION = 10
+
+# Filas que se leen y validan juntas durante una importación
+TAMANO_BLOQUE_IMPORTACION = 1000
+
+# Rangos del archivo por proceso en una importación en paralelo (más rangos
+# que procesos reparten mejor la carga cuando unas filas cuestan más que otras)
+RANGOS_POR_PROCESO = 4
+
+# Bytes que se leen de una vez al buscar los límites de esos rangos
+TAMANO_LECTURA_DIVISION = 1 << 20
+
+# Campos numéricos con índice ordenado y el tipo de cliente que los posee
+CAMPOS_ORDENADOS = {
+    "puntos_acumulados": ClienteRegular.TIPO,
+    "descuento_exclusivo": ClientePremium.TIPO,
+}
+
+
+def _dividir_en_filas(ruta, inicio, partes):
+    """
+    Divide un archivo, desde el byte `inicio`, en rangos de tamaño similar
+    que empiezan y terminan en un límite de fila.
+
+    Un salto de línea solo separa filas si está fuera de comillas: dentro
+    de un campo entre comillas (una dirección de varias líneas) no. Como en
+    un CSV las comillas de un campo van siempre de a pares (las internas se
+    duplican), un salto está fuera de comillas si antes de él, desde el
+    inicio de los datos, hay una cantidad par de comillas.
+
+    Args:
+        ruta (str): Ruta del archivo
+        inicio (int): Byte donde empieza la primera fila de datos
+        partes (int): Cantidad de rangos deseada
+
+    Returns:
+        list: Tuplas (inicio, fin) de cada rango, en orden; un archivo
+            comprimido no se puede recorrer por bytes y queda en un solo
+            rango (inicio, None)
+    """
+    if esta_comprimido(ruta):
+        return [(inicio, None)]
+
+    tamano = os.path.getsize(ruta)
+    objetivos = iter(
+        [inicio + (tamano - inicio) * parte // partes for parte in range(1, partes)]
+    )
+    objetivo = next(objetivos, None)
+    limites = [inicio]
+    # Byte del archivo donde empieza el bloque leído, y comillas antes de él
+    leido = inicio
+    comillas = 0
+
+    with open(ruta, "rb") as archivo:
+        archivo.seek(inicio)
+        while objetivo is not None:
+            bloque = archivo.read(TAMANO_LECTURA_DIVISION)
+            if not bloque:
+                break
+            # Comillas del bloque contadas hasta la posición `marca`
+            marca = 0
+            comillas_marca = comillas
+            while objetivo is not None:
+                # Primer salto desde el byte anterior al objetivo (o el
+                # siguiente al último salto revisado)
+                salto = bloque.find(b"\n", max(objetivo - 1 - leido, marca))
+                if salto < 0:
+                    break
+                comillas_marca += bloque.count(b'"', marca, salto)
+                marca = salto + 1
+                if comillas_marca % 2:
+                    continue
+                limite = leido + marca
+                if limites[-1] < limite < tamano:
+                    limites.append(limite)
+                while objetivo is not None and objetivo <= limite:
+                    objetivo = next(objetivos, None)
+            comillas += bloque.count(b'"')
+            leido += len(bloque)
+
+    limites.append(tamano)
+    return [(a, b) for a, b in zip(limites, limites[1:]) if a < b]
+
+
+def _procesar_rango(ruta, inicio, fin, validar, actualizar=False):
+    """
+    Construye los clientes de las filas de un rango de bytes del archivo.
+    Se ejecuta en un proceso aparte durante la importación en paralelo.
+
+    Args:
+        ruta (str): Ruta del archivo CSV
+        inicio (int): Byte donde empieza la primera fila del rango
+        fin (int): Byte donde termina la última fila del rango (None: hasta
+            el final del archivo)
+        validar (bool): Si se validan los datos de las filas
+        actualizar (bool): Si las filas actualizan clientes existentes
+
+    Returns:
+        list: Resultado de ConstructorClientes.construir_bloque para las filas
+            del rango
+    """
+    filas = []
+    with abrir_lectura(ruta) as archivo:
+        lector = LectorCSV(archivo, desde=inicio)
+        if fin is None:
+            filas.extend(lector.filas())
+        elif lector.posicion < fin:
+            for fila in lector.filas():
+                filas.append(fila)
+                if lector.posicion >= fin:
+                    break
+    constructor = ConstructorClientes(lector.encabezados)
+    return constructor.construir_bloque(filas, validar, actualizar)
+
 
 class GestorClientes:
     """
@@ -25,23 +206,86 @@ class GestorClientes:
     manejo de archivos y logging.
 
     Atributos privados:
-        __clientes (list): Lista de objetos Cliente
+        __almacen (AlmacenObjetos | AlmacenColumnar): Backend con los clientes
+        __indice_email (dict): Índice primario email normalizado -> identificador
+        __indice_nombres (IndiceTrigramas): Índice de trigramas sobre nombres
+        __por_tipo (dict): Tipo de cliente -> identificadores de ese tipo
+        __indice_rut (dict): RUT de empresa -> identificadores de clientes corporativos
+        __indices_ordenados (dict): Campo numérico -> IndiceOrdenado para top-K
+        __sumas (dict): Campo numérico -> suma acumulada de sus valores
+        __verificar (bool): Si se contrastan las estadísticas con un recálculo
+        __importaciones (dict): Ruta absoluta -> huella del archivo importado
+            (tamaño, fecha de modificación, hash y bytes ya consumidos)
+        __modificados (dict): Identificadores agregados o modificados desde la
+            última exportación (usado como conjunto ordenado)
+        __eliminados (dict): Emails eliminados desde la última exportación
+        __base_exportada (bool): Si el CSV completo ya se exportó, de modo que
+            los cambios posteriores pueden exportarse como delta
         __ruta_csv (str): Ruta del archivo CSV
         __ruta_log (str): Ruta del archivo de log
+        __nivel_compresion (int): Nivel de compresión de exportaciones y backups
         __logger (logging.Logger): Logger del sistema
     """
 
-    def __init__(self, ruta_csv="datos/clientes.csv", ruta_log="logs/app.log"):
+    def __init__(
+        self,
+        ruta_csv="datos/clientes.csv",
+        ruta_log="logs/app.log",
+        verificar=False,
+        almacen="objetos",
+        nivel_compresion=NIVEL_COMPRESION_POR_DEFECTO,
+    ):
         """
         Inicializa el gestor de clientes.
 
         Args:
             ruta_csv (str): Ruta del archivo CSV
             ruta_log (str): Ruta del archivo de log
+            verificar (bool): Si True, cada cálculo de estadísticas se contrasta
+                con un recálculo completo (modo de verificación para pruebas)
+            almacen (str | objeto): Backend de almacenamiento: "objetos"
+                (default), "columnar" o una instancia vacía de almacén
+            nivel_compresion (int): Nivel de 0 a 9 para las exportaciones
+                comprimidas (.gz, .xz, .bz2) y los backups
+
+        Raises:
+            DatosInvalidosError: Si el backend o el nivel de compresión no
+                son válidos
         """
-        self.__clientes = []
+        if not (isinstance(nivel_compresion, int) and 0 <= nivel_compresion <= 9):
+            raise DatosInvalidosError("El nivel de compresión debe estar entre 0 y 9")
+        if isinstance(almacen, str):
+            if almacen not in ALMACENES:
+                raise DatosInvalidosError(
+                    f"Almacén '{almacen}' no válido. Use: {', '.join(ALMACENES)}"
+                )
+            almacen = ALMACENES[almacen]()
+        self.__almacen = almacen
+        self.__indice_email = {}
+        self.__huella_emails = 0
+        self.__indice_nombres = IndiceTrigramas()
+        self.__por_tipo = {
+            Cliente.TIPO: {},
+            ClienteRegular.TIPO: {},
+            ClientePremium.TIPO: {},
+            ClienteCorporativo.TIPO: {},
+        }
+        self.__indice_rut = {}
+        self.__indices_ordenados = {
+            campo: IndiceOrdenado() for campo in CAMPOS_ORDENADOS
+        }
+        self.__sumas = {campo: 0 for campo in CAMPOS_ORDENADOS}
+        self.__verificar = verificar
+        self.__importaciones = {}
+        self.__modificados = {}
+        self.__eliminados = {}
+        self.__base_exportada = False
+        self.__siguiente_id = 0
+        self.__observador = self._al_cambiar_cliente
+        self.__almacen.vincular(self.__observador)
         self.__ruta_csv = ruta_csv
         self.__ruta_log = ruta_log
+        self.__nivel_compresion = nivel_compresion
 
         # Configurar logging
         self.__logger = self._configurar_logging()
@@ -112,6 +356,181 @@ class GestorClientes:
         log_mensaje = f"{accion} - {mensaje}"
         self.__logger.log(nivel, log_mensaje)
 
+    # ======================== ÍNDICES ========================
+
+    @staticmethod
+    def _normalizar_email(email):
+        """Normaliza un email para usarlo como clave del índice primario."""
+        return email.strip().lower()
+
+    @staticmethod
+    def _normalizar_rut(rut):
+        """Normaliza un RUT (sin puntos ni espacios, en mayúsculas)."""
+        return rut.replace(".", "").replace(" ", "").upper()
+
+    @staticmethod
+    def _huella_email(email):
+        """
+        Huella de 64 bits de un email. La huella de los clientes cargados es
+        el XOR de la de cada email, así que se mantiene al insertar y retirar
+        sin recorrer el gestor.
+        """
+        huella = hashlib.blake2b(email.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(huella, "little")
+
+    def _insertar(self, cliente, rut_normalizado=None, lote=None):
+        """
+        Inserta un cliente en el almacenamiento y en los índices, sin validar
+        duplicados ni registrar actividad.
+
+        Args:
+            cliente (Cliente): Cliente a insertar
+            rut_normalizado (str): RUT corporativo ya normalizado en lote
+                (None: se normaliza aquí)
+            lote (tuple): Lote de _lote_vacio donde acumular las entradas
+                del índice de nombres y de los índices ordenados, que se
+                agregan juntas con _indexar_lote (None: se indexan aquí)
+
+        Returns:
+            int: Identificador interno asignado
+        """
+        id_cliente = self.__siguiente_id
+        self.__siguiente_id += 1
+
+        self.__almacen.insertar(id_cliente, cliente)
+        self.__indice_email[cliente.email] = id_cliente
+        self.__huella_emails ^= self._huella_email(cliente.email)
+        if lote is None:
+            self.__indice_nombres.agregar(id_cliente, cliente.nombre)
+        else:
+            lote[0].append((id_cliente, cliente.nombre))
+        self.__por_tipo[cliente.TIPO][id_cliente] = None
+        if cliente.TIPO == ClienteCorporativo.TIPO:
+            rut = rut_normalizado or self._normalizar_rut(cliente.rut_empresa)
+            self.__indice_rut.setdefault(rut, {})[id_cliente] = None
+        for campo, tipo in CAMPOS_ORDENADOS.items():
+            if cliente.TIPO == tipo:
+                valor = getattr(cliente, campo)
+                if lote is None:
+                    self.__indices_ordenados[campo].agregar(id_cliente, valor)
+                else:
+                    lote[1][campo].append((id_cliente, valor))
+                self.__sumas[campo] += valor
+        self.__modificados[id_cliente] = None
+        return id_cliente
+
+    @staticmethod
+    def _lote_vacio():
+        """
+        Crea un lote de inserción: (nombres, ordenados) con los pares
+        (id_cliente, nombre) y, por campo ordenado, los pares
+        (id_cliente, valor) pendientes de indexar.
+        """
+        return [], {campo: [] for campo in CAMPOS_ORDENADOS}
+
+    def _indexar_lote(self, lote):
+        """
+        Agrega a los índices las entradas acumuladas en un lote. Tanto los
+        índices ordenados como el de nombres las guardan sin procesar hasta
+        la primera consulta o modificación, así una importación de muchos
+        bloques ordena e indexa una sola vez en vez de una vez por cliente.
+
+        Args:
+            lote (tuple): Lote de _lote_vacio ya usado en _insertar
+        """
+        nombres, ordenados = lote
+        self.__indice_nombres.agregar_varios(nombres)
+        for campo, pares in ordenados.items():
+            if pares:
+                self.__indices_ordenados[campo].agregar_varios(pares)
+
+    def _insertar_lote(self, clientes):
+        """
+        Inserta muchos clientes a la vez, como _insertar, indexándolos con
+        _indexar_lote (usado por agregar_clientes y al cargar un snapshot).
+
+        Args:
+            clientes (iterable): Clientes a insertar, sin duplicados
+
+        Returns:
+            int: Cantidad de clientes insertados
+        """
+        lote = self._lote_vacio()
+        cantidad = 0
+        try:
+            for cliente in clientes:
+                self._insertar(cliente, lote=lote)
+                cantidad += 1
+        finally:
+            # Los ya insertados quedan indexados aunque falle uno
+            self._indexar_lote(lote)
+        return cantidad
+
+    def _retirar(self, cliente):
+        """
+        Retira un cliente del almacenamiento y de los índices.
+
+        Args:
+            cliente (Cliente): Cliente a retirar
+        """
+        id_cliente = self.__indice_email.pop(cliente.email)
+        self.__huella_emails ^= self._huella_email(cliente.email)
+        self.__almacen.eliminar(id_cliente)
+        self.__indice_nombres.eliminar(id_cliente)
+        del self.__por_tipo[cliente.TIPO][id_cliente]
+        if cliente.TIPO == ClienteCorporativo.TIPO:
+            self._desindexar_rut(cliente.rut_empresa, id_cliente)
+        for campo, tipo in CAMPOS_ORDENADOS.items():
+            if cliente.TIPO == tipo:
+                self.__indices_ordenados[campo].eliminar(id_cliente)
+                self.__sumas[campo] -= getattr(cliente, campo)
+        self.__modificados.pop(id_cliente, None)
+        self.__eliminados[cliente.email] = None
+
+    def _al_cambiar_cliente(self, cliente, campo, anterior, nuevo):
+        """
+        Mantiene los índices al día cuando un cliente gestionado cambia, y lo
+        marca como pendiente de exportar.
+
+        Raises:
+            ClienteExistenteError: Si el nuevo email ya pertenece a otro cliente
+        """
+        id_cliente = self.__indice_email[cliente.email]
+
+        if campo == "email" and nuevo != anterior:
+            if nuevo in self.__indice_email:
+                mensaje = f"Cliente con email {nuevo} ya existe"
+                self.registrar_actividad("ERROR", mensaje)
+                raise ClienteExistenteError(mensaje)
+            self.__indice_email[nuevo] = self.__indice_email.pop(anterior)
+            self.__huella_emails ^= self._huella_email(anterior)
+            self.__huella_emails ^= self._huella_email(nuevo)
+            # En el CSV exportado el cliente figura con el email anterior
+            self.__eliminados[anterior] = None
+
+        elif campo == "nombre":
+            self.__indice_nombres.actualizar(id_cliente, nuevo)
+
+        elif campo == "rut_empresa":
+            self._desindexar_rut(anterior, id_cliente)
+            rut = self._normalizar_rut(nuevo)
+            self.__indice_rut.setdefault(rut, {})[id_cliente] = None
+
+        elif campo in CAMPOS_ORDENADOS:
+            self.__indices_ordenados[campo].actualizar(id_cliente, nuevo)
+            self.__sumas[campo] += nuevo - anterior
+
+        self.__modificados[id_cliente] = None
+
+    def _desindexar_rut(self, rut, id_cliente):
+        """Quita un cliente corporativo del índice por RUT."""
+        rut = self._normalizar_rut(rut)
+        clientes = self.__indice_rut.get(rut)
+        if clientes is not None:
+            clientes.pop(id_cliente, None)
+            if not clientes:
+                del self.__indice_rut[rut]
+
     # ======================== OPERACIONES CRUD ========================
 
     def agregar_cliente(self, cliente):
@@ -130,17 +549,98 @@ class GestorClientes:
             raise DatosInvalidosError("El objeto debe ser una instancia de Cliente")
 
         # Verificar si ya existe
-        if self.buscar_cliente(cliente.email):
+        if cliente.email in self.__indice_email:
             mensaje = f"Cliente con email {cliente.email} ya existe"
             self.registrar_actividad("ERROR", mensaje)
             raise ClienteExistenteError(mensaje)
 
-        self.__clientes.append(cliente)
+        self._insertar(cliente)
         self.registrar_actividad("ALTA", f"Cliente registrado: {cliente.email}")
 
+    def agregar_clientes(self, clientes, on_duplicate="omitir"):
+        """
+        Agrega un lote de clientes, registrando un solo resumen en el log.
+
+        Los duplicados se detectan contra el índice y dentro del mismo lote.
+        Primero se decide el resultado de cada elemento y luego se insertan
+        todos los clientes aceptados en un solo paso.
+
+        Args:
+            clientes (iterable): Clientes a agregar
+            on_duplicate (str): Qué hacer con un email ya registrado:
+                "omitir" (default) lo descarta, "reemplazar" sustituye al
+                cliente existente y "error" rechaza el lote completo
+
+        Returns:
+            list: Resultado de cada elemento, en el orden recibido:
+                "agregado", "reemplazado", "duplicado" o "invalido"
+
+        Raises:
+            ClienteExistenteError: Con on_duplicate="error", si algún email
+                ya existe (no se agrega ningún cliente del lote)
+            DatosInvalidosError: Si on_duplicate no es una opción válida
+        """
+        if on_duplicate not in ("omitir", "reemplazar", "error"):
+            raise DatosInvalidosError(
+                f"Opción on_duplicate '{on_duplicate}' no válida. "
+                "Use: omitir, reemplazar, error"
+            )
+
+        resultados = []
+        aceptados = {}  # email -> posición en resultados del cliente a insertar
+        lote = []
+
+        for cliente in clientes:
+            if not isinstance(cliente, Cliente):
+                resultados.append("invalido")
+                lote.append(None)
+                continue
+
+            email = cliente.email
+            registrado = email in self.__indice_email
+            existe = registrado or email in aceptados
+            if existe and on_duplicate == "error":
+                mensaje = f"Cliente con email {email} ya existe"
+                self.registrar_actividad("ERROR", f"Alta masiva rechazada: {mensaje}")
+                raise ClienteExistenteError(mensaje)
+
+            if existe and on_duplicate == "omitir":
+                resultados.append("duplicado")
+                lote.append(None)
+                continue
+
+            anterior = aceptados.get(email)
+            if anterior is not None:
+                # Un cliente posterior del lote reemplaza al anterior
+                resultados[anterior] = "duplicado"
+                lote[anterior] = None
+
+            aceptados[email] = len(resultados)
+            resultados.append("reemplazado" if registrado else "agregado")
+            lote.append(cliente)
+
+        nuevos = [cliente for cliente in lote if cliente is not None]
+        for cliente in nuevos:
+            id_existente = self.__indice_email.get(cliente.email)
+            if id_existente is not None:
+                self._retirar(self.__almacen.obtener(id_existente))
+        self._insertar_lote(nuevos)
+
+        self.registrar_actividad(
+            "ALTA",
+            f"Alta masiva: {resultados.count('agregado')} agregados, "
+            f"{resultados.count('reemplazado')} reemplazados, "
+            f"{resultados.count('duplicado')} duplicados, "
+            f"{resultados.count('invalido')} inválidos",
+        )
+        return resultados
+
     def buscar_cliente(self, email_o_nombre):
         """
         Busca un cliente por email o nombre (case-insensitive).
+        El email exacto se resuelve en tiempo constante mediante el índice
+        primario; en caso contrario se busca por nombre parcial en el índice
+        de trigramas y se retorna la primera coincidencia en orden de alta.
 
         Args:
             email_o_nombre (str): Email o nombre a buscar
@@ -150,23 +650,230 @@ class GestorClientes:
         """
         busqueda = email_o_nombre.lower()
 
-        for cliente in self.__clientes:
-            # Búsqueda por email
-            if cliente.email == busqueda.lower():
-                self.registrar_actividad(
-                    "CONSULTA", f"Cliente encontrado: {cliente.email}"
-                )
-                return cliente
-            # Búsqueda por nombre
-            if cliente.nombre.lower().find(busqueda) != -1:
-                self.registrar_actividad(
-                    "CONSULTA", f"Cliente encontrado por nombre: {cliente.nombre}"
-                )
-                return cliente
+        # Búsqueda por email
+        id_cliente = self.__indice_email.get(self._normalizar_email(busqueda))
+        if id_cliente is not None:
+            cliente = self.__almacen.obtener(id_cliente)
+            self.registrar_actividad("CONSULTA", f"Cliente encontrado: {cliente.email}")
+            return cliente
+
+        # Búsqueda por nombre
+        coincidencias = self.__indice_nombres.buscar(busqueda)
+        if coincidencias:
+            cliente = self.__almacen.obtener(min(coincidencias))
+            self.registrar_actividad(
+                "CONSULTA", f"Cliente encontrado por nombre: {cliente.nombre}"
+            )
+            return cliente
 
         self.registrar_actividad("CONSULTA", f"Cliente no encontrado: {email_o_nombre}")
         return None
 
+    def buscar_clientes(self, consulta, limite=None, desplazamiento=0):
+        """
+        Busca todos los clientes cuyo email coincide exactamente o cuyo
+        nombre contiene la consulta (case-insensitive).
+
+        Los resultados se entregan en orden de alta y de forma perezosa:
+        solo se materializa la página solicitada.
+
+        Args:
+            consulta (str): Email o nombre parcial a buscar
+            limite (int): Cantidad máxima de resultados (None: sin límite)
+            desplazamiento (int): Cantidad de resultados a omitir
+
+        Returns:
+            iterator: Iterador de objetos Cliente
+        """
+        busqueda = consulta.lower()
+        if not busqueda:
+            return self.iterar_clientes(limite, desplazamiento)
+
+        ids = self.__indice_nombres.buscar(busqueda)
+        id_email = self.__indice_email.get(self._normalizar_email(busqueda))
+        if id_email is not None:
+            ids.add(id_email)
+
+        self.registrar_actividad(
+            "CONSULTA", f"Búsqueda '{consulta}': {len(ids)} coincidencias"
+        )
+
+        if limite is None:
+            ordenados = sorted(ids)
+        else:
+            ordenados = heapq.nsmallest(desplazamiento + limite, ids)
+
+        return self._materializar(islice(ordenados, desplazamiento, None))
+
+    def _materializar(self, ids):
+        """
+        Convierte perezosamente identificadores internos en clientes,
+        omitiendo los que hayan sido eliminados entre tanto.
+
+        Args:
+            ids (iterable): Identificadores internos
+
+        Yields:
+            Cliente: Clientes aún registrados
+        """
+        for id_cliente in ids:
+            cliente = self.__almacen.obtener(id_cliente)
+            if cliente is not None:
+                yield cliente
+
+    def iterar_clientes(self, limite=None, desplazamiento=0):
+        """
+        Recorre los clientes en orden de alta sin copiar la colección.
+
+        Args:
+            limite (int): Cantidad máxima de clientes (None: sin límite)
+            desplazamiento (int): Cantidad de clientes a omitir
+
+        Returns:
+            iterator: Iterador de objetos Cliente
+        """
+        fin = None if limite is None else desplazamiento + limite
+        self.registrar_actividad(
+            "CONSULTA", f"Página solicitada: desde {desplazamiento}, límite {limite}"
+        )
+        return self._materializar(islice(self.__almacen.ids(), desplazamiento, fin))
+
+    def contar_clientes(self):
+        """
+        Retorna la cantidad de clientes registrados.
+
+        Returns:
+            int: Cantidad de clientes
+        """
+        return len(self.__almacen)
+
+    def _bucket_tipo(self, tipo):
+        """
+        Obtiene el bucket de clientes de un tipo.
+
+        Raises:
+            DatosInvalidosError: Si el tipo no existe
+        """
+        bucket = self.__por_tipo.get(tipo)
+        if bucket is None:
+            raise DatosInvalidosError(
+                f"Tipo de cliente '{tipo}' no válido. "
+                f"Use: {', '.join(self.__por_tipo)}"
+            )
+        return bucket
+
+    def listar_por_tipo(self, tipo):
+        """
+        Retorna los clientes de un tipo, en orden de alta.
+
+        Args:
+            tipo (str): Tipo de cliente (Regular, Premium, Corporativo o Cliente)
+
+        Returns:
+            list: Lista de objetos Cliente del tipo indicado
+
+        Raises:
+            DatosInvalidosError: Si el tipo no existe
+        """
+        clientes = list(self._materializar(self._bucket_tipo(tipo)))
+        self.registrar_actividad(
+            "CONSULTA", f"Listado por tipo {tipo}: {len(clientes)} clientes"
+        )
+        return clientes
+
+    def contar_por_tipo(self, tipo=None):
+        """
+        Cuenta los clientes de un tipo o de todos los tipos.
+
+        Args:
+            tipo (str): Tipo de cliente (None: conteo de cada tipo)
+
+        Returns:
+            int | dict: Cantidad del tipo indicado, o dict tipo -> cantidad
+
+        Raises:
+            DatosInvalidosError: Si el tipo no existe
+        """
+        if tipo is None:
+            return {nombre: len(bucket) for nombre, bucket in self.__por_tipo.items()}
+        return len(self._bucket_tipo(tipo))
+
+    def buscar_por_rut(self, rut):
+        """
+        Busca los clientes corporativos asociados al RUT de una empresa.
+
+        Args:
+            rut (str): RUT de la empresa, con o sin puntos
+
+        Returns:
+            list: Clientes corporativos con ese RUT, en orden de alta
+        """
+        ids = self.__indice_rut.get(self._normalizar_rut(rut), {})
+        clientes = list(self._materializar(ids))
+        self.registrar_actividad(
+            "CONSULTA", f"Búsqueda por RUT {rut}: {len(clientes)} clientes"
+        )
+        return clientes
+
+    def top_k(self, campo, k):
+        """
+        Obtiene los K clientes con mayor valor en un campo numérico.
+        Ante empates se prioriza el cliente registrado primero.
+
+        Args:
+            campo (str): "puntos_acumulados" (Regular) o "descuento_exclusivo" (Premium)
+            k (int): Cantidad de clientes a obtener
+
+        Returns:
+            list: Clientes ordenados de mayor a menor valor
+
+        Raises:
+            DatosInvalidosError: Si el campo no tiene índice ordenado
+        """
+        indice = self.__indices_ordenados.get(campo)
+        if indice is None:
+            raise DatosInvalidosError(
+                f"El campo '{campo}' no admite ranking. "
+                f"Use: {', '.join(CAMPOS_ORDENADOS)}"
+            )
+
+        clientes = list(
+            self._materializar(id_cliente for id_cliente, _ in indice.mayores(k))
+        )
+        self.registrar_actividad(
+            "CONSULTA", f"Top {k} por {campo}: {len(clientes)} clientes"
+        )
+        return clientes
+
+    def filtrar_clientes(self, campo, minimo=None, maximo=None):
+        """
+        Obtiene los clientes cuyo campo numérico está dentro de un rango.
+        Con el almacén columnar el filtro se evalúa sobre la columna completa.
+
+        Args:
+            campo (str): "puntos_acumulados" (Regular) o "descuento_exclusivo" (Premium)
+            minimo (int/float): Valor mínimo incluido (None: sin mínimo)
+            maximo (int/float): Valor máximo incluido (None: sin máximo)
+
+        Returns:
+            list: Clientes que cumplen el filtro, en orden de alta
+
+        Raises:
+            DatosInvalidosError: Si el campo no es numérico
+        """
+        tipo = CAMPOS_ORDENADOS.get(campo)
+        if tipo is None:
+            raise DatosInvalidosError(
+                f"El campo '{campo}' no admite filtros por rango. "
+                f"Use: {', '.join(CAMPOS_ORDENADOS)}"
+            )
+
+        ids = self.__almacen.filtrar_rango(campo, tipo, minimo, maximo)
+        self.registrar_actividad(
+            "CONSULTA", f"Filtro {campo} entre {minimo} y {maximo}: {len(ids)} clientes"
+        )
+        return list(self._materializar(ids))
+
     def listar_clientes(self):
         """
         Retorna la lista completa de clientes.
@@ -175,9 +882,9 @@ class GestorClientes:
             list: Lista de objetos Cliente
         """
         self.registrar_actividad(
-            "CONSULTA", f"Listado solicitado: {len(self.__clientes)} clientes"
+            "CONSULTA", f"Listado solicitado: {len(self.__almacen)} clientes"
         )
-        return self.__clientes.copy()
+        return list(self.__almacen.clientes())
 
     def actualizar_cliente(self, email, nuevos_datos):
         """
@@ -240,7 +947,7 @@ class GestorClientes:
             )
             raise ClienteNoEncontradoError(f"Cliente con email {email} no encontrado")
 
-        self.__clientes.remove(cliente)
+        self._retirar(cliente)
         self.registrar_actividad("BAJA", f"Cliente eliminado: {email}")
         return True
 
@@ -250,34 +957,36 @@ class GestorClientes:
         """
         Exporta todos los clientes a un archivo CSV.
 
+        La exportación se escribe en un archivo temporal que reemplaza al CSV
+        sólo al terminar, así una falla a mitad de camino no corrompe la
+        última exportación válida.
+
         Returns:
             bool: True si se exportó correctamente
         """
         try:
             self._crear_directorios()
 
-            with open(self.__ruta_csv, "w", newline="", encoding="utf-8") as archivo:
-                # Escribir encabezado
-                encabezados = [
-                    "tipo",
-                    "nombre",
-                    "email",
-                    "telefono",
-                    "direccion",
-                    "campo_extra1",
-                    "campo_extra2",
-                    "campo_extra3",
-                ]
-                writer = csv.DictWriter(archivo, fieldnames=encabezados)
-                writer.writeheader()
-
-                # Escribir clientes
-                for cliente in self.__clientes:
-                    fila = self._cliente_a_fila_csv(cliente)
-                    writer.writerow(fila)
+            # Se comprime si la ruta termina en .gz, .xz o .bz2
+            ruta = self.__ruta_csv
+            with escritura_atomica(ruta, self.__nivel_compresion) as archivo:
+                writer = csv.writer(archivo)
+                writer.writerow(ENCABEZADOS_CSV)
+
+                # El almacén entrega las filas como tuplas (el backend columnar
+                # las lee directamente de sus columnas)
+                writer.writerows(self.__almacen.filas_csv())
+
+            self._firmar_archivo(self.__ruta_csv)
+
+            # El CSV ya contiene todos los cambios: los deltas previos sobran
+            self._descartar_archivo_cambios()
+            self.__modificados.clear()
+            self.__eliminados.clear()
+            self.__base_exportada = True
 
             self.registrar_actividad(
-                "EXPORTACIÓN", f"Exportados {len(self.__clientes)} clientes a CSV"
+                "EXPORTACIÓN", f"Exportados {len(self.__almacen)} clientes a CSV"
             )
             return True
 
@@ -285,91 +994,759 @@ class GestorClientes:
             self.registrar_actividad("ERROR", f"Error exportando CSV: {str(e)}")
             raise
 
-    def _cliente_a_fila_csv(self, cliente):
+    # ======================== EXPORTACIÓN DE CAMBIOS ========================
+
+    def cambios_pendientes(self):
         """
-        Convierte un cliente a una fila de CSV.
+        Obtiene cuántos clientes cambiaron desde la última exportación.
 
-        Args:
-            cliente (Cliente): Cliente a convertir
+        Returns:
+            dict: modificados (agregados o modificados) y eliminados
+        """
+        return {
+            "modificados": len(self.__modificados),
+            "eliminados": len(self.__eliminados),
+        }
+
+    def exportar_cambios(self):
+        """
+        Exporta sólo los clientes agregados, modificados o eliminados desde la
+        última exportación, agregándolos como un lote al final del archivo de
+        cambios (<ruta_csv>.cambios). El costo es proporcional a la cantidad
+        de cambios, no al total de clientes.
+
+        Si el gestor aún no exportó el CSV completo no hay una base sobre la
+        cual aplicar los cambios, y se hace una exportación completa.
 
         Returns:
-            dict: Fila para CSV
+            dict: modificados y eliminados escritos, y completa (True si se
+                hizo una exportación completa)
         """
-        fila = {
-            "tipo": "",
-            "nombre": cliente.nombre,
-            "email": cliente.email,
-            "telefono": cliente.telefono,
-            "direccion": cliente.direccion,
-            "campo_extra1": "",
-            "campo_extra2": "",
-            "campo_extra3": "",
+        if not self.__base_exportada:
+            self.exportar_a_csv()
+            return {
+                "modificados": len(self.__almacen),
+                "eliminados": 0,
+                "completa": True,
+            }
+
+        modificados = list(self.__modificados)
+        eliminados = list(self.__eliminados)
+        resultado = {
+            "modificados": len(modificados),
+            "eliminados": len(eliminados),
+            "completa": False,
         }
+        if not modificados and not eliminados:
+            return resultado
+
+        ruta = self.__ruta_csv + EXTENSION_CAMBIOS
+        try:
+            self._crear_directorios()
+            # Sólo se firma el archivo si lo que ya tenía sigue siendo auténtico
+            autentico = True
+            if os.path.exists(ruta):
+                autentico = self._verificar_firma(ruta)
+                self._reparar_cola_cambios(ruta)
+            nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+
+            with open(ruta, "a", encoding="utf-8", newline="") as archivo:
+                writer = csv.writer(archivo)
+                if nuevo:
+                    writer.writerow(["operacion", *ENCABEZADOS_CSV])
+
+                # Las bajas van antes que las altas: un email eliminado y
+                # vuelto a usar queda con su fila nueva
+                vacios = ("",) * (len(ENCABEZADOS_CSV) - 3)
+                for email in eliminados:
+                    writer.writerow((OPERACION_BAJA, "", "", email, *vacios))
+                for id_cliente in modificados:
+                    fila = cliente_a_tupla(self.__almacen.obtener(id_cliente))
+                    writer.writerow((OPERACION_ALTA, *fila))
+                writer.writerow(
+                    (OPERACION_CONFIRMAR, len(eliminados) + len(modificados))
+                )
+
+                archivo.flush()
+                os.fsync(archivo.fileno())
+
+            if autentico:
+                self._firmar_archivo(ruta)
+            elif os.path.exists(ruta + EXTENSION_FIRMA):
+                os.remove(ruta + EXTENSION_FIRMA)
+
+        except Exception as e:
+            self.registrar_actividad("ERROR", f"Error exportando cambios: {str(e)}")
+            raise
+
+        self.__modificados.clear()
+        self.__eliminados.clear()
+        self.registrar_actividad(
+            "EXPORTACIÓN",
+            f"Exportados cambios: {len(modificados)} modificados, "
+            f"{len(eliminados)} eliminados",
+        )
+        return resultado
+
+    def compactar_cambios(self):
+        """
+        Incorpora el archivo de cambios al CSV base y luego lo elimina.
+
+        El CSV se lee en streaming y se reescribe de forma atómica; en memoria
+        sólo se guardan los cambios. Como los cambios se aplican por email
+        (el último gana), compactar dos veces el mismo archivo es inofensivo.
+
+        Returns:
+            int: Cantidad de emails afectados por los cambios
+        """
+        ruta_cambios = self.__ruta_csv + EXTENSION_CAMBIOS
+        if not os.path.exists(ruta_cambios):
+            return 0
+
+        ruta = self.__ruta_csv
+        try:
+            self._reparar_cola_cambios(ruta_cambios)
+            cambios = self._leer_cambios(ruta_cambios)
+            afectados = len(cambios)
+
+            # La base sólo se vuelve a firmar si ambas entradas eran auténticas
+            firmado = self._verificar_firma(ruta_cambios) and (
+                not os.path.exists(ruta) or self._verificar_firma(ruta)
+            )
+
+            columna_email = ENCABEZADOS_CSV.index("email")
+            with escritura_atomica(ruta, self.__nivel_compresion) as destino:
+                writer = csv.writer(destino)
+                writer.writerow(ENCABEZADOS_CSV)
+                if os.path.exists(ruta):
+                    with abrir_lectura(ruta) as crudo, io.TextIOWrapper(
+                        crudo, encoding="utf-8", newline=""
+                    ) as origen:
+                        lector = csv.reader(origen)
+                        next(lector, None)
+                        for fila in lector:
+                            if len(fila) > columna_email:
+                                email = self._normalizar_email(fila[columna_email])
+                                if email in cambios:
+                                    fila = cambios.pop(email)
+                                    if fila is None:
+                                        continue
+                            if fila:
+                                writer.writerow(fila)
+
+                # Los clientes nuevos van al final, en el orden en que llegaron
+                writer.writerows(fila for fila in cambios.values() if fila)
+
+            if firmado:
+                self._firmar_archivo(ruta)
+            elif os.path.exists(ruta + EXTENSION_FIRMA):
+                os.remove(ruta + EXTENSION_FIRMA)
+            self._descartar_archivo_cambios()
+
+        except Exception as e:
+            self.registrar_actividad("ERROR", f"Error compactando cambios: {str(e)}")
+            raise
+
+        self.registrar_actividad(
+            "EXPORTACIÓN", f"Compactados {afectados} cambios en {ruta}"
+        )
+        return afectados
+
+    def _leer_cambios(self, ruta):
+        """
+        Lee el archivo de cambios aplicando sólo los lotes confirmados.
+
+        Args:
+            ruta (str): Ruta del archivo de cambios
+
+        Returns:
+            dict: Email normalizado -> fila CSV final (None si fue eliminado)
+        """
+        columna_email = ENCABEZADOS_CSV.index("email")
+        cambios = {}
+        pendientes = []
+        with open(ruta, "r", encoding="utf-8", newline="") as archivo:
+            lector = csv.reader(archivo)
+            next(lector, None)
+            for fila in lector:
+                if not fila:
+                    continue
+                if fila[0] != OPERACION_CONFIRMAR:
+                    pendientes.append(fila)
+                    continue
+
+                # Un lote interrumpido deja filas sin confirmar antes del
+                # siguiente: la marca indica cuántas de las últimas son válidas
+                cantidad = int(fila[1])
+                for operacion, *datos in pendientes[-cantidad:]:
+                    email = self._normalizar_email(datos[columna_email])
+                    cambios[email] = datos if operacion == OPERACION_ALTA else None
+                pendientes = []
+        return cambios
+
+    @staticmethod
+    def _reparar_cola_cambios(ruta):
+        """
+        Recorta una última línea incompleta del archivo de cambios (lo que
+        deja una exportación interrumpida), para que el siguiente lote
+        empiece en una línea propia y una marca cortada no se lea como válida.
+
+        Args:
+            ruta (str): Ruta del archivo de cambios
+        """
+        with open(ruta, "rb+") as archivo:
+            fin = archivo.seek(0, os.SEEK_END)
+            if fin == 0:
+                return
+            archivo.seek(fin - 1)
+            if archivo.read(1) == b"\n":
+                return
+
+            posicion = fin
+            while posicion > 0:
+                inicio = max(0, posicion - 4096)
+                archivo.seek(inicio)
+                salto = archivo.read(posicion - inicio).rfind(b"\n")
+                if salto != -1:
+                    archivo.truncate(inicio + salto + 1)
+                    return
+                posicion = inicio
+            archivo.truncate(0)
+
+    def _descartar_archivo_cambios(self):
+        """Elimina el archivo de cambios y su firma, si existen."""
+        ruta = self.__ruta_csv + EXTENSION_CAMBIOS
+        for archivo in (ruta, ruta + EXTENSION_FIRMA):
+            if os.path.exists(archivo):
+                os.remove(archivo)
+
+    # ======================== SNAPSHOTS ========================
+
+    def _ruta_snapshot(self):
+        """Ruta por defecto del snapshot: la del CSV con extensión .snapshot."""
+        ruta = self.__ruta_csv
+        if codec_de(ruta) is not None:
+            ruta = os.path.splitext(ruta)[0]
+        return os.path.splitext(ruta)[0] + EXTENSION_SNAPSHOT
+
+    def guardar_snapshot(self, ruta=None):
+        """
+        Guarda todos los clientes en un snapshot binario (ver
+        formato_snapshot), junto con las huellas de los archivos importados.
+        El archivo se escribe de forma atómica y se firma con la misma clave
+        que las exportaciones CSV.
+
+        Args:
+            ruta (str): Ruta del snapshot (default: junto al CSV)
+
+        Returns:
+            int: Cantidad de clientes guardados
+        """
+        ruta = ruta or self._ruta_snapshot()
+        try:
+            self._crear_directorios()
+            metadatos = {"importaciones": self.__importaciones}
+            with escritura_atomica(ruta, texto=False) as archivo:
+                cantidad = escribir_snapshot(
+                    archivo, self.__almacen.filas_csv(), metadatos, self._clave_firma()
+                )
+        except Exception as e:
+            self.registrar_actividad("ERROR", f"Error guardando snapshot: {str(e)}")
+            raise
+
+        self.registrar_actividad(
+            "EXPORTACIÓN", f"Snapshot guardado: {cantidad} clientes en {ruta}"
+        )
+        return cantidad
+
+    def cargar_snapshot(self, ruta=None):
+        """
+        Carga los clientes de un snapshot binario en un gestor vacío.
+        La firma se verifica antes de agregar cualquier cliente, y los
+        clientes se construyen sin repetir validaciones.
+
+        Args:
+            ruta (str): Ruta del snapshot (default: junto al CSV)
+
+        Returns:
+            int: Cantidad de clientes cargados
 
-        if isinstance(cliente, ClienteRegular):
-            fila["tipo"] = "Regular"
-            fila["campo_extra1"] = cliente.puntos_acumulados
+        Raises:
+            FileNotFoundError: Si el snapshot no existe
+            DatosInvalidosError: Si el gestor no está vacío o el snapshot no
+                es válido (formato, versión o firma)
+        """
+        ruta = ruta or self._ruta_snapshot()
+        if len(self.__almacen):
+            raise DatosInvalidosError(
+                "El snapshot sólo puede cargarse en un gestor vacío"
+            )
+
+        try:
+            with open(ruta, "rb") as archivo:
+                clientes, metadatos = leer_snapshot(archivo, self._clave_firma())
+
+            cantidad = self._insertar_lote(clientes)
+            self.__importaciones.update(metadatos.get("importaciones", {}))
+        except Exception as e:
+            self.registrar_actividad("ERROR", f"Error cargando snapshot: {str(e)}")
+            raise
+
+        self.registrar_actividad(
+            "INFORMACIÓN", f"Snapshot cargado: {cantidad} clientes desde {ruta}"
+        )
+        return cantidad
+
+    def snapshot_vigente(self, ruta_fuente, ruta=None):
+        """
+        Indica si un snapshot refleja el archivo CSV del que se cargaron sus
+        clientes: el archivo no cambió, o sólo se le agregaron filas al final
+        (que una importación incremental puede sumar después de cargarlo).
+        Sólo se leen los metadatos del snapshot, no sus clientes.
+
+        Args:
+            ruta_fuente (str): Ruta del CSV de origen
+            ruta (str): Ruta del snapshot (default: junto al CSV)
+
+        Returns:
+            bool: True si conviene cargar el snapshot en vez del CSV
+        """
+        ruta = ruta or self._ruta_snapshot()
+        if not os.path.exists(ruta):
+            return False
+        try:
+            with open(ruta, "rb") as archivo:
+                metadatos = leer_metadatos_snapshot(archivo)
+        except DatosInvalidosError:
+            return False
+
+        huella = metadatos.get("importaciones", {}).get(os.path.abspath(ruta_fuente))
+        if huella is None:
+            return False
+        desde, _ = self._consumido_sin_cambios(ruta_fuente, huella)
+        return desde is not None
+
+    # ======================== FIRMA DE EXPORTACIONES ========================
+
+    def _clave_firma(self):
+        """
+        Obtiene la clave secreta con que se firman las exportaciones.
+        Se toma de la variable de entorno GIC_CLAVE_FIRMA o, si no existe,
+        de un archivo .clave_firma junto al CSV (creado al primer uso).
+
+        Returns:
+            bytes: Clave secreta
+        """
+        clave = os.environ.get("GIC_CLAVE_FIRMA")
+        if clave:
+            return clave.encode("utf-8")
+
+        directorio = os.path.dirname(self.__ruta_csv) or "."
+        ruta_clave = os.path.join(directorio, ".clave_firma")
+        if not os.path.exists(ruta_clave):
+            banderas = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+            descriptor = os.open(ruta_clave, banderas, 0o600)
+            with os.fdopen(descriptor, "wb") as archivo:
+                archivo.write(secrets.token_bytes(32))
+
+        with open(ruta_clave, "rb") as archivo:
+            return archivo.read()
+
+    def _calcular_firma(self, ruta):
+        """
+        Calcula la firma HMAC-SHA256 del contenido de un archivo.
 
-        elif isinstance(cliente, ClientePremium):
-            fila["tipo"] = "Premium"
-            fila["campo_extra1"] = cliente.descuento_exclusivo
-            fila["campo_extra2"] = cliente.fecha_membresia
+        Args:
+            ruta (str): Ruta del archivo
 
-        elif isinstance(cliente, ClienteCorporativo):
-            fila["tipo"] = "Corporativo"
-            fila["campo_extra1"] = cliente.empresa
-            fila["campo_extra2"] = cliente.rut_empresa
-            fila["campo_extra3"] = cliente.contacto_principal
+        Returns:
+            str: Firma en hexadecimal
+        """
+        firma = hmac.new(self._clave_firma(), digestmod=hashlib.sha256)
+        with open(ruta, "rb") as archivo:
+            for bloque in iter(lambda: archivo.read(1 << 20), b""):
+                firma.update(bloque)
+        return firma.hexdigest()
+
+    def _firmar_archivo(self, ruta):
+        """Escribe junto al archivo su firma, que prueba que lo generó el sistema."""
+        with open(ruta + EXTENSION_FIRMA, "w", encoding="utf-8") as archivo:
+            archivo.write(self._calcular_firma(ruta))
+
+    def _verificar_firma(self, ruta):
+        """
+        Verifica que un archivo fue exportado por el sistema y no cambió.
 
-        return fila
+        Args:
+            ruta (str): Ruta del archivo
 
-    def importar_desde_csv(self, ruta):
+        Returns:
+            bool: True si la firma existe y coincide con el contenido
+        """
+        ruta_firma = ruta + EXTENSION_FIRMA
+        if not os.path.exists(ruta_firma):
+            return False
+        with open(ruta_firma, "r", encoding="utf-8") as archivo:
+            firma = archivo.read().strip()
+        return hmac.compare_digest(firma, self._calcular_firma(ruta))
+
+    # ======================== IMPORTACIÓN ========================
+
+    def importar_desde_csv(
+        self,
+        ruta,
+        confiable=False,
+        tamano_bloque=TAMANO_BLOQUE_IMPORTACION,
+        progreso=None,
+        reanudar=False,
+        incremental=False,
+        actualizar=False,
+    ):
         """
         Importa clientes desde un archivo CSV.
 
+        Con confiable=True, si el archivo tiene una firma válida (es decir,
+        es una exportación propia sin modificar) los clientes se crean sin
+        repetir las validaciones. Sin firma válida se valida cada fila.
+
+        El archivo se procesa por bloques (ver importar_por_bloques), de modo
+        que la memoria usada por la lectura no depende del tamaño del archivo.
+
+        Con incremental=True se usa la huella guardada de la última
+        importación del mismo archivo: si no cambió, se omite sin leerlo ni
+        hacer backup; si solo se le agregaron filas al final, se importan
+        únicamente esas filas.
+
+        Con actualizar=True (modo upsert), las filas cuyo email ya existe
+        actualizan al cliente registrado en lugar de descartarse como
+        duplicados: se aplican solo los campos que cambian, a través de los
+        setters validados. Un cliente no puede cambiar de tipo (la fila se
+        cuenta como error).
+
         Args:
             ruta (str): Ruta del archivo CSV a importar
+            confiable (bool): Omitir validaciones si la firma del archivo es válida
+            tamano_bloque (int): Filas que se procesan y confirman juntas
+            progreso (callable): Función que recibe el avance de cada bloque
+            reanudar (bool): Guardar puntos de control y continuar desde el
+                último, si existe (ver importar_por_bloques)
+            incremental (bool): Omitir lo ya importado de este archivo
+            actualizar (bool): Actualizar los clientes existentes (upsert)
 
         Returns:
-            dict: Estadísticas de importación {total, exitosos, errores}
+            dict: Estadísticas de importación {total, exitosos, errores,
+                duplicados}; con actualizar=True además {actualizados,
+                sin_cambios} (exitosos son los clientes insertados)
 
         Raises:
             FileNotFoundError: Si el archivo no existe
         """
+        estadisticas = self._estadisticas_iniciales(actualizar)
+
+        desde = None
+        if incremental:
+            desde, sin_cambios = self._consumido_sin_cambios(ruta)
+            if sin_cambios:
+                self.registrar_actividad(
+                    "IMPORTACIÓN", f"Archivo sin cambios, se omite: {ruta}"
+                )
+                return estadisticas
+
+        posicion = desde or 0
+        avances = self.importar_por_bloques(
+            ruta,
+            tamano_bloque,
+            confiable,
+            reanudar=reanudar,
+            desde=desde,
+            actualizar=actualizar,
+        )
+        for avance in avances:
+            estadisticas = avance["estadisticas"]
+            posicion = avance["posicion"]
+            if progreso is not None:
+                progreso(avance)
+
+        if incremental:
+            self._registrar_importacion(ruta, posicion)
+        return estadisticas
+
+    def _consumido_sin_cambios(self, ruta, huella=None):
+        """
+        Compara un archivo con la huella de su última importación.
+
+        Las posiciones se cuentan sobre el contenido descomprimido, de modo
+        que también sirven para archivos .gz, .xz o .bz2.
+
+        Args:
+            ruta (str): Ruta del archivo CSV
+            huella (dict): Huella a comparar (default: la registrada por este
+                gestor, que se actualiza si sólo cambió la fecha)
+
+        Returns:
+            tuple: (desde, sin_cambios): desde es el byte hasta el que lo ya
+                importado sigue igual (None si hay que importar el archivo
+                completo) y sin_cambios indica que no hay nada nuevo
+        """
+        propia = huella is None
+        if propia:
+            huella = self.__importaciones.get(os.path.abspath(ruta))
+        if huella is None or not os.path.exists(ruta):
+            return None, False
+
+        estado = os.stat(ruta)
+        if (
+            estado.st_size == huella["tamano"]
+            and estado.st_mtime_ns == huella["modificado"]
+        ):
+            return huella["posicion"], True
+
+        # El archivo cambió: sirve solo si lo ya importado sigue intacto y
+        # terminaba en un salto de línea (las filas nuevas empiezan ahí)
+        posicion = huella["posicion"]
+        comprimido = esta_comprimido(ruta)
+        if not comprimido and estado.st_size < posicion:
+            return None, False
+        if self._hash_prefijo(ruta, posicion) != huella["hash"]:
+            return None, False
+
+        with abrir_lectura(ruta) as archivo:
+            archivo.seek(posicion)
+            hay_mas = archivo.read(1) != b""
+            if hay_mas and posicion > 0:
+                archivo.seek(posicion - 1)
+                if archivo.read(1) != b"\n":
+                    return None, False
+
+        if not hay_mas:
+            # Solo cambió la fecha de modificación: se actualiza la huella
+            if propia:
+                self._registrar_importacion(ruta, posicion)
+            return posicion, True
+        return posicion, False
+
+    def _registrar_importacion(self, ruta, posicion):
+        """
+        Guarda la huella de un archivo tras importarlo hasta `posicion`.
+
+        Args:
+            ruta (str): Ruta del archivo CSV importado
+            posicion (int): Byte hasta el que se importó
+        """
+        estado = os.stat(ruta)
+        self.__importaciones[os.path.abspath(ruta)] = {
+            "tamano": estado.st_size,
+            "modificado": estado.st_mtime_ns,
+            "hash": self._hash_prefijo(ruta, posicion),
+            "posicion": posicion,
+        }
+
+    @staticmethod
+    def _hash_prefijo(ruta, hasta):
+        """
+        Calcula el SHA-256 de los primeros bytes de un archivo.
+
+        Args:
+            ruta (str): Ruta del archivo
+            hasta (int): Cantidad de bytes a considerar
+
+        Returns:
+            str: Hash en hexadecimal
+        """
+        resumen = hashlib.sha256()
+        with abrir_lectura(ruta) as archivo:
+            restantes = hasta
+            while restantes > 0:
+                bloque = archivo.read(min(restantes, 1 << 20))
+                if not bloque:
+                    break
+                resumen.update(bloque)
+                restantes -= len(bloque)
+        return resumen.hexdigest()
+
+    def importar_por_bloques(
+        self,
+        ruta,
+        tamano_bloque=TAMANO_BLOQUE_IMPORTACION,
+        confiable=False,
+        reanudar=False,
+        desde=None,
+        actualizar=False,
+    ):
+        """
+        Importa un archivo CSV por bloques, entregando el avance de cada uno.
+
+        Cada bloque se lee, valida y confirma de forma atómica: sus clientes
+        válidos se insertan todos juntos, o ninguno si algo falla a mitad de
+        la inserción. Solo se mantiene en memoria el bloque en curso, y los
+        errores del bloque se registran en una sola línea de log.
+
+        Con reanudar=True, tras cada bloque se guarda junto al archivo un
+        punto de control (posición en bytes y estadísticas acumuladas). Si
+        la importación se interrumpe, una nueva llamada con reanudar=True
+        continúa desde el último bloque confirmado, si los clientes de los
+        bloques anteriores siguen cargados en el gestor.
+
+        Para reanudar en otro proceso, junto al punto de control se guarda
+        además un snapshot firmado de los clientes confirmados (con una
+        frecuencia que limita su costo, ver INTERVALO_REANUDACION).
+        Un gestor que está como al empezar la importación interrumpida (por
+        ejemplo, uno nuevo y vacío) carga ese snapshot y continúa desde el
+        bloque en que se guardó. En cualquier otro caso, o si el archivo
+        cambió, se importa desde el inicio. Ambos archivos se descartan al
+        terminar.
+
+        Los archivos .gz, .xz y .bz2 se descomprimen al vuelo;
+        las posiciones en bytes se cuentan sobre el contenido descomprimido.
+
+        Args:
+            ruta (str): Ruta del archivo CSV a importar
+            tamano_bloque (int): Filas que se procesan y confirman juntas
+            confiable (bool): Omitir validaciones si la firma del archivo es válida
+            reanudar (bool): Guardar puntos de control y continuar desde el último
+            desde (int): Byte donde empezar a leer, al inicio de una fila
+                (None: desde la primera fila)
+            actualizar (bool): Actualizar los clientes existentes (upsert,
+                ver importar_desde_csv)
+
+        Yields:
+            dict: Avance tras confirmar cada bloque: bloque (número), filas
+                (del bloque), posicion (bytes de contenido leídos), leido
+                (bytes del archivo en disco leídos; difiere de posicion si
+                está comprimido), tamano_archivo (bytes en disco) y
+                estadisticas (acumuladas hasta ese bloque)
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            DatosInvalidosError: Si el tamaño de bloque no es positivo
+        """
         try:
             if not os.path.exists(ruta):
                 raise FileNotFoundError(f"Archivo {ruta} no encontrado")
+            if tamano_bloque <= 0:
+                raise DatosInvalidosError("El tamaño de bloque debe ser mayor a 0")
 
             # Hacer backup antes de importar
             self._hacer_backup()
+            validar = self._debe_validar(ruta, confiable)
+
+            estadisticas = self._estadisticas_iniciales(actualizar)
+            tamano_archivo = os.path.getsize(ruta)
+            ultimo_bloque = 0
+            inicio = (len(self.__indice_email), self.__huella_emails)
+            proximo_estado = 0
+
+            punto = self._leer_punto_control(ruta) if reanudar else None
+            if punto is not None:
+                estadisticas = punto["estadisticas"]
+                desde = punto["posicion"]
+                ultimo_bloque = punto["bloque"]
+                inicio = (punto["clientes_inicio"], punto["huella_inicio"])
+                self.registrar_actividad(
+                    "IMPORTACIÓN",
+                    f"Reanudando {ruta} desde el byte {desde} "
+                    f"(bloque {ultimo_bloque})",
+                )
+
+            comprimido = esta_comprimido(ruta)
+
+            with open(ruta, "rb") as crudo, envolver_lectura(crudo, ruta) as archivo:
+                lector = LectorCSV(archivo, desde=desde)
+                constructor = ConstructorClientes(lector.encabezados)
+                filas = lector.filas()
+                bloques = iter(lambda: list(islice(filas, tamano_bloque)), [])
+
+                for numero, bloque in enumerate(bloques, start=ultimo_bloque + 1):
+                    resultados = constructor.construir_bloque(
+                        bloque, validar, actualizar
+                    )
+                    self._confirmar_bloque(numero, resultados, estadisticas, actualizar)
+                    if reanudar:
+                        punto = self._guardar_punto_control(
+                            ruta, numero, lector.posicion, estadisticas, inicio
+                        )
+                        if time.monotonic() >= proximo_estado:
+                            proximo_estado = self._guardar_estado_reanudacion(
+                                ruta, punto
+                            )
+                    yield {
+                        "bloque": numero,
+                        "filas": len(bloque),
+                        "posicion": lector.posicion,
+                        "leido": crudo.tell() if comprimido else lector.posicion,
+                        "tamano_archivo": tamano_archivo,
+                        "estadisticas": dict(estadisticas),
+                    }
+
+            if reanudar:
+                self._descartar_punto_control(ruta)
+            self.registrar_actividad(
+                "IMPORTACIÓN", f"Importación completada: {estadisticas}"
+            )
+
+        except Exception as e:
+            self.registrar_actividad("ERROR", f"Error importando CSV: {str(e)}")
+            raise
 
-            estadisticas = {"total": 0, "exitosos": 0, "errores": 0, "duplicados": 0}
+    def importar_en_paralelo(
+        self, ruta, procesos=None, confiable=False, actualizar=False
+    ):
+        """
+        Importa un archivo CSV repartiendo la lectura y validación de las
+        filas entre varios procesos.
 
-            with open(ruta, "r", encoding="utf-8") as archivo:
-                reader = csv.DictReader(archivo)
+        El archivo se divide en rangos de bytes que empiezan y terminan en
+        un límite de fila (los saltos de línea dentro de campos entre
+        comillas no cortan rangos); cada proceso construye y valida los
+        clientes de su rango, y los resultados se confirman en el orden del
+        archivo, por lo que los duplicados y las estadísticas son los mismos
+        que con importar_desde_csv.
 
-                for fila in reader:
-                    estadisticas["total"] += 1
+        Args:
+            ruta (str): Ruta del archivo CSV a importar
+            procesos (int): Cantidad de procesos (None: uno por CPU)
+            confiable (bool): Omitir validaciones si la firma del archivo es válida
+            actualizar (bool): Actualizar los clientes existentes (upsert,
+                ver importar_desde_csv)
 
-                    try:
-                        cliente = self._fila_csv_a_cliente(fila)
+        Returns:
+            dict: Estadísticas de importación, como las de importar_desde_csv
 
-                        # Verificar si ya existe
-                        if self.buscar_cliente(cliente.email):
-                            estadisticas["duplicados"] += 1
-                            continue
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+        """
+        try:
+            if not os.path.exists(ruta):
+                raise FileNotFoundError(f"Archivo {ruta} no encontrado")
 
-                        self.__clientes.append(cliente)
-                        estadisticas["exitosos"] += 1
+            # Hacer backup antes de importar
+            self._hacer_backup()
+            validar = self._debe_validar(ruta, confiable)
 
-                    except Exception as e:
-                        estadisticas["errores"] += 1
-                        self.registrar_actividad(
-                            "ERROR", f"Error importando fila: {str(e)}"
-                        )
+            procesos = procesos or os.cpu_count() or 1
+            with abrir_lectura(ruta) as archivo:
+                inicio_datos = LectorCSV(archivo).posicion
+            rangos = _dividir_en_filas(
+                ruta, inicio_datos, procesos * RANGOS_POR_PROCESO
+            )
+
+            estadisticas = self._estadisticas_iniciales(actualizar)
+            with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+                trabajos = ejecutor.map(
+                    _procesar_rango,
+                    repeat(ruta),
+                    [inicio for inicio, _ in rangos],
+                    [fin for _, fin in rangos],
+                    repeat(validar),
+                    repeat(actualizar),
+                )
+                for numero, resultados in enumerate(trabajos, start=1):
+                    self._confirmar_bloque(numero, resultados, estadisticas, actualizar)
 
             self.registrar_actividad(
-                "IMPORTACIÓN", f"Importación completada: {estadisticas}"
+                "IMPORTACIÓN",
+                f"Importación en paralelo completada ({procesos} procesos): "
+                f"{estadisticas}",
             )
             return estadisticas
 
@@ -377,48 +1754,517 @@ class GestorClientes:
             self.registrar_actividad("ERROR", f"Error importando CSV: {str(e)}")
             raise
 
-    def _fila_csv_a_cliente(self, fila):
+    def _guardar_punto_control(self, ruta, bloque, posicion, estadisticas, inicio):
         """
-        Convierte una fila de CSV a un objeto Cliente.
+        Guarda junto al archivo importado el avance confirmado hasta ahora,
+        con la cantidad y la huella de los clientes cargados en el gestor
+        para comprobar al reanudar que los bloques confirmados siguen ahí.
+        El archivo se reemplaza de forma atómica para no dejarlo a medias.
 
         Args:
-            fila (dict): Fila del CSV
+            ruta (str): Ruta del archivo CSV en importación
+            bloque (int): Número del último bloque confirmado
+            posicion (int): Byte donde termina el último bloque confirmado
+            estadisticas (dict): Estadísticas acumuladas
+            inicio (tuple): Cantidad y huella de los clientes que había en el
+                gestor al empezar la importación
 
         Returns:
-            Cliente: Objeto cliente creado
+            dict: Punto de control guardado
         """
-        tipo = fila.get("tipo", "").strip()
-        nombre = fila.get("nombre", "").strip()
-        email = fila.get("email", "").strip()
-        telefono = fila.get("telefono", "").strip()
-        direccion = fila.get("direccion", "").strip()
+        estado = os.stat(ruta)
+        punto = {
+            "bloque": bloque,
+            "posicion": posicion,
+            "estadisticas": estadisticas,
+            "tamano_archivo": estado.st_size,
+            "modificado": estado.st_mtime_ns,
+            "clientes": len(self.__indice_email),
+            "huella_clientes": self.__huella_emails,
+            "clientes_inicio": inicio[0],
+            "huella_inicio": inicio[1],
+        }
+        ruta_punto = ruta + EXTENSION_PUNTO_CONTROL
+        try:
+            with open(ruta_punto + ".tmp", "w", encoding="utf-8") as archivo:
+                json.dump(punto, archivo)
+            os.replace(ruta_punto + ".tmp", ruta_punto)
+        except OSError as e:
+            self.registrar_actividad(
+                "ADVERTENCIA", f"No se pudo guardar el punto de control: {str(e)}"
+            )
+        return punto
 
-        if tipo == "Regular":
-            puntos = int(fila.get("campo_extra1", 0) or 0)
-            return ClienteRegular(nombre, email, telefono, direccion, puntos)
+    def _guardar_estado_reanudacion(self, ruta, punto):
+        """
+        Guarda un snapshot firmado de los clientes cargados, con el punto de
+        control al que corresponden, para reanudar la importación en otro
+        proceso.
 
-        elif tipo == "Premium":
-            descuento = float(fila.get("campo_extra1", 10) or 10)
-            fecha = fila.get("campo_extra2", None)
-            return ClientePremium(nombre, email, telefono, direccion, descuento, fecha)
+        Args:
+            ruta (str): Ruta del archivo CSV en importación
+            punto (dict): Punto de control recién guardado
 
-        elif tipo == "Corporativo":
-            empresa = fila.get("campo_extra1", "").strip()
-            rut = fila.get("campo_extra2", "").strip()
-            contacto = fila.get("campo_extra3", "").strip()
-            return ClienteCorporativo(
-                nombre, email, telefono, direccion, empresa, rut, contacto
+        Returns:
+            float: Instante (de time.monotonic) a partir del cual volver a
+                guardarlo, según INTERVALO_REANUDACION y
+                FACTOR_INTERVALO_REANUDACION
+        """
+        comienzo = time.monotonic()
+        try:
+            ruta_estado = ruta + EXTENSION_ESTADO_REANUDACION
+            with escritura_atomica(ruta_estado, texto=False) as archivo:
+                escribir_snapshot(
+                    archivo,
+                    self.__almacen.filas_csv(),
+                    {"punto_control": punto},
+                    self._clave_firma(),
+                )
+        except OSError as e:
+            self.registrar_actividad(
+                "ADVERTENCIA",
+                f"No se pudo guardar el estado para reanudar: {str(e)}",
             )
-        else:
-            return Cliente(nombre, email, telefono, direccion)
+        fin = time.monotonic()
+        espera = FACTOR_INTERVALO_REANUDACION * (fin - comienzo)
+        return fin + max(INTERVALO_REANUDACION, espera)
+
+    def _leer_punto_control(self, ruta):
+        """
+        Lee el punto de control de una importación interrumpida. Si los
+        clientes de los bloques confirmados no están cargados en el gestor,
+        se intenta recuperarlos del estado guardado para reanudar en otro
+        proceso (ver _cargar_estado_reanudacion).
+
+        Args:
+            ruta (str): Ruta del archivo CSV a importar
+
+        Returns:
+            dict: Punto de control desde el que continuar, o None si no
+                existe, no se puede leer, el archivo cambió desde que se
+                guardó o los clientes confirmados no están ni se recuperan
+        """
+        ruta_punto = ruta + EXTENSION_PUNTO_CONTROL
+        if not os.path.exists(ruta_punto):
+            return None
+
+        try:
+            with open(ruta_punto, "r", encoding="utf-8") as archivo:
+                punto = json.load(archivo)
+            vigente = self._punto_vigente(ruta, punto)
+            cargados = (
+                punto["clientes"] == len(self.__indice_email)
+                and punto["huella_clientes"] == self.__huella_emails
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.registrar_actividad(
+                "ADVERTENCIA", f"Punto de control ilegible, se ignora: {str(e)}"
+            )
+            return None
+
+        if not vigente:
+            self.registrar_actividad(
+                "ADVERTENCIA", f"El archivo cambió, se importa desde el inicio: {ruta}"
+            )
+            return None
+        if cargados:
+            return punto
+
+        punto = self._cargar_estado_reanudacion(ruta)
+        if punto is None:
+            self.registrar_actividad(
+                "ADVERTENCIA",
+                "Los clientes de los bloques ya confirmados no están cargados, "
+                f"se importa desde el inicio: {ruta}",
+            )
+        return punto
+
+    @staticmethod
+    def _punto_vigente(ruta, punto):
+        """Indica si el archivo importado sigue como al guardar el punto."""
+        estado = os.stat(ruta)
+        return (
+            punto["tamano_archivo"] == estado.st_size
+            and punto["modificado"] == estado.st_mtime_ns
+        )
+
+    def _cargar_estado_reanudacion(self, ruta):
+        """
+        Recupera los clientes confirmados de una importación interrumpida en
+        otro proceso, desde el snapshot guardado junto al punto de control.
+        Sólo se usa si el gestor tiene los mismos clientes que al empezar esa
+        importación (por ejemplo, ambos vacíos) y el archivo no cambió.
+
+        Args:
+            ruta (str): Ruta del archivo CSV a importar
+
+        Returns:
+            dict: Punto de control en que se guardó el snapshot, o None si
+                no existe o no se puede usar
+        """
+        ruta_estado = ruta + EXTENSION_ESTADO_REANUDACION
+        if not os.path.exists(ruta_estado):
+            return None
+
+        try:
+            with open(ruta_estado, "rb") as archivo:
+                clientes, metadatos = leer_snapshot(archivo, self._clave_firma())
+            punto = metadatos["punto_control"]
+            utilizable = (
+                self._punto_vigente(ruta, punto)
+                and punto["clientes_inicio"] == len(self.__indice_email)
+                and punto["huella_inicio"] == self.__huella_emails
+            )
+        except (OSError, DatosInvalidosError, KeyError, TypeError) as e:
+            self.registrar_actividad(
+                "ADVERTENCIA", f"Estado para reanudar ilegible, se ignora: {str(e)}"
+            )
+            return None
+        if not utilizable:
+            return None
+
+        self._restaurar_clientes(clientes)
+        self.registrar_actividad(
+            "IMPORTACIÓN",
+            f"Recuperados {punto['clientes']} clientes de la importación "
+            f"interrumpida de {ruta}",
+        )
+        return punto
+
+    def _restaurar_clientes(self, clientes):
+        """
+        Lleva el gestor al estado de un snapshot tomado a partir de sus
+        clientes actuales: se insertan los que faltan y los existentes toman
+        los datos del snapshot (como en una importación con actualizar=True).
+
+        Args:
+            clientes (iterable): Clientes del snapshot
+        """
+        nuevos = []
+        for cliente in clientes:
+            id_cliente = self.__indice_email.get(cliente.email)
+            if id_cliente is None:
+                nuevos.append(cliente)
+                continue
+            existente = self.__almacen.obtener(id_cliente)
+            for campo, valor in self._campos_distintos(existente, cliente).items():
+                setattr(existente, campo, valor)
+        self._insertar_lote(nuevos)
+
+    def _descartar_punto_control(self, ruta):
+        """
+        Elimina el punto de control de una importación ya terminada, y el
+        estado guardado para reanudarla en otro proceso.
+        """
+        for extension in (EXTENSION_PUNTO_CONTROL, EXTENSION_ESTADO_REANUDACION):
+            try:
+                os.remove(ruta + extension)
+            except FileNotFoundError:
+                pass
+
+    def importar_multiples(
+        self, rutas, procesos=None, confiable=False, actualizar=False
+    ):
+        """
+        Importa varios archivos CSV, leyéndolos y validándolos en paralelo.
+        Versión bloqueante de importar_multiples_async.
+
+        Args:
+            rutas (list): Rutas de los archivos CSV, en el orden de combinación
+            procesos (int): Procesos para leer y validar (None: uno por CPU)
+            confiable (bool): Omitir validaciones en los archivos con firma válida
+            actualizar (bool): Actualizar los clientes existentes (upsert,
+                ver importar_desde_csv)
+
+        Returns:
+            dict: {"por_archivo": ruta -> estadísticas, "combinado":
+                estadísticas sumadas de todos los archivos}
+
+        Raises:
+            FileNotFoundError: Si alguno de los archivos no existe
+        """
+        return asyncio.run(
+            self.importar_multiples_async(rutas, procesos, confiable, actualizar)
+        )
+
+    async def importar_multiples_async(
+        self, rutas, procesos=None, confiable=False, actualizar=False
+    ):
+        """
+        Importa varios archivos CSV con asyncio: todos los archivos se leen y
+        validan a la vez en un conjunto de procesos, y se combinan en el
+        gestor en el orden de `rutas` a medida que quedan listos.
+
+        Se hace un solo backup antes de empezar. Como cada archivo se
+        combina después de los anteriores, ante emails repetidos entre
+        archivos gana el primero (o el último, con actualizar=True). Cada
+        archivo se confirma de forma atómica.
+
+        Args:
+            rutas (list): Rutas de los archivos CSV, en el orden de combinación
+            procesos (int): Procesos para leer y validar (None: uno por CPU)
+            confiable (bool): Omitir validaciones en los archivos con firma válida
+            actualizar (bool): Actualizar los clientes existentes (upsert,
+                ver importar_desde_csv)
+
+        Returns:
+            dict: {"por_archivo": ruta -> estadísticas, "combinado":
+                estadísticas sumadas de todos los archivos}
+
+        Raises:
+            FileNotFoundError: Si alguno de los archivos no existe
+        """
+        try:
+            for ruta in rutas:
+                if not os.path.exists(ruta):
+                    raise FileNotFoundError(f"Archivo {ruta} no encontrado")
+
+            # Un solo backup para todo el lote
+            self._hacer_backup()
+
+            loop = asyncio.get_running_loop()
+            por_archivo = {}
+            combinado = self._estadisticas_iniciales(actualizar)
+
+            with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+                tareas = []
+                for ruta in rutas:
+                    validar = self._debe_validar(ruta, confiable)
+                    tareas.append(
+                        loop.run_in_executor(
+                            ejecutor,
+                            _procesar_rango,
+                            ruta,
+                            0,
+                            None,
+                            validar,
+                            actualizar,
+                        )
+                    )
+
+                for numero, (ruta, tarea) in enumerate(zip(rutas, tareas), start=1):
+                    resultados = await tarea
+                    estadisticas = self._estadisticas_iniciales(actualizar)
+                    self._confirmar_bloque(numero, resultados, estadisticas, actualizar)
+                    por_archivo[ruta] = estadisticas
+                    for clave, valor in estadisticas.items():
+                        combinado[clave] += valor
+                    self.registrar_actividad(
+                        "IMPORTACIÓN", f"Archivo {ruta} combinado: {estadisticas}"
+                    )
+
+            self.registrar_actividad(
+                "IMPORTACIÓN",
+                f"Importación de {len(rutas)} archivos completada: {combinado}",
+            )
+            return {"por_archivo": por_archivo, "combinado": combinado}
+
+        except Exception as e:
+            self.registrar_actividad("ERROR", f"Error importando CSV: {str(e)}")
+            raise
+
+    def _debe_validar(self, ruta, confiable):
+        """
+        Decide si las filas de un archivo a importar deben validarse.
+
+        Args:
+            ruta (str): Ruta del archivo CSV a importar
+            confiable (bool): Si se pidió omitir validaciones con firma válida
+
+        Returns:
+            bool: False solo si se pidió confiar y la firma es válida
+        """
+        if not confiable:
+            return True
+        if self._verificar_firma(ruta):
+            return False
+        self.registrar_actividad(
+            "ADVERTENCIA", f"Firma ausente o inválida, se valida: {ruta}"
+        )
+        return True
+
+    def _confirmar_bloque(self, numero, resultados, estadisticas, actualizar=False):
+        """
+        Confirma de forma atómica los clientes de un bloque ya construido.
+
+        Primero se clasifica cada fila: nueva, duplicada (contra el índice y
+        dentro del mismo bloque) o, con actualizar=True, actualización de un
+        cliente existente. Luego se aplican las actualizaciones y se insertan
+        los clientes nuevos; si algo falla, se deshace lo aplicado del bloque.
+
+        Args:
+            numero (int): Número del bloque (para el log)
+            resultados (list): Tuplas (cliente, rut_normalizado, error,
+                omitidos) de cada fila, como las de
+                ConstructorClientes.construir_bloque
+            estadisticas (dict): Estadísticas de la importación en curso
+            actualizar (bool): Actualizar los clientes existentes en lugar de
+                descartarlos como duplicados
+        """
+        nuevos = []
+        pendientes = {}  # email -> posición en nuevos
+        actualizaciones = []
+        duplicados = 0
+        actualizados = 0
+        sin_cambios = 0
+        errores = []
+
+        for cliente, rut_normalizado, error, omitidos in resultados:
+            if error is not None:
+                errores.append(error)
+                continue
+
+            # Verificar si ya existe
+            email = cliente.email
+            if email in pendientes:
+                if not actualizar:
+                    duplicados += 1
+                    continue
+                # La última fila del bloque define el cliente a insertar
+                posicion = pendientes[email]
+                anterior = nuevos[posicion][0]
+                if anterior.TIPO != cliente.TIPO:
+                    errores.append(self._mensaje_cambio_tipo(anterior, cliente))
+                elif self._campos_distintos(anterior, cliente, omitidos):
+                    # Los campos que la fila no informa siguen como estaban
+                    for campo in omitidos:
+                        setattr(cliente, campo, getattr(anterior, campo))
+                    nuevos[posicion] = (cliente, rut_normalizado)
+                    actualizados += 1
+                else:
+                    sin_cambios += 1
+                continue
+
+            id_cliente = self.__indice_email.get(email)
+            if id_cliente is not None:
+                if not actualizar:
+                    duplicados += 1
+                    continue
+                existente = self.__almacen.obtener(id_cliente)
+                if existente.TIPO != cliente.TIPO:
+                    errores.append(self._mensaje_cambio_tipo(existente, cliente))
+                else:
+                    actualizaciones.append((existente, cliente, omitidos))
+                continue
+
+            pendientes[email] = len(nuevos)
+            nuevos.append((cliente, rut_normalizado))
+
+        aplicados = []
+        insertados = []
+        try:
+            # Solo los campos que cambian, a través de los setters validados
+            for existente, cliente, omitidos in actualizaciones:
+                cambios = self._campos_distintos(existente, cliente, omitidos)
+                if not cambios:
+                    sin_cambios += 1
+                    continue
+                for campo, valor in cambios.items():
+                    aplicados.append((existente, campo, getattr(existente, campo)))
+                    setattr(existente, campo, valor)
+                actualizados += 1
+
+            # Una inserción ordenada por cliente cuesta O(n) y hace
+            # cuadrática la importación: se indexa el bloque en lote
+            lote = self._lote_vacio()
+            try:
+                for cliente, rut_normalizado in nuevos:
+                    self._insertar(cliente, rut_normalizado, lote)
+                    insertados.append(cliente)
+            finally:
+                self._indexar_lote(lote)
+        except Exception:
+            for cliente in reversed(insertados):
+                self._retirar(cliente)
+            for existente, campo, valor in reversed(aplicados):
+                setattr(existente, campo, valor)
+            raise
+
+        estadisticas["total"] += len(resultados)
+        estadisticas["exitosos"] += len(nuevos)
+        estadisticas["duplicados"] += duplicados
+        estadisticas["errores"] += len(errores)
+        if actualizar:
+            estadisticas["actualizados"] += actualizados
+            estadisticas["sin_cambios"] += sin_cambios
+
+        if errores:
+            self.registrar_actividad(
+                "ERROR",
+                f"Bloque {numero}: {len(errores)} filas con errores "
+                f"(primer error: {errores[0]})",
+            )
+
+    @staticmethod
+    def _estadisticas_iniciales(actualizar=False):
+        """
+        Crea las estadísticas vacías de una importación.
+
+        Args:
+            actualizar (bool): Si la importación actualiza clientes existentes
+
+        Returns:
+            dict: {total, exitosos, errores, duplicados}, más actualizados y
+                sin_cambios si actualizar=True
+        """
+        estadisticas = {"total": 0, "exitosos": 0, "errores": 0, "duplicados": 0}
+        if actualizar:
+            estadisticas["actualizados"] = 0
+            estadisticas["sin_cambios"] = 0
+        return estadisticas
+
+    @staticmethod
+    def _campos_distintos(existente, cliente, omitidos=()):
+        """
+        Compara dos clientes del mismo tipo campo a campo (salvo el email y
+        los campos que la fila no informa).
+
+        Args:
+            existente (Cliente): Cliente registrado
+            cliente (Cliente): Cliente con los datos nuevos
+            omitidos (tuple): Campos que no se comparan
+
+        Returns:
+            dict: Campo -> valor nuevo, solo para los campos que difieren
+        """
+        campos = ("nombre", "telefono", "direccion")
+        campos += CAMPOS_EXTRA_CSV.get(cliente.TIPO, ())
+        cambios = {}
+        for campo in campos:
+            if campo in omitidos:
+                continue
+            valor = getattr(cliente, campo)
+            if getattr(existente, campo) != valor:
+                cambios[campo] = valor
+        return cambios
+
+    @staticmethod
+    def _mensaje_cambio_tipo(existente, cliente):
+        """Mensaje de error para una fila que cambiaría el tipo de un cliente."""
+        return (
+            f"El cliente {cliente.email} ya existe como {existente.TIPO} "
+            f"y la fila es de tipo {cliente.TIPO}"
+        )
 
     def _hacer_backup(self):
-        """Crea un backup del CSV actual antes de importar."""
+        """
+        Crea un backup del CSV actual antes de importar.
+        El backup se guarda comprimido con gzip (si el CSV ya está
+        comprimido, se copia tal cual).
+        """
         try:
             if os.path.exists(self.__ruta_csv):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = f"datos/clientes_backup_{timestamp}.csv"
-                shutil.copy2(self.__ruta_csv, backup_path)
+                if esta_comprimido(self.__ruta_csv):
+                    backup_path += os.path.splitext(self.__ruta_csv)[1]
+                    shutil.copy2(self.__ruta_csv, backup_path)
+                else:
+                    backup_path += ".gz"
+                    with open(self.__ruta_csv, "rb") as origen, escritura_atomica(
+                        backup_path, self.__nivel_compresion, texto=False
+                    ) as destino:
+                        shutil.copyfileobj(origen, destino, 1 << 20)
                 self.registrar_actividad("INFORMACIÓN", f"Backup creado: {backup_path}")
         except Exception as e:
             self.registrar_actividad("ADVERTENCIA", f"Error creando backup: {str(e)}")
@@ -453,42 +2299,133 @@ class GestorClientes:
 
     def _calcular_estadisticas(self):
         """
-        Calcula estadísticas del sistema.
+        Calcula estadísticas del sistema a partir de los agregados que se
+        mantienen en cada alta, baja y actualización (costo constante).
+
+        Returns:
+            dict: Estadísticas calculadas
+
+        Raises:
+            RuntimeError: En modo verificación, si difieren del recálculo completo
+        """
+        regulares = len(self.__por_tipo[ClienteRegular.TIPO])
+        premium = len(self.__por_tipo[ClientePremium.TIPO])
+        max_puntos = self._maximo_indexado("puntos_acumulados")
+        max_descuento = self._maximo_indexado("descuento_exclusivo")
+        suma_descuentos = self.__sumas["descuento_exclusivo"]
+
+        estadisticas = {
+            "total": len(self.__almacen),
+            "regulares": regulares,
+            "premium": premium,
+            "corporativos": len(self.__por_tipo[ClienteCorporativo.TIPO]),
+            "total_puntos": self.__sumas["puntos_acumulados"],
+            "descuento_promedio": suma_descuentos / premium if premium else 0,
+            "max_puntos": max_puntos[1] if max_puntos else 0,
+            "max_descuento": max_descuento[1] if max_descuento else 0,
+            "cliente_max_puntos": max_puntos[0].nombre if max_puntos else "N/A",
+            "cliente_max_descuento": (
+                max_descuento[0].nombre if max_descuento else "N/A"
+            ),
+        }
+
+        if self.__verificar:
+            self.verificar_estadisticas(estadisticas)
+
+        return estadisticas
+
+    def recalcular_estadisticas(self):
+        """
+        Calcula las estadísticas desde cero recorriendo todos los clientes.
+        Es la referencia con la que se contrastan los agregados incrementales.
 
         Returns:
             dict: Estadísticas calculadas
         """
-        regulares = [c for c in self.__clientes if isinstance(c, ClienteRegular)]
-        premium = [c for c in self.__clientes if isinstance(c, ClientePremium)]
-        corporativos = [c for c in self.__clientes if isinstance(c, ClienteCorporativo)]
+        regulares = []
+        premium = []
+        corporativos = 0
+        for cliente in self.__almacen.clientes():
+            if isinstance(cliente, ClienteRegular):
+                regulares.append(cliente)
+            elif isinstance(cliente, ClientePremium):
+                premium.append(cliente)
+            elif isinstance(cliente, ClienteCorporativo):
+                corporativos += 1
+
+        max_puntos = max((c.puntos_acumulados for c in regulares), default=0)
+        max_descuento = max((c.descuento_exclusivo for c in premium), default=0)
+        suma_descuentos = sum(c.descuento_exclusivo for c in premium)
 
         return {
-            "total": len(self.__clientes),
+            "total": len(self.__almacen),
             "regulares": len(regulares),
             "premium": len(premium),
-            "corporativos": len(corporativos),
-            "max_puntos": max([c.puntos_acumulados for c in regulares], default=0),
-            "max_descuento": max([c.descuento_exclusivo for c in premium], default=0),
+            "corporativos": corporativos,
+            "total_puntos": sum(c.puntos_acumulados for c in regulares),
+            "descuento_promedio": suma_descuentos / len(premium) if premium else 0,
+            "max_puntos": max_puntos,
+            "max_descuento": max_descuento,
             "cliente_max_puntos": next(
-                (
-                    c.nombre
-                    for c in regulares
-                    if c.puntos_acumulados
-                    == max([x.puntos_acumulados for x in regulares], default=0)
-                ),
+                (c.nombre for c in regulares if c.puntos_acumulados == max_puntos),
                 "N/A",
             ),
             "cliente_max_descuento": next(
-                (
-                    c.nombre
-                    for c in premium
-                    if c.descuento_exclusivo
-                    == max([x.descuento_exclusivo for x in premium], default=0)
-                ),
+                (c.nombre for c in premium if c.descuento_exclusivo == max_descuento),
                 "N/A",
             ),
         }
 
+    def verificar_estadisticas(self, estadisticas=None):
+        """
+        Contrasta las estadísticas incrementales con un recálculo completo.
+
+        Args:
+            estadisticas (dict): Estadísticas a verificar (default: las actuales)
+
+        Returns:
+            bool: True si coinciden
+
+        Raises:
+            RuntimeError: Si algún valor difiere
+        """
+        if estadisticas is None:
+            verificar, self.__verificar = self.__verificar, False
+            try:
+                estadisticas = self._calcular_estadisticas()
+            finally:
+                self.__verificar = verificar
+
+        esperadas = self.recalcular_estadisticas()
+        diferencias = []
+        for clave, esperado in esperadas.items():
+            obtenido = estadisticas.get(clave)
+            if isinstance(esperado, float) or isinstance(obtenido, float):
+                coincide = math.isclose(obtenido, esperado, abs_tol=1e-6)
+            else:
+                coincide = obtenido == esperado
+            if not coincide:
+                diferencias.append(f"{clave}: {obtenido} != {esperado}")
+
+        if diferencias:
+            mensaje = f"Estadísticas inconsistentes: {'; '.join(diferencias)}"
+            self.registrar_actividad("ERROR", mensaje)
+            raise RuntimeError(mensaje)
+        return True
+
+    def _maximo_indexado(self, campo):
+        """
+        Obtiene el cliente con mayor valor de un campo desde su índice ordenado.
+
+        Returns:
+            tuple: (Cliente, valor) o None si no hay clientes de ese tipo
+        """
+        maximo = self.__indices_ordenados[campo].maximo()
+        if maximo is None:
+            return None
+        id_cliente, valor = maximo
+        return self.__almacen.obtener(id_cliente), valor
+
     def _generar_contenido_reporte(self, estadisticas):
         """
         Genera el contenido del reporte.
@@ -515,6 +2452,9 @@ Clientes Regulares: {estadisticas['regulares']}
 Clientes Premium: {estadisticas['premium']}
 Clientes Corporativos: {estadisticas['corporativos']}
 
+Puntos acumulados (Regulares): {estadisticas['total_puntos']}
+Descuento promedio (Premium): {estadisticas['descuento_promedio']:.2f}%
+
 ESTADÍSTICAS AVANZADAS:
 {linea}
 Cliente Regular con más puntos: {estadisticas['cliente_max_puntos']}
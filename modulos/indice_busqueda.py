@@ -0,0 +1,166 @@
+"""
+Módulo del índice de búsqueda por nombre.
+Implementa un índice invertido de trigramas para búsquedas por subcadena.
+"""
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido que asocia cada trigrama (secuencia de 3 caracteres)
+    con las claves cuyos textos lo contienen.
+
+    Una búsqueda por subcadena intersecta las listas de los trigramas de la
+    consulta, empezando por la más corta, y verifica solo los candidatos
+    resultantes en lugar de recorrer todos los textos.
+
+    Atributos privados:
+        __postings (dict): Trigrama -> conjunto de claves
+        __textos (dict): Clave -> texto normalizado
+        __cortos (set): Claves cuyo texto tiene menos de 3 caracteres
+        __pendientes (list): Pares (clave, texto) agregados en lote que aún
+            no se indexan (se indexan en la primera consulta o modificación)
+    """
+
+    TAMANO_NGRAMA = 3
+
+    def __init__(self):
+        """Inicializa un índice vacío."""
+        self.__postings = {}
+        self.__textos = {}
+        self.__cortos = set()
+        self.__pendientes = []
+
+    @staticmethod
+    def _normalizar(texto):
+        """Normaliza un texto para indexarlo (insensible a mayúsculas)."""
+        return texto.lower()
+
+    @classmethod
+    def _trigramas(cls, texto):
+        """
+        Obtiene los trigramas distintos de un texto normalizado.
+
+        Args:
+            texto (str): Texto normalizado
+
+        Returns:
+            set: Trigramas del texto
+        """
+        n = cls.TAMANO_NGRAMA
+        return {texto[i : i + n] for i in range(len(texto) - n + 1)}
+
+    def __len__(self):
+        """Cantidad de claves indexadas."""
+        return len(self.__textos) + len(self.__pendientes)
+
+    def agregar(self, clave, texto):
+        """
+        Indexa un texto bajo una clave.
+
+        Args:
+            clave: Identificador asociado al texto
+            texto (str): Texto a indexar
+        """
+        normalizado = self._normalizar(texto)
+        self.__textos[clave] = normalizado
+
+        if len(normalizado) < self.TAMANO_NGRAMA:
+            self.__cortos.add(clave)
+            return
+
+        for trigrama in self._trigramas(normalizado):
+            claves = self.__postings.get(trigrama)
+            if claves is None:
+                self.__postings[trigrama] = {clave}
+            else:
+                claves.add(clave)
+
+    def agregar_varios(self, pares):
+        """
+        Agrega muchos textos difiriendo su indexación hasta la primera
+        búsqueda o modificación, para que una carga masiva no pague el
+        costo del índice si nunca se consulta.
+
+        Args:
+            pares (iterable): Pares (clave, texto)
+        """
+        self.__pendientes.extend(pares)
+
+    def _indexar_pendientes(self):
+        """Indexa los textos agregados en lote que estaban pendientes."""
+        pendientes, self.__pendientes = self.__pendientes, []
+        for clave, texto in pendientes:
+            self.agregar(clave, texto)
+
+    def eliminar(self, clave):
+        """
+        Elimina una clave del índice.
+
+        Args:
+            clave: Identificador a eliminar
+        """
+        if self.__pendientes:
+            self._indexar_pendientes()
+        normalizado = self.__textos.pop(clave, None)
+        if normalizado is None:
+            return
+
+        self.__cortos.discard(clave)
+        for trigrama in self._trigramas(normalizado):
+            claves = self.__postings.get(trigrama)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self.__postings[trigrama]
+
+    def actualizar(self, clave, texto):
+        """
+        Reindexa una clave con un texto nuevo.
+
+        Args:
+            clave: Identificador a reindexar
+            texto (str): Nuevo texto
+        """
+        self.eliminar(clave)
+        self.agregar(clave, texto)
+
+    def buscar(self, subcadena):
+        """
+        Busca las claves cuyo texto contiene la subcadena.
+
+        Args:
+            subcadena (str): Texto a buscar (insensible a mayúsculas)
+
+        Returns:
+            set: Claves cuyo texto contiene la subcadena
+        """
+        if self.__pendientes:
+            self._indexar_pendientes()
+        consulta = self._normalizar(subcadena)
+
+        if not consulta:
+            return set(self.__textos)
+
+        if len(consulta) < self.TAMANO_NGRAMA:
+            # Consultas cortas: unir las listas de los trigramas que la contienen
+            candidatos = set(self.__cortos)
+            for trigrama, claves in self.__postings.items():
+                if consulta in trigrama:
+                    candidatos |= claves
+        else:
+            listas = []
+            for trigrama in self._trigramas(consulta):
+                claves = self.__postings.get(trigrama)
+                if not claves:
+                    return set()
+                listas.append(claves)
+
+            listas.sort(key=len)
+            candidatos = set(listas[0])
+            for claves in listas[1:]:
+                candidatos &= claves
+                if not candidatos:
+                    return candidatos
+
+        # Los trigramas pueden coincidir fuera de orden: verificar candidatos
+        return {clave for clave in candidatos if consulta in self.__textos[clave]}
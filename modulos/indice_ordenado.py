@@ -0,0 +1,130 @@
+"""
+Módulo del índice ordenado por valor.
+Permite consultar los K clientes con mayor valor de un campo numérico.
+"""
+
+from bisect import bisect_left, insort
+
+
+class IndiceOrdenado:
+    """
+    Índice que mantiene claves ordenadas por un valor numérico.
+
+    Las entradas se guardan como tuplas (valor, -clave) en una lista
+    ordenada, de modo que el final de la lista contiene los mayores valores
+    y, ante empates, la clave más antigua (menor) aparece primero.
+
+    La posición se busca en O(log n), pero insertar o borrar en la lista
+    desplaza las entradas siguientes: agregar, eliminar y actualizar cuestan
+    O(n) cada uno. Para muchas claves nuevas, agregar_varios las ordena
+    juntas en O(n log n) y deja el mismo orden que agregarlas de a una.
+
+    Atributos privados:
+        __entradas (list): Lista ordenada de tuplas (valor, -clave)
+        __valores (dict): Clave -> valor indexado
+        __pendientes (list): Tuplas (valor, -clave) agregadas en lote que aún
+            no se ordenan (se incorporan en la primera consulta o modificación)
+    """
+
+    def __init__(self):
+        """Inicializa un índice vacío."""
+        self.__entradas = []
+        self.__valores = {}
+        self.__pendientes = []
+
+    def __len__(self):
+        """Cantidad de claves indexadas."""
+        return len(self.__valores)
+
+    def agregar(self, clave, valor):
+        """
+        Indexa una clave con su valor. Costo O(n) (ver la clase).
+
+        Args:
+            clave (int): Identificador a indexar
+            valor (int/float): Valor por el que se ordena
+        """
+        if self.__pendientes:
+            self._ordenar_pendientes()
+        self.__valores[clave] = valor
+        insort(self.__entradas, (valor, -clave))
+
+    def agregar_varios(self, pares):
+        """
+        Indexa muchas claves a la vez difiriendo su ordenamiento hasta la
+        primera consulta o modificación: varios lotes seguidos se ordenan
+        juntos una sola vez, O(n log n), en vez de una inserción ordenada
+        por clave (o un reordenamiento por lote).
+
+        Args:
+            pares (iterable): Pares (clave, valor)
+        """
+        valores = self.__valores
+        pendientes = self.__pendientes
+        for clave, valor in pares:
+            valores[clave] = valor
+            pendientes.append((valor, -clave))
+
+    def _ordenar_pendientes(self):
+        """Incorpora a la lista ordenada las entradas agregadas en lote."""
+        self.__entradas.extend(self.__pendientes)
+        self.__entradas.sort()
+        self.__pendientes = []
+
+    def eliminar(self, clave):
+        """
+        Elimina una clave del índice. Costo O(n) (ver la clase).
+
+        Args:
+            clave (int): Identificador a eliminar
+        """
+        valor = self.__valores.pop(clave, None)
+        if valor is None:
+            return
+        if self.__pendientes:
+            self._ordenar_pendientes()
+        posicion = bisect_left(self.__entradas, (valor, -clave))
+        del self.__entradas[posicion]
+
+    def actualizar(self, clave, valor):
+        """
+        Cambia el valor de una clave ya indexada. Costo O(n) (ver la clase).
+
+        Args:
+            clave (int): Identificador a actualizar
+            valor (int/float): Nuevo valor
+        """
+        self.eliminar(clave)
+        self.agregar(clave, valor)
+
+    def mayores(self, k):
+        """
+        Obtiene las K claves con mayor valor, de mayor a menor. Costo O(k).
+
+        Args:
+            k (int): Cantidad de claves a obtener
+
+        Returns:
+            list: Tuplas (clave, valor) ordenadas de mayor a menor valor
+        """
+        if k <= 0:
+            return []
+        if self.__pendientes:
+            self._ordenar_pendientes()
+        return [
+            (-clave_neg, valor) for valor, clave_neg in self.__entradas[: -k - 1 : -1]
+        ]
+
+    def maximo(self):
+        """
+        Obtiene la clave con mayor valor.
+
+        Returns:
+            tuple: (clave, valor) o None si el índice está vacío
+        """
+        if self.__pendientes:
+            self._ordenar_pendientes()
+        if not self.__entradas:
+            return None
+        valor, clave_neg = self.__entradas[-1]
+        return -clave_neg, valor
@@ -4,6 +4,8 @@ Contiene funciones de validación con expresiones regulares (regex).
 """
 
 import re
+from functools import wraps
+from .cache_lru import CacheLRU
 from .excepciones import (
     EmailInvalidoError,
     TelefonoInvalidoError,
@@ -11,7 +13,126 @@ from .excepciones import (
     DatosInvalidosError,
 )
 
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el cálculo dígito a dígito
+    np = None
 
+# Patrones precompilados (se compilan una sola vez al importar el módulo)
+_PATRON_EMAIL = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PATRON_TELEFONO = re.compile(r"^\+?56[9]?\d{8}$|^0?9\d{8}$")
+_PATRON_RUT = re.compile(r"^\d{7,8}-[\dK]$")
+
+# Códigos de resultado de las validaciones por lote
+VALIDO = "ok"
+ERROR_FORMATO = "formato_invalido"
+ERROR_DIGITO_VERIFICADOR = "digito_verificador_invalido"
+
+# Errores de validación cuyo resultado se puede guardar en la caché
+_ERRORES_CACHEABLES = (
+    EmailInvalidoError,
+    TelefonoInvalidoError,
+    RutInvalidoError,
+    DatosInvalidosError,
+)
+
+# Caché LRU de resultados (None: desactivada, es opcional)
+_cache = None
+
+
+# ======================== CACHÉ DE VALIDACIONES ========================
+
+
+def activar_cache_validaciones(tamano_maximo=4096):
+    """
+    Activa una caché LRU delante de validar_email, validar_telefono y
+    validar_rut. Reemplaza la caché anterior si ya estaba activa.
+
+    Args:
+        tamano_maximo (int): Cantidad máxima de resultados guardados
+
+    Raises:
+        ValueError: Si el tamaño máximo no es positivo
+    """
+    global _cache
+    _cache = CacheLRU(tamano_maximo)
+
+
+def desactivar_cache_validaciones():
+    """Desactiva la caché de validaciones y descarta sus resultados."""
+    global _cache
+    _cache = None
+
+
+def limpiar_cache_validaciones():
+    """Descarta los resultados guardados y reinicia los contadores."""
+    if _cache is not None:
+        _cache.limpiar()
+
+
+def estadisticas_cache_validaciones():
+    """
+    Obtiene el estado de la caché de validaciones.
+
+    Returns:
+        dict: activa, tamano, tamano_maximo, aciertos y fallos
+    """
+    if _cache is None:
+        return {
+            "activa": False,
+            "tamano": 0,
+            "tamano_maximo": 0,
+            "aciertos": 0,
+            "fallos": 0,
+        }
+    return {"activa": True, **_cache.estadisticas()}
+
+
+def _con_cache(validador):
+    """
+    Decorador que consulta la caché de validaciones antes de validar.
+
+    Se guarda True para los valores válidos y (clase, args) del error para
+    los inválidos, de modo que un fallo en caché lanza una excepción del
+    mismo tipo y con el mismo mensaje que la validación original.
+
+    Args:
+        validador (function): Función de validación de un solo argumento
+
+    Returns:
+        function: Validador con caché
+    """
+    nombre = validador.__name__
+
+    @wraps(validador)
+    def envoltura(valor):
+        cache = _cache
+        if cache is None or not isinstance(valor, str):
+            return validador(valor)
+
+        clave = (nombre, valor)
+        resultado = cache.obtener(clave)
+        if resultado is None:
+            try:
+                resultado = validador(valor)
+            except _ERRORES_CACHEABLES as e:
+                cache.guardar(clave, (type(e), e.args))
+                raise
+            cache.guardar(clave, resultado)
+            return resultado
+
+        if resultado is True:
+            return True
+        clase, argumentos = resultado
+        raise clase(*argumentos)
+
+    return envoltura
+
+
+# ======================== VALIDACIONES INDIVIDUALES ========================
+
+
+@_con_cache
 def validar_email(email):
     """
     Valida el formato de un email.
@@ -25,12 +146,12 @@ def validar_email(email):
     Raises:
         EmailInvalidoError: Si el email no cumple el formato esperado
     """
-    patron = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(patron, email):
+    if not _PATRON_EMAIL.match(email):
         raise EmailInvalidoError(f"El email '{email}' no tiene un formato válido.")
     return True
 
 
+@_con_cache
 def validar_telefono(telefono):
     """
     Valida el formato de un teléfono chileno.
@@ -45,12 +166,11 @@ def validar_telefono(telefono):
     Raises:
         TelefonoInvalidoError: Si el teléfono no cumple el formato esperado
     """
-    # Remover espacios
+    # Remover espacios y guiones
     telefono_limpio = telefono.replace(" ", "").replace("-", "")
 
     # Patrón para teléfono chileno
-    patron = r"^\+?56[9]?\d{8}$|^0?9\d{8}$"
-    if not re.match(patron, telefono_limpio):
+    if not _PATRON_TELEFONO.match(telefono_limpio):
         raise TelefonoInvalidoError(
             f"El teléfono '{telefono}' no tiene un formato válido. "
             "Use: +56912345678 o 0912345678"
@@ -58,6 +178,7 @@ def validar_telefono(telefono):
     return True
 
 
+@_con_cache
 def validar_rut(rut):
     """
     Valida el formato del RUT chileno con dígito verificador (algoritmo módulo 11).
@@ -72,22 +193,33 @@ def validar_rut(rut):
     Raises:
         RutInvalidoError: Si el RUT es inválido
     """
-    # Remover puntos y espacios
-    rut_limpio = rut.replace(".", "").replace(" ", "").upper()
+    _, digito_esperado, digito_calculado = _analizar_rut(rut)
 
     # Validar formato básico
-    if not re.match(r"^\d{7,8}-[\dK]$", rut_limpio):
+    if digito_esperado is None:
         raise RutInvalidoError(
             f"El RUT '{rut}' no tiene un formato válido. " "Use: 12.345.678-9"
         )
 
-    # Separar número y dígito verificador
-    partes = rut_limpio.split("-")
-    numero_str = partes[0]
-    digito_esperado = partes[1]
+    if digito_esperado != digito_calculado:
+        raise RutInvalidoError(
+            f"El RUT '{rut}' tiene un dígito verificador inválido. "
+            f"Esperado: {digito_calculado}, Recibido: {digito_esperado}"
+        )
+
+    return True
+
+
+def calcular_digito_verificador(numero):
+    """
+    Calcula el dígito verificador de un RUT (algoritmo módulo 11).
+
+    Args:
+        numero (int): Parte numérica del RUT
 
-    # Calcular dígito verificador (módulo 11)
-    numero = int(numero_str)
+    Returns:
+        str: Dígito verificador ("0"-"9" o "K")
+    """
     suma = 0
     multiplicador = 2
 
@@ -101,19 +233,32 @@ def validar_rut(rut):
     digito_verificador = 11 - (suma % 11)
 
     if digito_verificador == 11:
-        digito_calculado = "0"
+        return "0"
     elif digito_verificador == 10:
-        digito_calculado = "K"
-    else:
-        digito_calculado = str(digito_verificador)
+        return "K"
+    return str(digito_verificador)
 
-    if digito_esperado != digito_calculado:
-        raise RutInvalidoError(
-            f"El RUT '{rut}' tiene un dígito verificador inválido. "
-            f"Esperado: {digito_calculado}, Recibido: {digito_esperado}"
-        )
 
-    return True
+def _analizar_rut(rut):
+    """
+    Normaliza un RUT y calcula su dígito verificador.
+
+    Args:
+        rut (str): RUT a analizar
+
+    Returns:
+        tuple: (rut_limpio, digito_recibido, digito_calculado); los dígitos
+            son None si el RUT no tiene un formato válido
+    """
+    # Remover puntos y espacios
+    rut_limpio = rut.replace(".", "").replace(" ", "").upper()
+
+    if not _PATRON_RUT.match(rut_limpio):
+        return rut_limpio, None, None
+
+    # Separar número y dígito verificador
+    numero_str, digito_esperado = rut_limpio.split("-")
+    return rut_limpio, digito_esperado, calcular_digito_verificador(int(numero_str))
 
 
 def validar_texto_no_vacio(texto, campo):
@@ -189,3 +334,124 @@ def validar_rango_numero(numero, campo, minimo, maximo):
         raise DatosInvalidosError(
             f"El campo '{campo}' debe estar entre {minimo} y {maximo}."
         )
+
+
+# ======================== VALIDACIONES POR LOTE ========================
+
+
+def validar_emails(emails):
+    """
+    Valida un lote de emails en un solo recorrido.
+
+    Args:
+        emails (iterable): Emails a validar
+
+    Returns:
+        list: Un código por email: VALIDO o ERROR_FORMATO
+    """
+    coincide = _PATRON_EMAIL.match
+    return [
+        VALIDO if isinstance(email, str) and coincide(email) else ERROR_FORMATO
+        for email in emails
+    ]
+
+
+def validar_telefonos(telefonos):
+    """
+    Valida un lote de teléfonos chilenos en un solo recorrido.
+
+    Args:
+        telefonos (iterable): Teléfonos a validar
+
+    Returns:
+        list: Un código por teléfono: VALIDO o ERROR_FORMATO
+    """
+    coincide = _PATRON_TELEFONO.match
+    return [
+        (
+            VALIDO
+            if isinstance(telefono, str)
+            and coincide(telefono.replace(" ", "").replace("-", ""))
+            else ERROR_FORMATO
+        )
+        for telefono in telefonos
+    ]
+
+
+def validar_ruts(ruts):
+    """
+    Valida un lote de RUTs (formato y dígito verificador) en un solo recorrido.
+
+    Args:
+        ruts (iterable): RUTs a validar
+
+    Returns:
+        list: Un código por RUT: VALIDO, ERROR_FORMATO o ERROR_DIGITO_VERIFICADOR
+    """
+    return normalizar_ruts(ruts)[1]
+
+
+# Dígito verificador según el valor 11 - (suma % 11), que va de 1 a 11
+_DIGITOS_MODULO_11 = ("", "1", "2", "3", "4", "5", "6", "7", "8", "9", "K", "0")
+
+
+def calcular_digitos_verificadores(numeros):
+    """
+    Calcula los dígitos verificadores de muchos RUTs a la vez.
+
+    Con NumPy el algoritmo módulo 11 se aplica sobre el arreglo completo,
+    una posición decimal por pasada (a lo más 8 pasadas); sin NumPy se
+    calcula número a número. Ambos caminos dan el mismo resultado que
+    calcular_digito_verificador.
+
+    Args:
+        numeros (list): Partes numéricas de los RUTs (hasta 8 dígitos)
+
+    Returns:
+        list: Dígitos verificadores ("0"-"9" o "K")
+    """
+    if np is None or not numeros:
+        return [calcular_digito_verificador(numero) for numero in numeros]
+
+    restantes = np.asarray(numeros, dtype=np.int64)
+    suma = np.zeros_like(restantes)
+    for posicion in range(8):
+        suma += (restantes % 10) * (2 + posicion % 6)
+        restantes //= 10
+
+    tabla = np.array(_DIGITOS_MODULO_11)
+    return tabla[11 - suma % 11].tolist()
+
+
+def normalizar_ruts(ruts):
+    """
+    Normaliza y valida un lote de RUTs, calculando los dígitos verificadores
+    de todo el lote en una sola operación.
+
+    Args:
+        ruts (iterable): RUTs a procesar
+
+    Returns:
+        tuple: (normalizados, codigos) donde normalizados es la lista de RUTs
+            sin puntos ni espacios y en mayúsculas, y codigos tiene un código
+            por RUT: VALIDO, ERROR_FORMATO o ERROR_DIGITO_VERIFICADOR
+    """
+    normalizados = [
+        rut.replace(".", "").replace(" ", "").upper() if isinstance(rut, str) else ""
+        for rut in ruts
+    ]
+    codigos = [ERROR_FORMATO] * len(normalizados)
+
+    coincide = _PATRON_RUT.match
+    con_formato = [i for i, rut in enumerate(normalizados) if coincide(rut)]
+    digitos = calcular_digitos_verificadores(
+        [int(normalizados[i][:-2]) for i in con_formato]
+    )
+
+    for i, digito in zip(con_formato, digitos):
+        if normalizados[i][-1] == digito:
+            codigos[i] = VALIDO
+        else:
+            codigos[i] = ERROR_DIGITO_VERIFICADOR
+
+    return normalizados, codigos
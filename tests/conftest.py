@@ -0,0 +1,57 @@
+"""
+Configuración común de las pruebas del Gestor Inteligente de Clientes.
+"""
+
+import csv
+import os
+import sys
+
+import pytest
+
+# Permite importar el paquete modulos desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos.formato_csv import ENCABEZADOS_CSV  # noqa: E402
+
+
+@pytest.fixture
+def directorio(tmp_path, monkeypatch):
+    """Ejecuta la prueba en un directorio temporal (datos/, logs/, reportes/)."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def escribir_csv(directorio):
+    """Devuelve una función que escribe filas de clientes en un CSV."""
+
+    def escribir(nombre, filas, encabezados=ENCABEZADOS_CSV):
+        ruta = str(directorio / nombre)
+        with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(encabezados)
+            escritor.writerows(filas)
+        return ruta
+
+    return escribir
+
+
+@pytest.fixture
+def filas_de_clientes():
+    """Devuelve una función que arma filas válidas de los tres tipos."""
+
+    def filas(cantidad, inicio=0):
+        resultado = []
+        for i in range(inicio, inicio + cantidad):
+            base = [f"Cliente {i}", f"c{i}@ejemplo.cl", "+56912345678", f"Calle {i}"]
+            if i % 3 == 0:
+                resultado.append(["Regular", *base, i, "", ""])
+            elif i % 3 == 1:
+                resultado.append(["Premium", *base, 15, "2024-01-15", ""])
+            else:
+                resultado.append(
+                    ["Corporativo", *base, "Empresa", "76.086.428-5", "Juan"]
+                )
+        return resultado
+
+    return filas
@@ -0,0 +1,57 @@
+"""
+Pruebas de los backends de almacenamiento.
+"""
+
+import csv
+
+import pytest
+
+from modulos import ClienteCorporativo, ClientePremium, ClienteRegular, GestorClientes
+
+
+def _leer_exportacion(ruta):
+    """Filas del CSV exportado, sin el encabezado."""
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        return list(csv.reader(archivo))[1:]
+
+
+@pytest.mark.parametrize("almacen", ["objetos", "columnar"])
+def test_actualizar_todos_los_campos(directorio, almacen):
+    """Cada campo modificable se refleja en el almacén (y en la exportación)."""
+    gestor = GestorClientes(ruta_csv="datos/c.csv", almacen=almacen)
+    gestor.agregar_cliente(
+        ClienteRegular("Ana", "ana@x.cl", "+56912345678", "Calle 1", 5)
+    )
+    gestor.agregar_cliente(
+        ClientePremium("Bea", "bea@x.cl", "+56912345678", "Calle 1", 10, "2024-01-01")
+    )
+    gestor.agregar_cliente(
+        ClienteCorporativo(
+            "Emp", "emp@x.cl", "+56912345678", "Calle 1", "E", "76.086.428-5", "C"
+        )
+    )
+
+    comunes = {"nombre": "Nuevo", "telefono": "+56987654321", "direccion": "Otra 2"}
+    gestor.actualizar_cliente("ana@x.cl", {**comunes, "puntos_acumulados": 7})
+    gestor.actualizar_cliente(
+        "bea@x.cl",
+        {**comunes, "descuento_exclusivo": 20, "fecha_membresia": "2025-02-02"},
+    )
+    gestor.actualizar_cliente(
+        "emp@x.cl",
+        {
+            **comunes,
+            "empresa": "E2",
+            "rut_empresa": "11.111.111-1",
+            "contacto_principal": "C2",
+        },
+    )
+    gestor.actualizar_cliente("emp@x.cl", {"email": "emp2@x.cl"})
+    gestor.exportar_a_csv()
+
+    base = ["Nuevo", "+56987654321", "Otra 2"]
+    assert _leer_exportacion("datos/c.csv") == [
+        ["Regular", base[0], "ana@x.cl", *base[1:], "7", "", ""],
+        ["Premium", base[0], "bea@x.cl", *base[1:], "20.0", "2025-02-02", ""],
+        ["Corporativo", base[0], "emp2@x.cl", *base[1:], "E2", "11111111-1", "C2"],
+    ]
@@ -0,0 +1,170 @@
+"""
+Pruebas del alta masiva de clientes (agregar_clientes).
+"""
+
+import pytest
+
+from modulos import (
+    ClienteCorporativo,
+    ClienteExistenteError,
+    ClientePremium,
+    ClienteRegular,
+    DatosInvalidosError,
+    GestorClientes,
+)
+
+TELEFONO = "+56912345678"
+
+
+def _regular(nombre, email, puntos=0):
+    """Cliente regular de prueba."""
+    return ClienteRegular(nombre, email, TELEFONO, "Calle 1", puntos)
+
+
+def _premium(nombre, email, descuento=10):
+    """Cliente premium de prueba."""
+    return ClientePremium(nombre, email, TELEFONO, "Calle 1", descuento, "2024-01-01")
+
+
+def _corporativo(nombre, email, rut):
+    """Cliente corporativo de prueba."""
+    return ClienteCorporativo(nombre, email, TELEFONO, "Calle 1", "Emp", rut, "Juan")
+
+
+def _gestor_inicial():
+    """Gestor con un cliente de cada tipo."""
+    gestor = GestorClientes()
+    gestor.agregar_cliente(_regular("Ana Rojas", "ana@x.cl", 50))
+    gestor.agregar_cliente(_premium("Beatriz Soto", "bea@x.cl", 20))
+    gestor.agregar_cliente(_corporativo("Carla Mena", "carla@x.cl", "76.086.428-5"))
+    return gestor
+
+
+def _estado_indices(gestor):
+    """Lo que muestran los índices de email, nombre, tipo, RUT y top-K."""
+
+    def emails(clientes):
+        return [cliente.email for cliente in clientes]
+
+    nombres = ["Ana", "Beatriz", "Carla", "Daniel", "Elena", "Rojas", "Mena"]
+    return {
+        "emails": {
+            cliente.email: cliente.to_dict() for cliente in gestor.listar_clientes()
+        },
+        "nombres": {n: sorted(emails(gestor.buscar_clientes(n))) for n in nombres},
+        "tipos": {
+            tipo: emails(gestor.listar_por_tipo(tipo))
+            for tipo in ("Regular", "Premium", "Corporativo")
+        },
+        "conteo": gestor.contar_por_tipo(),
+        "ruts": {
+            rut: emails(gestor.buscar_por_rut(rut))
+            for rut in ("76.086.428-5", "11.111.111-1", "12.345.678-5")
+        },
+        "puntos": emails(gestor.top_k("puntos_acumulados", 10)),
+        "descuentos": emails(gestor.top_k("descuento_exclusivo", 10)),
+    }
+
+
+def test_omitir_descarta_duplicados(directorio):
+    """Con "omitir" los duplicados (registrados o del lote) no se agregan."""
+    gestor = _gestor_inicial()
+    resultados = gestor.agregar_clientes(
+        [
+            _regular("Daniel", "dani@x.cl", 10),
+            _regular("Otra Ana", "ana@x.cl", 99),
+            _premium("Elena", "elena@x.cl"),
+            _premium("Elena Bis", "elena@x.cl"),
+            "no es un cliente",
+        ]
+    )
+
+    assert resultados == ["agregado", "duplicado", "agregado", "duplicado", "invalido"]
+    assert gestor.contar_clientes() == 5
+    assert gestor.buscar_cliente("ana@x.cl").puntos_acumulados == 50
+    assert gestor.buscar_cliente("elena@x.cl").nombre == "Elena"
+
+
+def test_reemplazar_sustituye_al_existente(directorio):
+    """Con "reemplazar" gana el último cliente de cada email."""
+    gestor = _gestor_inicial()
+    resultados = gestor.agregar_clientes(
+        [
+            _regular("Daniel", "dani@x.cl", 10),
+            _regular("Otra Ana", "ana@x.cl", 99),
+            _premium("Elena", "elena@x.cl"),
+            _premium("Elena Bis", "elena@x.cl"),
+            None,
+        ],
+        on_duplicate="reemplazar",
+    )
+
+    assert resultados == [
+        "agregado",
+        "reemplazado",
+        "duplicado",
+        "agregado",
+        "invalido",
+    ]
+    assert gestor.contar_clientes() == 5
+    assert gestor.buscar_cliente("ana@x.cl").puntos_acumulados == 99
+    assert gestor.buscar_cliente("elena@x.cl").nombre == "Elena Bis"
+
+
+def test_error_rechaza_el_lote_completo(directorio):
+    """Con "error" un duplicado rechaza el lote sin agregar a nadie."""
+    gestor = _gestor_inicial()
+    antes = _estado_indices(gestor)
+
+    with pytest.raises(ClienteExistenteError):
+        gestor.agregar_clientes(
+            [_regular("Daniel", "dani@x.cl"), _premium("Bea", "bea@x.cl")],
+            on_duplicate="error",
+        )
+    with pytest.raises(ClienteExistenteError):
+        gestor.agregar_clientes(
+            [_regular("Daniel", "dani@x.cl"), _regular("Dani", "dani@x.cl")],
+            on_duplicate="error",
+        )
+
+    assert _estado_indices(gestor) == antes
+
+
+def test_opcion_no_valida(directorio):
+    """Una opción on_duplicate desconocida se rechaza."""
+    with pytest.raises(DatosInvalidosError):
+        GestorClientes().agregar_clientes([], on_duplicate="sobrescribir")
+
+
+def test_indices_iguales_a_altas_individuales(directorio):
+    """Tras un lote con reemplazos, los índices quedan como con altas una a una."""
+
+    def lote():
+        return [
+            _regular("Daniel Rojas", "dani@x.cl", 70),
+            # Reemplazos: cambian nombre, puntos, tipo y RUT
+            _regular("Ana Mena", "ana@x.cl", 5),
+            _corporativo("Beatriz Soto", "bea@x.cl", "11.111.111-1"),
+            _corporativo("Carla Mena", "carla@x.cl", "12.345.678-5"),
+            _premium("Elena Rojas", "elena@x.cl", 30),
+        ]
+
+    masivo = _gestor_inicial()
+    masivo.agregar_clientes(lote(), on_duplicate="reemplazar")
+
+    individual = _gestor_inicial()
+    for cliente in lote():
+        if individual.buscar_cliente(cliente.email) is not None:
+            individual.eliminar_cliente(cliente.email)
+        individual.agregar_cliente(cliente)
+
+    estado = _estado_indices(masivo)
+    assert estado == _estado_indices(individual)
+    assert estado["ruts"] == {
+        "76.086.428-5": [],
+        "11.111.111-1": ["bea@x.cl"],
+        "12.345.678-5": ["carla@x.cl"],
+    }
+    assert estado["nombres"]["Rojas"] == ["dani@x.cl", "elena@x.cl"]
+    assert estado["puntos"] == ["dani@x.cl", "ana@x.cl"]
+    assert masivo.verificar_estadisticas()
@@ -0,0 +1,68 @@
+"""
+Pruebas de la escritura atómica y comprimida de archivos.
+"""
+
+import gzip
+import os
+import stat
+
+import pytest
+
+from modulos.compresion import escritura_atomica
+
+posix = pytest.mark.skipif(os.name != "posix", reason="permisos POSIX")
+
+
+def _permisos(ruta):
+    return stat.S_IMODE(os.stat(ruta).st_mode)
+
+
+def test_escritura_comprimida(directorio):
+    """El contenido se comprime según la extensión del destino."""
+    with escritura_atomica("datos.csv.gz") as archivo:
+        archivo.write("a,b\n1,2\n")
+    with gzip.open("datos.csv.gz", "rt", encoding="utf-8") as archivo:
+        assert archivo.read() == "a,b\n1,2\n"
+    assert os.listdir(directorio) == ["datos.csv.gz"]
+
+
+@posix
+def test_archivo_nuevo_respeta_la_umask(directorio):
+    """Un archivo nuevo no queda con los permisos 0600 del temporal."""
+    umask = os.umask(0o022)
+    try:
+        with escritura_atomica("nuevo.csv") as archivo:
+            archivo.write("x\n")
+    finally:
+        os.umask(umask)
+    assert _permisos("nuevo.csv") == 0o644
+
+
+@posix
+def test_reemplazo_conserva_los_permisos(directorio):
+    """Al reemplazar un archivo se mantienen sus permisos."""
+    with open("existente.csv", "w") as archivo:
+        archivo.write("viejo\n")
+    os.chmod("existente.csv", 0o640)
+
+    with escritura_atomica("existente.csv") as archivo:
+        archivo.write("nuevo\n")
+
+    assert _permisos("existente.csv") == 0o640
+    with open("existente.csv") as archivo:
+        assert archivo.read() == "nuevo\n"
+
+
+def test_error_deja_el_archivo_anterior(directorio):
+    """Si la escritura falla, el destino queda intacto y no hay temporales."""
+    with open("datos.csv", "w") as archivo:
+        archivo.write("viejo\n")
+
+    with pytest.raises(RuntimeError):
+        with escritura_atomica("datos.csv") as archivo:
+            archivo.write("nuevo\n")
+            raise RuntimeError("fallo")
+
+    with open("datos.csv") as archivo:
+        assert archivo.read() == "viejo\n"
+    assert os.listdir(directorio) == ["datos.csv"]
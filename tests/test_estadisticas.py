@@ -0,0 +1,53 @@
+"""
+Pruebas de las estadísticas incrementales del gestor.
+"""
+
+import pytest
+
+from modulos import ClientePremium, ClienteRegular, GestorClientes
+
+
+@pytest.mark.parametrize("almacen", ["objetos", "columnar"])
+def test_estadisticas_coinciden_con_recalculo(escribir_csv, filas_de_clientes, almacen):
+    """Tras altas, cambios, bajas e importaciones, los agregados coinciden."""
+    gestor = GestorClientes(ruta_csv="datos/c.csv", almacen=almacen, verificar=True)
+
+    def verificar():
+        # Con verificar=True, generar_reporte contrasta con un recálculo
+        assert gestor.verificar_estadisticas()
+        gestor.generar_reporte()
+        return gestor.recalcular_estadisticas()
+
+    gestor.agregar_cliente(
+        ClienteRegular("Ana", "ana@x.cl", "+56912345678", "Calle 1", 500)
+    )
+    gestor.agregar_cliente(
+        ClientePremium("Bea", "bea@x.cl", "+56912345678", "Calle 1", 40, "2024-01-01")
+    )
+    assert verificar()["max_puntos"] == 500
+
+    gestor.importar_desde_csv(escribir_csv("a.csv", filas_de_clientes(60)))
+    gestor.agregar_clientes(
+        [ClienteRegular("Eva", "eva@x.cl", "+56912345678", "Calle 2", 900)]
+    )
+    assert verificar()["total"] == 63
+
+    gestor.actualizar_cliente("ana@x.cl", {"puntos_acumulados": 1000})
+    gestor.actualizar_cliente("bea@x.cl", {"descuento_exclusivo": 5})
+    gestor.actualizar_cliente("c0@ejemplo.cl", {"nombre": "Otro", "email": "o@x.cl"})
+    estadisticas = verificar()
+    assert estadisticas["cliente_max_puntos"] == "Ana"
+    assert estadisticas["max_descuento"] == 15
+
+    gestor.eliminar_cliente("ana@x.cl")
+    gestor.eliminar_cliente("c1@ejemplo.cl")
+    assert verificar()["max_puntos"] == 900
+
+    filas = filas_de_clientes(90)
+    for fila in filas[:30]:
+        if fila[0] == "Regular":
+            fila[5] = 2000
+    gestor.importar_desde_csv(escribir_csv("b.csv", filas), actualizar=True)
+    estadisticas = verificar()
+    assert estadisticas["total"] == 93
+    assert estadisticas["max_puntos"] == 2000
@@ -0,0 +1,173 @@
+"""
+Pruebas de la importación de clientes desde CSV.
+"""
+
+import os
+
+import pytest
+
+from modulos import ClientePremium, ClienteRegular, GestorClientes, gestor_clientes
+from modulos.formato_csv import ENCABEZADOS_CSV
+
+
+def _estado(gestor):
+    """Datos de todos los clientes del gestor, ordenados por email."""
+    return sorted(
+        (cliente.to_dict() for cliente in gestor.listar_clientes()),
+        key=lambda datos: datos["email"],
+    )
+
+
+def _interrumpir(gestor, ruta, bloques):
+    """Importa los primeros bloques de un archivo y corta la importación."""
+    avances = gestor.importar_por_bloques(ruta, tamano_bloque=10, reanudar=True)
+    for avance in avances:
+        if avance["bloque"] == bloques:
+            break
+    avances.close()
+
+
+def test_reanudar_continua_en_el_mismo_gestor(escribir_csv, filas_de_clientes):
+    """Al reanudar con los bloques confirmados cargados, se sigue desde ahí."""
+    ruta = escribir_csv("clientes.csv", filas_de_clientes(50))
+    gestor = GestorClientes()
+    _interrumpir(gestor, ruta, bloques=2)
+    assert gestor.contar_clientes() == 20
+
+    avances = list(gestor.importar_por_bloques(ruta, tamano_bloque=10, reanudar=True))
+
+    assert [avance["bloque"] for avance in avances] == [3, 4, 5]
+    assert avances[-1]["estadisticas"]["exitosos"] == 50
+    assert gestor.contar_clientes() == 50
+
+
+@pytest.mark.parametrize("intervalo, bloques", [(0, [3, 4, 5]), (3600, [2, 3, 4, 5])])
+def test_reanudar_en_gestor_nuevo(
+    escribir_csv, filas_de_clientes, monkeypatch, intervalo, bloques
+):
+    """Un gestor nuevo recupera los clientes guardados y sigue desde ahí."""
+    # Sin intervalo el estado se guarda en cada bloque; con uno de una hora,
+    # sólo en el primero
+    monkeypatch.setattr(gestor_clientes, "INTERVALO_REANUDACION", intervalo)
+    monkeypatch.setattr(gestor_clientes, "FACTOR_INTERVALO_REANUDACION", 0)
+    ruta = escribir_csv("clientes.csv", filas_de_clientes(50))
+    _interrumpir(GestorClientes(), ruta, bloques=2)
+
+    gestor = GestorClientes()
+    avances = list(gestor.importar_por_bloques(ruta, tamano_bloque=10, reanudar=True))
+
+    assert [avance["bloque"] for avance in avances] == bloques
+    assert avances[-1]["estadisticas"] == {
+        "total": 50,
+        "exitosos": 50,
+        "errores": 0,
+        "duplicados": 0,
+    }
+    completo = GestorClientes()
+    completo.importar_desde_csv(ruta)
+    assert _estado(gestor) == _estado(completo)
+    assert gestor.buscar_por_rut("76.086.428-5")
+    assert not os.path.exists(ruta + ".progreso")
+    assert not os.path.exists(ruta + ".progreso.snapshot")
+
+
+def test_reanudar_en_gestor_distinto_importa_desde_el_inicio(
+    escribir_csv, filas_de_clientes
+):
+    """Si el gestor no está como al empezar, no se salta ninguna fila."""
+    ruta = escribir_csv("clientes.csv", filas_de_clientes(50))
+    _interrumpir(GestorClientes(), ruta, bloques=2)
+
+    gestor = GestorClientes()
+    gestor.agregar_cliente(
+        ClienteRegular("Otro", "otro@ejemplo.cl", "+56912345678", "Calle 1", 0)
+    )
+    estadisticas = gestor.importar_desde_csv(ruta, tamano_bloque=10, reanudar=True)
+
+    assert estadisticas["total"] == 50
+    assert estadisticas["exitosos"] == 50
+    assert gestor.contar_clientes() == 51
+
+
+def test_paralelo_con_campos_de_varias_lineas(escribir_csv, filas_de_clientes):
+    """Los saltos de línea entre comillas no cortan los rangos de los procesos."""
+    filas = filas_de_clientes(400)
+    for fila in filas:
+        fila[4] += '\nDepto "B"\n'
+    ruta = escribir_csv("clientes.csv", filas)
+
+    secuencial = GestorClientes()
+    paralelo = GestorClientes()
+    esperadas = secuencial.importar_desde_csv(ruta)
+    obtenidas = paralelo.importar_en_paralelo(ruta, procesos=2)
+
+    assert (
+        obtenidas
+        == esperadas
+        == {
+            "total": 400,
+            "exitosos": 400,
+            "errores": 0,
+            "duplicados": 0,
+        }
+    )
+    assert paralelo.buscar_cliente("c7@ejemplo.cl").direccion == 'Calle 7\nDepto "B"'
+
+
+@pytest.mark.parametrize("sin_columna", [True, False])
+def test_actualizar_premium_sin_fecha_no_la_cambia(escribir_csv, sin_columna):
+    """Una fila Premium sin fecha (columna ausente o vacía) conserva la fecha."""
+    gestor = GestorClientes()
+    gestor.agregar_cliente(
+        ClientePremium("Bea", "bea@x.cl", "+56912345678", "Calle 1", 15, "2020-05-05")
+    )
+    fila = ["Premium", "Bea", "bea@x.cl", "+56912345678", "Calle 1", "15", ""]
+    encabezados = ENCABEZADOS_CSV[:7]
+    if sin_columna:
+        encabezados = ENCABEZADOS_CSV[:6]
+        fila = fila[:6]
+    ruta = escribir_csv("clientes.csv", [fila], encabezados)
+
+    estadisticas = gestor.importar_desde_csv(ruta, actualizar=True)
+    assert estadisticas["sin_cambios"] == 1
+    assert estadisticas["actualizados"] == 0
+
+    fila[5] = "30"
+    ruta = escribir_csv("clientes.csv", [fila, fila], encabezados)
+    estadisticas = gestor.importar_desde_csv(ruta, actualizar=True)
+    assert estadisticas["actualizados"] == 1
+    assert estadisticas["sin_cambios"] == 1
+
+    cliente = gestor.buscar_cliente("bea@x.cl")
+    assert cliente.descuento_exclusivo == 30
+    assert cliente.fecha_membresia == "2020-05-05"
+
+
+def test_importar_premium_con_fecha_vacia_es_un_error(escribir_csv):
+    """Sin actualizar, una fecha vacía sigue fallando la validación."""
+    filas = [
+        ["Premium", "Bea", "bea@x.cl", "+56912345678", "Calle 1", "15", ""],
+        ["Premium", "Eva", "eva@x.cl", "+56912345678", "Calle 1", "15", "2020-05-05"],
+    ]
+    gestor = GestorClientes()
+    estadisticas = gestor.importar_desde_csv(escribir_csv("clientes.csv", filas))
+
+    assert (estadisticas["exitosos"], estadisticas["errores"]) == (1, 1)
+    assert gestor.buscar_cliente("bea@x.cl") is None
+
+
+def test_actualizar_en_el_mismo_bloque_conserva_la_fecha(escribir_csv):
+    """Una fila repetida sin fecha mantiene la fecha de la fila anterior."""
+    filas = [
+        ["Premium", "Bea", "bea@x.cl", "+56912345678", "Calle 1", "15", "2020-05-05"],
+        ["Premium", "Bea", "bea@x.cl", "+56912345678", "Calle 1", "30", ""],
+    ]
+    gestor = GestorClientes()
+    estadisticas = gestor.importar_desde_csv(
+        escribir_csv("clientes.csv", filas), actualizar=True
+    )
+
+    assert estadisticas["exitosos"] == 1
+    assert estadisticas["actualizados"] == 1
+    cliente = gestor.buscar_cliente("bea@x.cl")
+    assert (cliente.descuento_exclusivo, cliente.fecha_membresia) == (30, "2020-05-05")
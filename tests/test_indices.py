@@ -0,0 +1,80 @@
+"""
+Pruebas de los índices en memoria del gestor.
+"""
+
+import random
+
+from modulos import GestorClientes
+from modulos.indice_ordenado import IndiceOrdenado
+
+
+def _mayores_esperados(valores, k):
+    """Las K claves de mayor valor (ante empates, la menor clave primero)."""
+    orden = sorted(valores.items(), key=lambda par: (-par[1], par[0]))
+    return orden[:k]
+
+
+def test_indice_ordenado_con_lotes_diferidos():
+    """Mezclar lotes diferidos con altas, bajas y cambios da el mismo orden."""
+    aleatorio = random.Random(3)
+    indice = IndiceOrdenado()
+    valores = {}
+    siguiente = 0
+
+    for _ in range(300):
+        operacion = aleatorio.random()
+        if operacion < 0.3:
+            pares = [(siguiente + i, aleatorio.randint(0, 20)) for i in range(25)]
+            siguiente += len(pares)
+            indice.agregar_varios(pares)
+            valores.update(pares)
+        elif operacion < 0.5:
+            valores[siguiente] = aleatorio.randint(0, 20)
+            indice.agregar(siguiente, valores[siguiente])
+            siguiente += 1
+        elif operacion < 0.7 and valores:
+            clave = aleatorio.choice(list(valores))
+            indice.eliminar(clave)
+            del valores[clave]
+        elif operacion < 0.85 and valores:
+            clave = aleatorio.choice(list(valores))
+            valores[clave] = aleatorio.randint(0, 20)
+            indice.actualizar(clave, valores[clave])
+        else:
+            assert indice.mayores(10) == _mayores_esperados(valores, 10)
+
+    assert len(indice) == len(valores)
+    assert indice.mayores(len(valores)) == _mayores_esperados(valores, len(valores))
+    assert indice.maximo() == _mayores_esperados(valores, 1)[0]
+
+
+def test_top_k_tras_importar_por_bloques(escribir_csv, filas_de_clientes):
+    """El ranking tras una importación en varios bloques es el esperado."""
+    ruta = escribir_csv("clientes.csv", filas_de_clientes(300))
+    gestor = GestorClientes()
+    gestor.importar_desde_csv(ruta, tamano_bloque=7)
+
+    puntos = [
+        cliente.puntos_acumulados for cliente in gestor.top_k("puntos_acumulados", 5)
+    ]
+    assert puntos == [297, 294, 291, 288, 285]
+    assert len(list(gestor.buscar_clientes("Cliente 29"))) == 11
+    assert gestor.verificar_estadisticas()
+
+
+def test_agregar_varios_da_el_mismo_orden_que_agregar():
+    """Un lote y las altas de a una ordenan igual, también ante empates."""
+    aleatorio = random.Random(5)
+    pares = [(clave, aleatorio.randint(0, 5)) for clave in range(200)]
+    aleatorio.shuffle(pares)
+
+    en_lote = IndiceOrdenado()
+    en_lote.agregar_varios(pares[:120])
+    en_lote.agregar_varios(pares[120:])
+    de_a_uno = IndiceOrdenado()
+    for clave, valor in pares:
+        de_a_uno.agregar(clave, valor)
+
+    orden = de_a_uno.mayores(len(pares))
+    assert en_lote.mayores(len(pares)) == orden == _mayores_esperados(dict(pares), 200)
+    assert en_lote.maximo() == de_a_uno.maximo()
@@ -0,0 +1,99 @@
+"""
+Pruebas de la persistencia: importación incremental, exportación de
+cambios con su compactación, y snapshots binarios.
+"""
+
+import os
+
+import pytest
+
+from modulos import ClienteRegular, DatosInvalidosError, GestorClientes
+
+
+def _estado(gestor):
+    """Datos de todos los clientes del gestor, ordenados por email."""
+    return sorted(
+        (cliente.to_dict() for cliente in gestor.listar_clientes()),
+        key=lambda datos: datos["email"],
+    )
+
+
+def test_importacion_incremental(escribir_csv, filas_de_clientes):
+    """Se omite un archivo sin cambios; de uno ampliado, solo las filas nuevas."""
+    ruta = escribir_csv("clientes.csv", filas_de_clientes(30))
+    gestor = GestorClientes()
+
+    assert gestor.importar_desde_csv(ruta, incremental=True)["exitosos"] == 30
+    assert gestor.importar_desde_csv(ruta, incremental=True)["total"] == 0
+
+    with open(ruta, "a", encoding="utf-8", newline="") as archivo:
+        for fila in filas_de_clientes(10, inicio=30):
+            archivo.write(",".join(map(str, fila)) + "\r\n")
+    estadisticas = gestor.importar_desde_csv(ruta, incremental=True)
+
+    assert estadisticas["total"] == 10
+    assert estadisticas["exitosos"] == 10
+    assert gestor.contar_clientes() == 40
+
+
+def test_exportar_y_compactar_cambios(escribir_csv, filas_de_clientes):
+    """Compactar los cambios deja el CSV igual al estado del gestor."""
+    gestor = GestorClientes(ruta_csv="datos/clientes.csv")
+    gestor.importar_desde_csv(escribir_csv("entrada.csv", filas_de_clientes(12)))
+    assert gestor.exportar_cambios()["completa"] is True
+
+    gestor.actualizar_cliente("c0@ejemplo.cl", {"puntos_acumulados": 99})
+    gestor.actualizar_cliente("c1@ejemplo.cl", {"email": "nuevo@ejemplo.cl"})
+    gestor.eliminar_cliente("c2@ejemplo.cl")
+    gestor.agregar_cliente(
+        ClienteRegular("Otro", "otro@ejemplo.cl", "+56912345678", "Calle 9", 1)
+    )
+    assert gestor.exportar_cambios() == {
+        "modificados": 3,
+        "eliminados": 2,
+        "completa": False,
+    }
+    assert gestor.cambios_pendientes() == {"modificados": 0, "eliminados": 0}
+
+    assert gestor.compactar_cambios() == 5
+    assert not os.path.exists("datos/clientes.csv.cambios")
+
+    copia = GestorClientes(ruta_csv="datos/otro.csv")
+    estadisticas = copia.importar_desde_csv("datos/clientes.csv", confiable=True)
+    assert estadisticas["exitosos"] == 12
+    assert _estado(copia) == _estado(gestor)
+
+
+def test_snapshot_ida_y_vuelta(escribir_csv, filas_de_clientes):
+    """Un snapshot cargado en un gestor vacío reproduce los mismos clientes."""
+    gestor = GestorClientes(ruta_csv="datos/clientes.csv")
+    gestor.importar_desde_csv(escribir_csv("entrada.csv", filas_de_clientes(30)))
+    assert gestor.guardar_snapshot() == 30
+
+    copia = GestorClientes(ruta_csv="datos/clientes.csv")
+    assert copia.cargar_snapshot() == 30
+    assert _estado(copia) == _estado(gestor)
+    assert copia.buscar_por_rut("76.086.428-5")
+
+
+@pytest.mark.parametrize("dano", ["byte", "truncado"])
+def test_snapshot_alterado(escribir_csv, filas_de_clientes, dano):
+    """Un snapshot modificado o incompleto se rechaza sin cargar clientes."""
+    gestor = GestorClientes(ruta_csv="datos/clientes.csv")
+    gestor.importar_desde_csv(escribir_csv("entrada.csv", filas_de_clientes(30)))
+    gestor.guardar_snapshot()
+
+    ruta = "datos/clientes.snapshot"
+    with open(ruta, "rb") as archivo:
+        contenido = bytearray(archivo.read())
+    if dano == "byte":
+        contenido[len(contenido) // 2] ^= 0x01
+    else:
+        del contenido[-10:]
+    with open(ruta, "wb") as archivo:
+        archivo.write(contenido)
+
+    copia = GestorClientes(ruta_csv="datos/clientes.csv")
+    with pytest.raises(DatosInvalidosError):
+        copia.cargar_snapshot()
+    assert copia.contar_clientes() == 0
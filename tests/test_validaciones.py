@@ -0,0 +1,180 @@
+"""
+Pruebas de las validaciones: los caminos por lote, con NumPy y con caché
+deben dar el mismo resultado que las validaciones individuales.
+"""
+
+import random
+
+import pytest
+
+from modulos import validaciones
+from modulos.excepciones import (
+    EmailInvalidoError,
+    RutInvalidoError,
+    TelefonoInvalidoError,
+)
+from modulos.validaciones import (
+    ERROR_DIGITO_VERIFICADOR,
+    ERROR_FORMATO,
+    VALIDO,
+    activar_cache_validaciones,
+    calcular_digito_verificador,
+    calcular_digitos_verificadores,
+    desactivar_cache_validaciones,
+    estadisticas_cache_validaciones,
+    normalizar_ruts,
+    validar_email,
+    validar_emails,
+    validar_rut,
+    validar_ruts,
+    validar_telefono,
+    validar_telefonos,
+)
+
+EMAILS = [
+    "ana@ejemplo.cl",
+    "a.b+c_d%e-f@sub.dominio.com",
+    "sin-arroba.cl",
+    "ana@dominio",
+    "ana@dominio.c",
+    "@dominio.cl",
+    "ana @ejemplo.cl",
+    "",
+]
+
+TELEFONOS = [
+    "+56912345678",
+    "+56 9 1234 5678",
+    "56912345678",
+    "0912345678",
+    "912345678",
+    "+5691234567",
+    "+56812345678",
+    "12345",
+    "+56-9-1234-5678",
+    "",
+]
+
+RUTS = [
+    "12.345.678-5",
+    "12345678-5",
+    "76.086.428-5",
+    "11.111.111-1",
+    "1.000.005-K",
+    "1.000.005-k",
+    "12.345.678-9",
+    "76086428-0",
+    "12345678",
+    "123456-7",
+    "123456789-0",
+    "12.345.678-X",
+    "",
+]
+
+
+# Errores que lanzan las validaciones individuales
+ERRORES = (EmailInvalidoError, TelefonoInvalidoError, RutInvalidoError)
+
+
+@pytest.fixture(autouse=True)
+def sin_cache():
+    """Cada prueba empieza y termina con la caché desactivada."""
+    desactivar_cache_validaciones()
+    yield
+    desactivar_cache_validaciones()
+
+
+def _codigo_individual(validador, valor):
+    """Código por lote equivalente al resultado de una validación individual."""
+    try:
+        validador(valor)
+    except RutInvalidoError as e:
+        if "dígito verificador" in str(e):
+            return ERROR_DIGITO_VERIFICADOR
+        return ERROR_FORMATO
+    except ERRORES:
+        return ERROR_FORMATO
+    return VALIDO
+
+
+def _error_individual(validador, valor):
+    """Tipo y mensaje del error de una validación individual (None si pasa)."""
+    try:
+        validador(valor)
+    except ERRORES as e:
+        return type(e), str(e)
+    return None
+
+
+@pytest.mark.parametrize(
+    "por_lote, individual, valores",
+    [
+        (validar_emails, validar_email, EMAILS),
+        (validar_telefonos, validar_telefono, TELEFONOS),
+        (validar_ruts, validar_rut, RUTS),
+    ],
+)
+def test_lote_igual_a_individual(por_lote, individual, valores):
+    """Cada código del lote coincide con la validación individual del valor."""
+    assert por_lote(valores) == [_codigo_individual(individual, v) for v in valores]
+
+
+def test_lote_con_valores_que_no_son_texto():
+    """Por lote, un valor que no es texto es un error de formato."""
+    assert validar_emails([None, 5]) == [ERROR_FORMATO] * 2
+    assert validar_telefonos([None]) == [ERROR_FORMATO]
+    assert validar_ruts([None]) == [ERROR_FORMATO]
+
+
+def test_normalizar_ruts():
+    """Los RUT se normalizan sin puntos ni espacios y en mayúsculas."""
+    normalizados, codigos = normalizar_ruts(["1.000.005-k", " 12.345.678-5"])
+    assert normalizados == ["1000005-K", "12345678-5"]
+    assert codigos == [VALIDO, VALIDO]
+
+
+@pytest.mark.parametrize("con_numpy", [True, False])
+def test_digitos_verificadores_por_lote(monkeypatch, con_numpy):
+    """Con y sin NumPy, el lote da los mismos dígitos que el cálculo individual."""
+    if con_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(validaciones, "np", None)
+
+    aleatorio = random.Random(11)
+    numeros = [1, 9, 10, 1000005, 10000000, 99999999]
+    numeros += [aleatorio.randint(1000000, 99999999) for _ in range(2000)]
+
+    esperados = [calcular_digito_verificador(numero) for numero in numeros]
+    assert calcular_digitos_verificadores(numeros) == esperados
+    assert calcular_digitos_verificadores([]) == []
+
+    # Los RUT válidos tienen 7 u 8 dígitos antes del verificador
+    ruts = [
+        f"{numero}-{digito}"
+        for numero, digito in zip(numeros, esperados)
+        if numero >= 1000000
+    ]
+    assert validar_ruts(ruts) == [VALIDO] * len(ruts)
+
+
+@pytest.mark.parametrize(
+    "validador, valores",
+    [
+        (validar_email, EMAILS),
+        (validar_telefono, TELEFONOS),
+        (validar_rut, RUTS),
+    ],
+)
+def test_cache_igual_a_sin_cache(validador, valores):
+    """Con caché, los aciertos repiten el resultado o el error exacto."""
+    esperados = [_error_individual(validador, valor) for valor in valores]
+
+    activar_cache_validaciones(tamano_maximo=64)
+    primera = [_error_individual(validador, valor) for valor in valores]
+    segunda = [_error_individual(validador, valor) for valor in valores]
+
+    assert primera == segunda == esperados
+    estadisticas = estadisticas_cache_validaciones()
+    assert estadisticas["fallos"] == len(set(valores))
+    assert estadisticas["aciertos"] == 2 * len(valores) - len(set(valores))